@@ -0,0 +1,170 @@
+"""Share one NewMangaApi between many threads and check every answer.
+
+Each thread paginates through the endpoints with its own query, page size
+and options. A local mock backend echoes the requested parameters into the
+returned items, so any request built from another thread's state shows up
+as a mismatch. Run from the repository root::
+
+    python -m benchmarks.concurrency [threads] [rounds]
+
+The exit status is 1 if any mismatch was found.
+"""
+
+import copy
+import json
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from newmanga import NewMangaApi, constants, queries_data
+from newmanga.api.manga import Manga
+from newmanga.typing.filters import CatalogueFilter
+
+from .payloads import catalogue_document, project
+
+PAGES = 5
+
+
+def _echo(label: str, page: int, size: int) -> list[str]:
+    return [f"{label}|{page}|{item}" for item in range(size)]
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    # Let the other threads run between building and answering a request
+    time.sleep(random.random() / 1000)
+    url = str(request.url)
+    params = request.url.params
+
+    if url == constants.catalogue:
+        body = json.loads(request.content)
+        page, size = body["pagination"]["page"], body["pagination"]["size"]
+        label = "{}/{}/{}".format(
+            body["query"], body["sort"]["kind"], body["filter"]["type"]["allowed"]
+        )
+        hits = []
+        for index, title in enumerate(
+            _echo(label, page, size) if page <= PAGES else []
+        ):
+            hits.append({"document": dict(catalogue_document(index), title_en=title)})
+        result = {"page": page, "found": PAGES * size, "out_of": 0, "hits": hits}
+        return httpx.Response(200, json={"result": result})
+
+    if request.url.path.endswith(("/popular", "/updates")):
+        page, size = int(params["page"]), int(params["size"])
+        label = params.get("scale", "updates")
+        items = []
+        for index, title in enumerate(
+            _echo(label, page, size) if page <= PAGES else []
+        ):
+            data = project(index)
+            data["title"] = {"ru": title, "en": title, "original": title}
+            items.append(data)
+        return httpx.Response(200, json={"count": PAGES * size, "items": items})
+
+    if request.url.path.endswith("/comments"):
+        return httpx.Response(200, json=[{"sort_by": params["sort_by"]}])
+
+    if request.url.path.endswith("/chapters"):
+        page, size = int(params["page"]), int(params["size"])
+        label = "{}:{}".format(request.url.path.split("/")[-2], params["reverse"])
+        return httpx.Response(200, json={"count": 0, "items": _echo(label, page, size)})
+
+    return httpx.Response(404)
+
+
+def check(pages, expected, size: int, first: int = 1) -> list[str]:
+    """
+    Return the mismatches between the pages and the expected titles.
+    """
+    errors = []
+    for number, page in enumerate(pages, first):
+        titles = [manga.title_en for manga in page.mangas]
+        if titles != _echo(expected, number, size):
+            errors.append(f"page {number} of {expected}: {titles[:1]}")
+    return errors
+
+
+def scenario(api: NewMangaApi, worker: int, rng: random.Random) -> list[str]:
+    """
+    Run one random sequence of calls and return the mismatches.
+    """
+    size = rng.randint(1, 6)
+    first = rng.randint(1, 3)
+    kind = rng.choice(["catalogue", "popular", "updates", "manga"])
+
+    if kind == "catalogue":
+        query = f"query{worker}"
+        sort = rng.choice(["RATING", "VIEWS"])
+        types = rng.choice([[], ["MANHWA"], ["MANGA", "OEL"]])
+        expected = f"{query}/{sort}/{types}"
+        options = dict(
+            filter=CatalogueFilter(types=types), sort=sort, prefetch=rng.choice([0, 2])
+        )
+        if rng.random() < 0.5:
+            options["concurrency"] = 3
+        pages = api.get_catalogue.next_page(query, first, size, **options)
+        return check(pages, expected, size, first)
+
+    if kind == "popular":
+        scale = rng.choice(["day", "week", "month"])
+        pages = api.get_popular.next_page(first, size, scale)
+        return check(pages, scale, size, first)
+
+    if kind == "updates":
+        pages = api.get_updates.next_page(first, size, prefetch=rng.choice([0, 1]))
+        return check(pages, "updates", size, first)
+
+    manga = Manga(_client=api.client, slug=f"manga-{worker}", id=worker)
+    errors = []
+    sort_by = rng.choice(["new", "old", "best"])
+    if manga.get_comments(sort_by, raw=True) != [{"sort_by": sort_by}]:
+        errors.append(f"comments of {worker} not sorted by {sort_by}")
+    reverse = rng.choice([True, False])
+    items = manga.get_chapters(first, size, reverse, raw=True)["items"]
+    if items != _echo(f"{worker}:{str(reverse).lower()}", first, size):
+        errors.append(f"chapters of {worker}: {items[:1]}")
+    return errors
+
+
+def _queries() -> dict:
+    return {
+        name: value
+        for name, value in vars(queries_data).items()
+        if not name.startswith("_")
+    }
+
+
+def main(threads: int = 16, rounds: int = 200) -> int:
+    before = copy.deepcopy(_queries())
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    api = NewMangaApi(client=client)
+
+    def worker(number: int) -> list[str]:
+        rng = random.Random(number)
+        errors = []
+        for _ in range(rounds):
+            errors += scenario(api, number, rng)
+        return errors
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        errors = [
+            error for found in executor.map(worker, range(threads)) for error in found
+        ]
+    seconds = time.perf_counter() - start
+
+    if _queries() != before:
+        errors.append("queries_data was modified")
+
+    print(f"{threads} threads x {rounds} scenarios in {seconds:.1f} s")
+    for error in errors[:20]:
+        print(error)
+    print(f"{len(errors)} mismatches")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,61 @@
+"""Compare the per-field MangaFormatter path with convert_manga, which picks
+the straight-line converter for the shape of the payload once and builds the
+fields of an eager Manga in a single call.
+
+Run from the repository root::
+
+    python -m benchmarks.converters [count]
+"""
+
+import sys
+import timeit
+
+from newmanga.formatters.manga import MangaFormatter, convert_manga
+
+from .payloads import catalogue_document, project
+
+
+def throughput(convert, payloads: list, repeat: int = 5) -> float:
+    """
+    Return the number of payloads converted per second.
+
+    Parameters
+    ----------
+    convert : Callable[[dict], Any]
+        The conversion to measure.
+    payloads : list
+        The raw payloads to convert.
+    repeat : int, optional
+        The number of runs, the fastest one is kept. Defaults to 5.
+
+    Returns
+    -------
+    float
+        The number of converted payloads per second.
+    """
+    seconds = min(
+        timeit.repeat(
+            lambda: [convert(payload) for payload in payloads],
+            number=1,
+            repeat=repeat,
+        )
+    )
+    return len(payloads) / seconds
+
+
+def main(count: int = 2000) -> None:
+    shapes = {
+        "catalogue document": [catalogue_document(index) for index in range(count)],
+        "v2 project": [project(index) for index in range(count)],
+    }
+    for shape, payloads in shapes.items():
+        before = throughput(lambda data: MangaFormatter(data).get_vars(), payloads)
+        after = throughput(convert_manga, payloads)
+        print(
+            f"{shape:<20} MangaFormatter {before:>9.0f}/s  "
+            f"converter {after:>9.0f}/s  x{after / before:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,237 @@
+"""Measure the end-to-end throughput of the paginated endpoints offline.
+
+The requests of every scenario are recorded once to a cassette, then each
+scenario is replayed through the full client stack (retries, decoding and
+formatting) with a simulated network latency and bandwidth. By default the
+cassette is recorded from a local backend serving `benchmarks/fixtures`.
+Run from the repository root::
+
+    python -m benchmarks.end_to_end                          # fixtures, no delay
+    python -m benchmarks.end_to_end --latency 0.05 --bandwidth 2e6
+    python -m benchmarks.end_to_end --cassette live.json --record  # live API
+    python -m benchmarks.end_to_end --cassette live.json --latency 0.05
+
+An existing cassette is replayed as is, so runs on different machines or
+branches send the same bytes through the client.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from itertools import islice
+from typing import Callable, Optional
+
+import httpx
+
+from newmanga import NewMangaApi, constants
+from newmanga.cassette import Cassette, CassetteTransport
+
+from .formatters import load
+
+Scenario = Callable[[NewMangaApi, int], tuple[int, int]]
+
+
+def fixture_handler(pages: int) -> Callable[[httpx.Request], httpx.Response]:
+    """
+    Build a backend serving the fixtures as the given number of pages.
+
+    Parameters
+    ----------
+    pages : int
+        The number of non-empty pages of the catalogue and popular lists.
+
+    Returns
+    -------
+    Callable[[httpx.Request], httpx.Response]
+        The handler of an `httpx.MockTransport`.
+    """
+    catalogue = load("catalogue")
+    popular = load("popular")
+    project = load("project")
+    chapters = load("chapters")
+    size = len(catalogue["result"]["hits"])
+    catalogue["result"]["found"] = pages * size
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url) == constants.catalogue:
+            number = json.loads(request.content)["pagination"]["page"]
+            result = dict(catalogue["result"], page=number)
+            if number > pages:
+                result["hits"] = []
+            return httpx.Response(200, json={"result": result})
+        if str(request.url.copy_with(query=None)) == constants.popular:
+            if int(request.url.params["page"]) > pages:
+                return httpx.Response(200, json={"count": 0, "items": []})
+            return httpx.Response(200, json=popular)
+        if request.url.path.endswith("/chapters"):
+            return httpx.Response(200, json=chapters)
+        if request.url.path.startswith("/v2/projects/"):
+            return httpx.Response(200, json=project)
+        return httpx.Response(404)
+
+    return handler
+
+
+def _count(responses) -> tuple[int, int]:
+    pages = items = 0
+    for response in responses:
+        pages += 1
+        items += len(response.mangas)
+    return pages, items
+
+
+def _chapters(api: NewMangaApi, pages: int) -> tuple[int, int]:
+    slug = next(api.get_popular.next_page(size=1, raw=True))["items"][0]["slug"]
+    manga = api.get_manga(slug)
+    items = 0
+    for page in range(1, pages + 1):
+        items += len(manga.get_chapters(page, size=100).chapters)
+    return pages, items
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "Catalogue.next_page": lambda api, pages: _count(
+        islice(api.get_catalogue.next_page(), pages)
+    ),
+    "Catalogue.next_page prefetch=2": lambda api, pages: _count(
+        islice(api.get_catalogue.next_page(prefetch=2), pages)
+    ),
+    "Popular.next_page": lambda api, pages: _count(
+        islice(api.get_popular.next_page(), pages)
+    ),
+    "Popular.next_page prefetch=2": lambda api, pages: _count(
+        islice(api.get_popular.next_page(prefetch=2), pages)
+    ),
+    "Manga.get_chapters": _chapters,
+}
+
+
+def record(
+    cassette: Cassette, pages: int, transport: Optional[httpx.BaseTransport]
+) -> None:
+    """
+    Run every scenario once, recording its requests.
+
+    Requests already on the cassette are replayed instead of sent again.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        The cassette to record to, saved at the end.
+    pages : int
+        The number of pages fetched by every scenario.
+    transport : Optional[httpx.BaseTransport]
+        The transport sending the requests, None for the live API.
+    """
+    recorder = CassetteTransport(cassette, transport, mode="once")
+    with NewMangaApi(transport=recorder) as api:
+        for scenario in SCENARIOS.values():
+            scenario(api, pages)
+    cassette.save()
+
+
+def replay(
+    cassette: Cassette,
+    pages: int,
+    latency: float = 0.0,
+    bandwidth: Optional[float] = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Replay every scenario and measure its throughput.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        The recorded requests of the scenarios.
+    pages : int
+        The number of pages fetched by every scenario.
+    latency : float, optional
+        Seconds waited before every response. Defaults to 0.
+    bandwidth : Optional[float], optional
+        Bytes per second the bodies are delivered at. Defaults to None (no
+        limit).
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        The pages, items, seconds, pages per second and items per second of
+        every scenario, by name.
+    """
+    results = {}
+    for name, scenario in SCENARIOS.items():
+        cassette.rewind()
+        transport = CassetteTransport(cassette, latency=latency, bandwidth=bandwidth)
+        with NewMangaApi(transport=transport) as api:
+            start = time.perf_counter()
+            fetched, items = scenario(api, pages)
+            seconds = time.perf_counter() - start
+        results[name] = {
+            "pages": fetched,
+            "items": items,
+            "seconds": seconds,
+            "pages_per_second": fetched / seconds,
+            "items_per_second": items / seconds,
+        }
+    return results
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.end_to_end")
+    parser.add_argument(
+        "--cassette",
+        metavar="PATH",
+        help="the cassette to replay, recorded first if missing",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="record the cassette from the live API instead of the fixtures",
+    )
+    parser.add_argument(
+        "--pages", type=int, default=20, help="pages per scenario (default: 20)"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds before every response (default: 0)",
+    )
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        default=None,
+        help="bytes per second of the bodies (default: no limit)",
+    )
+    options = parser.parse_args(argv)
+    if options.record and not options.cassette:
+        parser.error("--record needs --cassette")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = options.cassette or os.path.join(directory, "cassette.json")
+        cassette = Cassette(path)
+        if options.record:
+            record(cassette, options.pages, None)
+        elif not len(cassette):
+            mock = httpx.MockTransport(fixture_handler(options.pages))
+            record(cassette, options.pages, mock)
+        results = replay(cassette, options.pages, options.latency, options.bandwidth)
+
+    print(f"{'scenario':<32} {'pages':>6} {'seconds':>8} {'pages/s':>9} {'items/s':>9}")
+    for name, result in results.items():
+        print(
+            "{:<32} {:>6} {:>8.3f} {:>9.1f} {:>9.0f}".format(
+                name,
+                result["pages"],
+                result["seconds"],
+                result["pages_per_second"],
+                result["items_per_second"],
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,417 @@
+"""Measure the throughput and allocations of every formatter.
+
+The payloads are the recorded responses in `benchmarks/fixtures`, one per
+endpoint shape, so the suite runs offline. Run from the repository root::
+
+    python -m benchmarks.formatters                       # print the results
+    python -m benchmarks.formatters --save baseline.json  # keep a baseline
+    python -m benchmarks.formatters --compare baseline.json
+    python -m benchmarks.formatters --record              # refresh fixtures
+
+Listings build lazy mangas, so every listing is also measured with all
+the fields of its mangas read, which converts them as eagerly built ones.
+
+With `--compare`, the exit status is 1 if a formatter got slower than the
+tolerance allows, keeps more memory blocks alive per item, or allocates
+more memory at its peak per item than the baseline, so the script can gate
+a change.
+"""
+
+import argparse
+import gc
+import gzip
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+
+from newmanga import NewMangaApi, formatters
+from newmanga.formatters import json_to_object
+from newmanga.formatters.manga import MangaFormatter
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# Allocations are deterministic, allow for small differences between
+# Python versions only.
+ALLOCATION_TOLERANCE = 0.05
+
+Case = tuple[int, Callable[[], Any]]
+
+
+def load(name: str) -> Any:
+    """
+    Return the decoded body of a recorded response.
+
+    Parameters
+    ----------
+    name : str
+        The name of the fixture, e.g. "catalogue".
+
+    Returns
+    -------
+    Any
+        The JSON body.
+    """
+    return json.loads(gzip.decompress((FIXTURES / f"{name}.json.gz").read_bytes()))
+
+
+def save(name: str, data: Any) -> None:
+    """
+    Write the decoded body of a response as a fixture.
+
+    Parameters
+    ----------
+    name : str
+        The name of the fixture.
+    data : Any
+        The JSON body.
+    """
+    content = json.dumps(data, ensure_ascii=False).encode()
+    (FIXTURES / f"{name}.json.gz").write_bytes(gzip.compress(content, mtime=0))
+
+
+def record(api: NewMangaApi) -> None:
+    """
+    Replace the fixtures with responses of the live API.
+
+    Parameters
+    ----------
+    api : NewMangaApi
+        The API to record from.
+    """
+    popular = api.get_popular(raw=True)
+    slug = popular["items"][0]["slug"]
+    manga = api.get_manga(slug)
+    save("catalogue", api.get_catalogue(raw=True))
+    save("popular", popular)
+    save("updates", api.get_updates(size=20, raw=True))
+    save("tags", api.get_tags(raw=True))
+    save("project", api.get_manga(slug, raw=True))
+    save("similar", manga.get_similar(raw=True))
+    save("comments", manga.get_comments(raw=True))
+    save("chapters", manga.get_chapters(size=100, raw=True))
+
+
+def _count_comments(rows: list[dict[str, Any]]) -> int:
+    return sum(1 + _count_comments(row["children"]) for row in rows)
+
+
+def _read_fields(response: Any) -> Any:
+    """
+    Read every field of the mangas of a listing, converting them all.
+    """
+    for manga in response.mangas:
+        for name in json_to_object.MANGA_FIELDS:
+            getattr(manga, name)
+    return response
+
+
+def cases(client: httpx.Client) -> dict[str, Case]:
+    """
+    Return the formatters to measure with the number of items they build.
+
+    Parameters
+    ----------
+    client : httpx.Client
+        The client attached to the mangas.
+
+    Returns
+    -------
+    dict[str, tuple[int, Callable[[], Any]]]
+        The item count and the conversion of every case, by name.
+    """
+    catalogue = load("catalogue")["result"]
+    documents = [hit["document"] for hit in catalogue["hits"]]
+    project = load("project")
+    popular = load("popular")
+    updates = load("updates")
+    similar = load("similar")
+    comments = load("comments")
+    chapters = load("chapters")
+    tags = load("tags")
+    to_manga = json_to_object.json_to_manga
+
+    return {
+        "json_to_manga catalogue": (
+            len(documents),
+            lambda: [to_manga(client, document) for document in documents],
+        ),
+        "json_to_manga catalogue lazy": (
+            len(documents),
+            lambda: [to_manga(client, document, lazy=True) for document in documents],
+        ),
+        "json_to_manga catalogue lazy, all fields": (
+            len(documents),
+            lambda: [
+                [getattr(manga, name) for name in json_to_object.MANGA_FIELDS]
+                for manga in (
+                    to_manga(client, document, lazy=True) for document in documents
+                )
+            ],
+        ),
+        "json_to_manga project": (1, lambda: to_manga(client, project)),
+        "MangaFormatter project": (1, lambda: MangaFormatter(project).get_vars()),
+        "json_to_manga listing": (
+            len(popular["items"]),
+            lambda: [to_manga(client, row) for row in popular["items"]],
+        ),
+        "json_to_comment tree": (
+            _count_comments(comments),
+            lambda: [json_to_object.json_to_comment(row) for row in comments],
+        ),
+        "json_to_chapter": (
+            len(chapters["items"]),
+            lambda: [json_to_object.json_to_chapter(row) for row in chapters["items"]],
+        ),
+        "json_to_tag": (
+            len(tags),
+            lambda: [json_to_object.json_to_tag(row) for row in tags],
+        ),
+        "json_to_catalogue_reponse": (
+            len(documents),
+            lambda: formatters.json_to_catalogue_reponse(client, catalogue),
+        ),
+        "json_to_popular_response": (
+            len(popular["items"]),
+            lambda: formatters.json_to_popular_response(client, popular, 1),
+        ),
+        "json_to_updates_response": (
+            len(updates["items"]),
+            lambda: formatters.json_to_updates_response(client, updates, 1),
+        ),
+        "json_to_similar_response": (
+            len(similar),
+            lambda: formatters.json_to_similar_response(client, similar),
+        ),
+        "json_to_catalogue_reponse, all fields": (
+            len(documents),
+            lambda: _read_fields(
+                formatters.json_to_catalogue_reponse(client, catalogue)
+            ),
+        ),
+        "json_to_popular_response, all fields": (
+            len(popular["items"]),
+            lambda: _read_fields(
+                formatters.json_to_popular_response(client, popular, 1)
+            ),
+        ),
+        "json_to_updates_response, all fields": (
+            len(updates["items"]),
+            lambda: _read_fields(
+                formatters.json_to_updates_response(client, updates, 1)
+            ),
+        ),
+        "json_to_similar_response, all fields": (
+            len(similar),
+            lambda: _read_fields(formatters.json_to_similar_response(client, similar)),
+        ),
+        "json_to_comments_response": (
+            _count_comments(comments),
+            lambda: formatters.json_to_comments_response(comments),
+        ),
+        "json_to_chapters_response": (
+            len(chapters["items"]),
+            lambda: formatters.json_to_chapters_response(chapters),
+        ),
+        "json_to_tags_response": (
+            len(tags),
+            lambda: formatters.json_to_tags_response(tags),
+        ),
+    }
+
+
+def throughput(run: Callable[[], Any], items: int, repeat: int = 3) -> float:
+    """
+    Return the number of items converted per second.
+
+    Parameters
+    ----------
+    run : Callable[[], Any]
+        The conversion to measure.
+    items : int
+        The number of items converted by one run.
+    repeat : int, optional
+        The number of timings, the fastest one is kept. Defaults to 3.
+
+    Returns
+    -------
+    float
+        The number of items per second.
+    """
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number))
+    return items * number / seconds
+
+
+def allocations(run: Callable[[], Any], items: int) -> tuple[float, float, float]:
+    """
+    Return the memory kept alive and the peak memory allocated per item.
+
+    The blocks and bytes still allocated when the conversion returns are
+    those its result keeps alive. The peak also counts the temporary
+    objects freed during the conversion.
+
+    Parameters
+    ----------
+    run : Callable[[], Any]
+        The conversion to measure, already run once so that caches are
+        filled.
+    items : int
+        The number of items converted by one run.
+
+    Returns
+    -------
+    tuple[float, float, float]
+        The number of blocks and of bytes kept alive, and the peak number
+        of bytes allocated, per item.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    result = run()
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    blocks = sum(statistic.count for statistic in snapshot.statistics("filename"))
+    return blocks / items, (current - start) / items, (peak - start) / items
+
+
+def measure(client: httpx.Client) -> dict[str, dict[str, float]]:
+    """
+    Measure every case.
+
+    Parameters
+    ----------
+    client : httpx.Client
+        The client attached to the mangas.
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        The items per second, the blocks and bytes kept alive per item and
+        the peak bytes allocated per item of every case, by name.
+    """
+    results = {}
+    for name, (items, run) in cases(client).items():
+        run()
+        blocks, size, peak = allocations(run, items)
+        results[name] = {
+            "items_per_second": throughput(run, items),
+            "blocks_per_item": blocks,
+            "bytes_per_item": size,
+            "peak_bytes_per_item": peak,
+        }
+    return results
+
+
+def regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Compare results with a baseline.
+
+    Parameters
+    ----------
+    results : dict[str, dict[str, float]]
+        The current results.
+    baseline : dict[str, dict[str, float]]
+        The results to compare with.
+    tolerance : float
+        The accepted slowdown, e.g. 0.25 for 25%.
+
+    Returns
+    -------
+    list[str]
+        A description of every regression.
+    """
+    found = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        speed = result["items_per_second"] / base["items_per_second"]
+        if speed < 1 - tolerance:
+            found.append(f"{name}: {speed:.0%} of the baseline throughput")
+        blocks = base["blocks_per_item"] * (1 + ALLOCATION_TOLERANCE)
+        if result["blocks_per_item"] > blocks:
+            found.append(
+                "{}: {:.1f} blocks per item instead of {:.1f}".format(
+                    name, result["blocks_per_item"], base["blocks_per_item"]
+                )
+            )
+        if "peak_bytes_per_item" not in base:
+            continue
+        peak = base["peak_bytes_per_item"] * (1 + ALLOCATION_TOLERANCE)
+        if result["peak_bytes_per_item"] > peak:
+            found.append(
+                "{}: {:.0f} peak bytes per item instead of {:.0f}".format(
+                    name, result["peak_bytes_per_item"], base["peak_bytes_per_item"]
+                )
+            )
+    return found
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.formatters")
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="fail on regressions against a baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="accepted slowdown with --compare (default: 0.25)",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="replace the fixtures with responses of the live API",
+    )
+    options = parser.parse_args(argv)
+
+    if options.record:
+        with NewMangaApi() as api:
+            record(api)
+
+    results = measure(httpx.Client())
+    baseline = {}
+    if options.compare:
+        baseline = json.loads(Path(options.compare).read_text())
+
+    print(
+        f"{'formatter':<42} {'items/s':>10} {'blocks/item':>12} {'bytes/item':>11} "
+        f"{'peak/item':>10}"
+    )
+    for name, result in results.items():
+        line = "{:<42} {:>10.0f} {:>12.1f} {:>11.0f} {:>10.0f}".format(
+            name,
+            result["items_per_second"],
+            result["blocks_per_item"],
+            result["bytes_per_item"],
+            result["peak_bytes_per_item"],
+        )
+        if name in baseline:
+            speed = result["items_per_second"] / baseline[name]["items_per_second"]
+            line += f"  x{speed:.2f}"
+        print(line)
+
+    if options.save:
+        Path(options.save).write_text(json.dumps(results, indent=2))
+    if options.compare:
+        found = regressions(results, baseline, options.tolerance)
+        for regression in found:
+            print("Regression:", regression)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,267 @@
+"""Drive the pagination loops against the stand-in server under faults.
+
+Every scenario runs its loop to the last page on several threads sharing one
+NewMangaApi, against a `benchmarks.server.StandInServer` injecting the
+requested faults. The pages per second, the latency percentiles of a page
+(retries included) and the failed loops are reported. Run from the
+repository root::
+
+    python -m benchmarks.load
+    python -m benchmarks.load --error-rate 0.05 --burst 4 --latency lognormal:0.05:0.6
+    python -m benchmarks.load --truncate-rate 0.02 --statuses 502 --workers 16
+
+Latency distributions are given as SECONDS, uniform:LOW:HIGH, exp:MEAN,
+lognormal:MEDIAN:SIGMA or pareto:MINIMUM:ALPHA.
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from newmanga import NewMangaApi
+from newmanga.ratelimit import RetryPolicy
+
+from .server import (
+    Dataset,
+    Faults,
+    StandInServer,
+    StandInTransport,
+    latency_distribution,
+)
+
+Scenario = Callable[[NewMangaApi, Dataset, random.Random], Iterator[int]]
+
+
+def _catalogue(api: NewMangaApi, dataset: Dataset, rng: random.Random):
+    for page in api.get_catalogue.next_page():
+        yield len(page.mangas)
+
+
+def _catalogue_concurrent(api: NewMangaApi, dataset: Dataset, rng: random.Random):
+    for page in api.get_catalogue.next_page(concurrency=4):
+        yield len(page.mangas)
+
+
+def _popular(api: NewMangaApi, dataset: Dataset, rng: random.Random):
+    for page in api.get_popular.next_page():
+        yield len(page.mangas)
+
+
+def _updates(api: NewMangaApi, dataset: Dataset, rng: random.Random):
+    for page in api.get_updates.next_page(size=20):
+        yield len(page.mangas)
+
+
+def _chapters(api: NewMangaApi, dataset: Dataset, rng: random.Random):
+    manga = api.get_manga(f"manga-{rng.randint(1, dataset.mangas)}")
+    yield 1
+    page = 1
+    while chapters := manga.get_chapters(page, size=25).chapters:
+        yield len(chapters)
+        page += 1
+
+
+def _manga(api: NewMangaApi, dataset: Dataset, rng: random.Random):
+    manga = api.get_manga(f"manga-{rng.randint(1, dataset.mangas)}")
+    yield 1
+    yield len(manga.get_comments().comments)
+    yield len(manga.get_similar().mangas)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "catalogue": _catalogue,
+    "catalogue concurrency=4": _catalogue_concurrent,
+    "popular": _popular,
+    "updates": _updates,
+    "chapters": _chapters,
+    "manga": _manga,
+}
+
+
+@dataclass()
+class LoadResult:
+    """The outcome of a scenario.
+
+    Attributes
+    ----------
+    seconds : float
+        The wall time of the run.
+    items : int
+        The number of items received.
+    latencies : list[float]
+        The sorted seconds taken by every page, retries included.
+    failures : Counter[str]
+        The number of loops that failed, by exception type.
+    """
+
+    seconds: float = 0.0
+    items: int = 0
+    latencies: list[float] = field(default_factory=list)
+    failures: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def pages(self) -> int:
+        return len(self.latencies)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of sorted values, 0 if empty.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def run(
+    api: NewMangaApi,
+    dataset: Dataset,
+    scenario: Scenario,
+    workers: int,
+    loops: int,
+    seed: int = 0,
+) -> LoadResult:
+    """
+    Run a scenario to completion `loops` times on each of `workers` threads.
+
+    Parameters
+    ----------
+    api : NewMangaApi
+        The API shared by the threads.
+    dataset : Dataset
+        The data of the server, to pick existing mangas.
+    scenario : Scenario
+        The loop to run, yielding the number of items of every page.
+    workers : int
+        The number of threads.
+    loops : int
+        The number of loops run by every thread.
+    seed : int, optional
+        The seed of the mangas picked. Defaults to 0.
+
+    Returns
+    -------
+    LoadResult
+        The pages, items and failures of all the loops.
+    """
+    result = LoadResult()
+    lock = threading.Lock()
+
+    def worker(number: int) -> None:
+        rng = random.Random(seed * 1000 + number)
+        for _ in range(loops):
+            seen: list[float] = []
+            items = 0
+            try:
+                start = time.perf_counter()
+                for count in scenario(api, dataset, rng):
+                    now = time.perf_counter()
+                    seen.append(now - start)
+                    items += count
+                    start = now
+            except Exception as error:
+                with lock:
+                    result.failures[type(error).__name__] += 1
+            with lock:
+                result.latencies.extend(seen)
+                result.items += items
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(worker, range(workers)))
+    result.seconds = time.perf_counter() - start
+    result.latencies.sort()
+    return result
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load")
+    parser.add_argument("--mangas", type=int, default=1000)
+    parser.add_argument("--chapters", type=int, default=100)
+    parser.add_argument("--comments", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--loops", type=int, default=2, help="loops per worker")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="chance to start an error burst"
+    )
+    parser.add_argument("--burst", type=int, default=1, help="errors per burst")
+    parser.add_argument(
+        "--statuses", default="429,502", help="error statuses (default: 429,502)"
+    )
+    parser.add_argument("--retry-after", type=float, default=None)
+    parser.add_argument(
+        "--truncate-rate", type=float, default=0.0, help="chance to cut a body"
+    )
+    parser.add_argument("--latency", default="0", help="server latency distribution")
+    parser.add_argument("--max-retries", type=int, default=RetryPolicy.max_retries)
+    parser.add_argument("--backoff", type=float, default=RetryPolicy.backoff)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="run only this scenario, may be repeated",
+    )
+    options = parser.parse_args(argv)
+
+    dataset = Dataset(
+        mangas=options.mangas, chapters=options.chapters, comments=options.comments
+    )
+    faults = Faults(
+        error_rate=options.error_rate,
+        burst=options.burst,
+        statuses=[int(status) for status in options.statuses.split(",")],
+        retry_after=options.retry_after,
+        truncate_rate=options.truncate_rate,
+        latency=latency_distribution(options.latency),
+        seed=options.seed,
+    )
+    policy = RetryPolicy(max_retries=options.max_retries, backoff=options.backoff)
+
+    print(
+        f"{'scenario':<24} {'pages':>6} {'pages/s':>8} {'p50 ms':>7} "
+        f"{'p95 ms':>7} {'p99 ms':>7} {'max ms':>7}  server responses, failed loops"
+    )
+    with StandInServer(dataset, faults) as server:
+        for name in options.scenario or SCENARIOS:
+            server.stats.clear()
+            transport = StandInTransport(server.address)
+            with NewMangaApi(retry=policy, transport=transport) as api:
+                result = run(
+                    api,
+                    dataset,
+                    SCENARIOS[name],
+                    options.workers,
+                    options.loops,
+                    options.seed,
+                )
+            latencies = result.latencies
+            outcomes = [
+                f"{outcome}:{count}" for outcome, count in sorted(server.stats.items())
+            ]
+            outcomes += [
+                f"{error} x{count}" for error, count in result.failures.items()
+            ]
+            print(
+                "{:<24} {:>6} {:>8.1f} {:>7.1f} {:>7.1f} {:>7.1f} {:>7.1f}  {}".format(
+                    name,
+                    result.pages,
+                    result.pages / result.seconds,
+                    percentile(latencies, 0.5) * 1000,
+                    percentile(latencies, 0.95) * 1000,
+                    percentile(latencies, 0.99) * 1000,
+                    percentile(latencies, 1.0) * 1000,
+                    " ".join(outcomes),
+                )
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""Measure the memory used by the objects the library builds.
+
+Run from the repository root::
+
+    python -m benchmarks.memory [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import httpx
+
+from newmanga.formatters import json_to_object
+from newmanga.interning import InternRegistry, register
+from newmanga.table import MangaTable
+
+from .payloads import catalogue_document, project
+
+
+def measure(build, count: int) -> float:
+    """
+    Return the number of bytes allocated per object kept alive.
+
+    Parameters
+    ----------
+    build : Callable[[int], Any]
+        Builds the object with the given index.
+    count : int
+        The number of objects to build.
+
+    Returns
+    -------
+    float
+        The average number of bytes per object.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(index) for index in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def main(count: int = 5000) -> None:
+    client = httpx.Client()
+    interned = httpx.Client()
+    register(interned, InternRegistry())
+    documents = [catalogue_document(index) for index in range(count)]
+    projects = [project(index) for index in range(count)]
+    table = MangaTable(client)
+
+    cases = {
+        "catalogue Manga": lambda i: json_to_object.json_to_manga(client, documents[i]),
+        "project Manga (with branches)": lambda i: json_to_object.json_to_manga(
+            client, projects[i]
+        ),
+        "project Manga (interned)": lambda i: json_to_object.json_to_manga(
+            interned, projects[i]
+        ),
+        "LazyManga (untouched)": lambda i: json_to_object.json_to_manga(
+            client, documents[i], lazy=True
+        ),
+        "MangaTable row": lambda i: table.append(documents[i]),
+    }
+    for name, build in cases.items():
+        print(f"{name:<32} {measure(build, count):>10.0f} bytes/object")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
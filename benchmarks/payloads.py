@@ -0,0 +1,160 @@
+"""Synthetic API payloads shaped like the responses of the NewManga API."""
+
+from typing import Any
+
+
+def user(index: int) -> dict[str, Any]:
+    return {
+        "id": index,
+        "name": f"user{index}",
+        "is_admin": False,
+        "is_moderator": False,
+        "is_translator": True,
+        "is_active": True,
+        "last_login": "2024-07-01T12:30:00",
+        "is_online": False,
+        "image": {"name": f"user{index}.webp"},
+    }
+
+
+def catalogue_document(index: int) -> dict[str, Any]:
+    return {
+        "id": str(index),
+        "title_ru": f"Манга номер {index}",
+        "title_en": f"Manga number {index}",
+        "title_original": f"漫画 {index}",
+        "image_large": f"{index}.webp",
+        "type": "manhwa",
+        "rating": 4.5,
+        "hearts": index * 3,
+        "views": index * 100,
+        "bookmarks": index * 2,
+        "status": "on_going",
+        "description": "Описание " * 20,
+        "genres": ["Боевик", "Драма", "Фэнтези"],
+        "tags": ["Магия", "Система", "Подземелья", "Умный ГГ"],
+        "released_at": 1600000000 + index,
+        "adult": "13",
+        "tomes": [],
+        "count_chapters": 120,
+        "slug": f"manga-{index}",
+        "original_status": "completed",
+    }
+
+
+def project(index: int) -> dict[str, Any]:
+    def title(ru: str, en: str) -> dict[str, str]:
+        return {"ru": ru, "en": en, "original": en}
+
+    return {
+        "id": index,
+        "title": title(f"Манга номер {index}", f"Manga number {index}"),
+        "image": {"name": f"{index}.webp"},
+        "type": "manga",
+        "rating": 4.1,
+        "hearts": index,
+        "views": index * 10,
+        "bookmarks": index,
+        "status": "completed",
+        "description": "Описание " * 20,
+        "genres": [
+            {"id": genre, "title": title(f"Жанр {genre}", f"Genre {genre}")}
+            for genre in range(1, 4)
+        ],
+        "tags": [
+            {"id": tag, "title": title(f"Тег {tag}", f"Tag {tag}")}
+            for tag in range(1, 6)
+        ],
+        "author": {
+            "id": index % 50,
+            "name": "Author",
+            "description": "",
+            "image": {"name": "author.webp"},
+        },
+        "artist": None,
+        "release_date": "2020-01-02",
+        "adult": "16",
+        "tomes": [1, 2],
+        "count_chapters": 100,
+        "slug": f"manga-{index}",
+        "branches": [
+            {
+                "id": index * 10 + branch,
+                "chapters_total": 100,
+                "likes_total": 3,
+                "is_default": branch == 0,
+                "subscription": None,
+                "translators": [
+                    {
+                        "id": index % 20,
+                        "balance": 0,
+                        "is_team": True,
+                        "is_verified": True,
+                        "user": user(index % 20),
+                        "team": {
+                            "id": index % 20,
+                            "name": f"Team {index % 20}",
+                            "image": {"name": "team.webp"},
+                            "members": [
+                                {
+                                    "id": member,
+                                    "statuses": ["translator"],
+                                    "user": user(member),
+                                }
+                                for member in range(3)
+                            ],
+                        },
+                    }
+                ],
+            }
+            for branch in range(2)
+        ],
+    }
+
+
+def tag(index: int) -> dict[str, Any]:
+    return {
+        "id": index,
+        "title": {
+            "ru": f"Тег {index}",
+            "en": f"Tag {index}",
+            "original": f"Tag {index}",
+        },
+    }
+
+
+def chapter(index: int, project_id: int) -> dict[str, Any]:
+    return {
+        "id": project_id * 10000 + index,
+        "tom": 1 + index // 50,
+        "name": f"Глава {index}" if index % 3 == 0 else None,
+        "number": str(index + 1),
+        "project_id": project_id,
+        "branch_id": project_id * 10,
+        "hearts": index * 7 % 500,
+        "price": None,
+        "translator": f"Team {project_id % 20}",
+        "created_at": "2023-05-01T12:00:00.000000",
+        "pages": 20 + index % 40,
+        "is_bought": None,
+    }
+
+
+def comment(index: int, project_id: int, depth: int = 0) -> dict[str, Any]:
+    return {
+        "id": index,
+        "html": "<p>" + "Комментарий " * (5 + index % 20) + "</p>",
+        "user": user(index % 500),
+        "created_at": "2024-03-01T08:15:00.000000",
+        "children": [
+            comment(index * 2 + child, project_id, depth + 1)
+            for child in range(2 if depth < 2 else 0)
+        ],
+        "likes": index % 200,
+        "dislikes": index % 20,
+        "rating": index % 150,
+        "project_id": project_id,
+        "chapter_id": None,
+        "team_id": None,
+        "parent_id": None,
+    }
@@ -0,0 +1,74 @@
+"""Measure the query time of CatalogueIndex on a synthetic catalogue.
+
+Run from the repository root::
+
+    python -m benchmarks.search_index [count]
+"""
+
+import random
+import sys
+import timeit
+
+from newmanga.index import CatalogueIndex
+
+from .payloads import catalogue_document
+
+WORDS = ["тень", "клинок", "башня", "король", "магия", "возвращение", "небо"]
+GENRES = ["Боевик", "Драма", "Фэнтези", "Романтика", "Комедия", "Ужасы"]
+TAGS = ["Магия", "Система", "Подземелья", "Умный ГГ", "Регрессия", "Школа"]
+TYPES = ["manga", "manhwa", "manhya", "comics"]
+STATUSES = ["on_going", "completed", "abandoned", "suspended"]
+
+QUERIES = {
+    "everything": dict(),
+    "one word": dict(query="клинок"),
+    "word prefix": dict(query="король баш"),
+    "genre and type": dict(
+        filter={"genres": {"included": ["Драма"]}, "type": {"allowed": ["MANHWA"]}}
+    ),
+    "narrow filter": dict(
+        query="тень",
+        filter={
+            "genres": {"included": ["Ужасы"], "excluded": ["Комедия"]},
+            "tags": {"included": ["Регрессия"]},
+            "translation_status": {"allowed": ["COMPLETED"]},
+            "released_year": {"min": 2015, "max": 2018},
+        },
+        sort={"kind": "VIEWS", "dir": "ASC"},
+    ),
+}
+
+
+def document(index: int, rng: random.Random) -> dict:
+    data = catalogue_document(index)
+    title = " ".join(rng.sample(WORDS, 3))
+    data.update(
+        title_ru=f"{title} {index}",
+        rating=round(rng.uniform(1, 5), 2),
+        views=rng.randrange(1_000_000),
+        genres=rng.sample(GENRES, 2),
+        tags=rng.sample(TAGS, 3),
+        type=rng.choice(TYPES),
+        status=rng.choice(STATUSES),
+        released_at=rng.randrange(946684800, 1700000000),
+        adult=rng.choice(["0", "13", "16", "18"]),
+    )
+    return data
+
+
+def main(count: int = 30000) -> None:
+    rng = random.Random(0)
+    documents = [document(index, rng) for index in range(count)]
+    seconds = timeit.timeit(lambda: CatalogueIndex(documents), number=1)
+    print(f"indexed {count} documents in {seconds * 1000:.0f} ms")
+
+    index = CatalogueIndex(documents)
+    for name, query in QUERIES.items():
+        # The first call builds the bitsets and sort orders it needs
+        response = index.search(**query)
+        seconds = min(timeit.repeat(lambda: index.search(**query), number=100)) / 100
+        print(f"{name:<16} found {response.found:>6}  {seconds * 1e6:>7.0f} µs")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,446 @@
+"""A local stand-in for the NewManga API with injectable faults.
+
+The server answers the catalogue, popular, trending, updates, tags,
+project, comments, similar and chapters endpoints from synthetic data, and
+can throttle with bursts of 429/502 responses, delay responses following a
+latency distribution and cut bodies short. Point a client at it with
+`StandInTransport`::
+
+    with StandInServer(Dataset(mangas=1000), Faults(error_rate=0.05)) as server:
+        api = NewMangaApi(transport=StandInTransport(server.address))
+        for page in api.get_catalogue.next_page():
+            ...
+
+See `benchmarks.load` for a load driver built on it.
+"""
+
+import json
+import math
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional, Sequence
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+from newmanga import constants
+
+from .payloads import catalogue_document, chapter, comment, project, tag
+
+Latency = Callable[[random.Random], float]
+
+
+def latency_distribution(spec: str) -> Latency:
+    """
+    Parse a latency distribution given on the command line.
+
+    Parameters
+    ----------
+    spec : str
+        One of "SECONDS", "uniform:LOW:HIGH", "exp:MEAN",
+        "lognormal:MEDIAN:SIGMA" or "pareto:MINIMUM:ALPHA", in seconds.
+        The Pareto distribution has the heaviest tail.
+
+    Returns
+    -------
+    Callable[[random.Random], float]
+        A function drawing a delay with the given random generator.
+
+    Raises
+    ------
+    ValueError
+        If the distribution is unknown.
+    """
+    name, _, arguments = spec.partition(":")
+    values = [float(value) for value in arguments.split(":") if value]
+    if not values:
+        seconds = float(name)
+        return lambda rng: seconds
+    if name == "uniform":
+        low, high = values
+        return lambda rng: rng.uniform(low, high)
+    if name == "exp":
+        (mean,) = values
+        return lambda rng: rng.expovariate(1 / mean)
+    if name == "lognormal":
+        median, sigma = values
+        return lambda rng: rng.lognormvariate(math.log(median), sigma)
+    if name == "pareto":
+        minimum, alpha = values
+        return lambda rng: minimum * rng.paretovariate(alpha)
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+class Dataset:
+    """Synthetic catalogue served by the stand-in server.
+
+    Manga `n` (from 1) has the slug "manga-n" and the id `n`, which is also
+    the id used in its chapters URL.
+
+    Parameters
+    ----------
+    mangas : int, optional
+        The number of mangas in the catalogue. Defaults to 1000.
+    chapters : int, optional
+        The number of chapters of every manga. Defaults to 100.
+    comments : int, optional
+        The number of top-level comments of every manga, each with a tree of
+        six replies. Defaults to 10.
+    tags : int, optional
+        The number of tags. Defaults to 100.
+    similar : int, optional
+        The number of similar mangas of every manga. Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        mangas: int = 1000,
+        chapters: int = 100,
+        comments: int = 10,
+        tags: int = 100,
+        similar: int = 10,
+    ):
+        self.mangas = mangas
+        self.chapters = chapters
+        self.comments = comments
+        self.similar = similar
+        self.documents = [catalogue_document(index) for index in range(1, mangas + 1)]
+        self.tags = [tag(index) for index in range(1, tags + 1)]
+        self._projects: dict[int, dict[str, Any]] = {}
+
+    def project(self, index: int) -> Optional[dict[str, Any]]:
+        """
+        Return the project payload of a manga, None if it does not exist.
+        """
+        if not 1 <= index <= self.mangas:
+            return None
+        data = self._projects.get(index)
+        if data is None:
+            data = self._projects.setdefault(index, project(index))
+        return data
+
+    def catalogue(self, body: dict[str, Any]) -> dict[str, Any]:
+        """
+        Answer a catalogue query, matching the query in the English titles.
+        """
+        query = body["query"].strip("*").lower()
+        page, size = body["pagination"]["page"], body["pagination"]["size"]
+        found = [
+            document
+            for document in self.documents
+            if not query or query in document["title_en"].lower()
+        ]
+        start = (page - 1) * size
+        return {
+            "result": {
+                "page": page,
+                "found": len(found),
+                "out_of": self.mangas,
+                "search_time_ms": 1,
+                "hits": [{"document": document} for document in found[start:][:size]],
+            }
+        }
+
+    def listing(self, page: int, size: int, newest: bool = False) -> dict[str, Any]:
+        """
+        Answer a page of the popular, trending or updates lists.
+        """
+        indexes = range(self.mangas, 0, -1) if newest else range(1, self.mangas + 1)
+        start = (page - 1) * size
+        return {
+            "count": self.mangas,
+            "items": [self.project(index) for index in indexes[start:][:size]],
+        }
+
+    def chapter_page(self, project_id: int, page: int, size: int) -> dict[str, Any]:
+        """
+        Answer a page of the chapters of a manga.
+        """
+        start = (page - 1) * size
+        indexes = range(self.chapters)[start:][:size]
+        return {
+            "count": self.chapters,
+            "items": [chapter(index, project_id) for index in indexes],
+        }
+
+    def comment_trees(self, project_id: int) -> list[dict[str, Any]]:
+        """
+        Return the comments of a manga.
+        """
+        return [comment(index, project_id) for index in range(1, self.comments + 1)]
+
+    def similar_projects(self, index: int) -> list[dict[str, Any]]:
+        """
+        Return the mangas similar to a manga.
+        """
+        return [
+            self.project((index + offset - 1) % self.mangas + 1)
+            for offset in range(1, self.similar + 1)
+        ]
+
+
+@dataclass()
+class Faults:
+    """The faults injected by the stand-in server.
+
+    Attributes
+    ----------
+    error_rate : float
+        The probability that a request starts a burst of errors.
+    burst : int
+        The number of consecutive requests answered with the error of a
+        burst, whatever the client sending them.
+    statuses : Sequence[int]
+        The error statuses, one drawn for every burst.
+    retry_after : Optional[float]
+        The `Retry-After` seconds sent with the errors, None to send none.
+    truncate_rate : float
+        The probability that a body is cut in half and the connection
+        closed, which the client sees as a transport error.
+    latency : Callable[[random.Random], float]
+        Draws the seconds waited before every response, see
+        `latency_distribution`.
+    seed : Optional[int]
+        The seed of the random generator, for reproducible runs.
+    """
+
+    error_rate: float = 0.0
+    burst: int = 1
+    statuses: Sequence[int] = (429, 502)
+    retry_after: Optional[float] = None
+    truncate_rate: float = 0.0
+    latency: Latency = field(default=lambda rng: 0.0)
+    seed: Optional[int] = None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which would otherwise wait
+    # for the delayed ACK of the client on every response
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def do_GET(self) -> None:
+        self._answer()
+
+    def do_POST(self) -> None:
+        self._answer()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _answer(self) -> None:
+        stand_in = self.server.stand_in
+        length = int(self.headers.get("content-length") or 0)
+        body = self.rfile.read(length) if length else b""
+        delay, error, truncate = stand_in._draw()
+        if delay:
+            stand_in._sleep(delay)
+
+        if error is not None:
+            stand_in._count(str(error))
+            headers = {}
+            if stand_in.faults.retry_after is not None:
+                headers["Retry-After"] = str(stand_in.faults.retry_after)
+            self._send(error, b"", headers)
+            return
+
+        url = urlsplit(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        data = stand_in._route(self.command, url.path, params, body)
+        if data is None:
+            stand_in._count("404")
+            self._send(404, b"{}")
+            return
+
+        content = json.dumps(data, ensure_ascii=False).encode()
+        if truncate:
+            stand_in._count("truncated")
+            self._send(200, content, cut=len(content) // 2)
+            return
+        stand_in._count("200")
+        self._send(200, content)
+
+    def _send(
+        self,
+        status: int,
+        content: bytes,
+        headers: Optional[dict[str, str]] = None,
+        cut: Optional[int] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if cut is None:
+            self.wfile.write(content)
+        else:
+            self.wfile.write(content[:cut])
+            self.wfile.flush()
+            self.close_connection = True
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stand_in: "StandInServer"
+
+
+class StandInServer:
+    """Local HTTP server answering like the NewManga API.
+
+    Parameters
+    ----------
+    dataset : Optional[Dataset], optional
+        The data served. Defaults to `Dataset()`.
+    faults : Optional[Faults], optional
+        The faults injected. Defaults to `Faults()` (none).
+    host : str, optional
+        The address to listen on. Defaults to "127.0.0.1".
+    port : int, optional
+        The port to listen on, 0 for any free port. Defaults to 0.
+
+    Attributes
+    ----------
+    stats : Counter[str]
+        The number of responses by outcome: a status code or "truncated".
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[Dataset] = None,
+        faults: Optional[Faults] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.dataset = Dataset() if dataset is None else dataset
+        self.faults = Faults() if faults is None else faults
+        self.stats: Counter[str] = Counter()
+        self._random = random.Random(self.faults.seed)
+        self._lock = threading.Lock()
+        self._burst_left = 0
+        self._burst_status = 0
+        self._stopped = threading.Event()
+        self._server = _Server((host, port), _Handler)
+        self._server.stand_in = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """
+        The host and port the server listens on.
+        """
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> "StandInServer":
+        """
+        Serve requests on a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the socket.
+        """
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _draw(self) -> tuple[float, Optional[int], bool]:
+        faults = self.faults
+        with self._lock:
+            delay = faults.latency(self._random)
+            if not self._burst_left and self._random.random() < faults.error_rate:
+                self._burst_left = faults.burst
+                self._burst_status = self._random.choice(faults.statuses)
+            error = None
+            if self._burst_left:
+                self._burst_left -= 1
+                error = self._burst_status
+            truncate = self._random.random() < faults.truncate_rate
+        return delay, error, truncate
+
+    def _sleep(self, seconds: float) -> None:
+        self._stopped.wait(seconds)
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def _route(
+        self, method: str, path: str, params: dict[str, str], body: bytes
+    ) -> Optional[Any]:
+        dataset = self.dataset
+        page = int(params.get("page", 1))
+        size = int(params.get("size", 32))
+        parts = path.strip("/").split("/")
+
+        if method == "POST":
+            if path == urlsplit(constants.catalogue).path:
+                return dataset.catalogue(json.loads(body))
+            return None
+        if path == "/v2/tags":
+            return dataset.tags
+        if parts[:2] == ["v2", "branches"] and parts[3:] == ["chapters"]:
+            return dataset.chapter_page(int(parts[2]), page, size)
+        if parts[:2] != ["v2", "projects"] or len(parts) < 3:
+            return None
+        if len(parts) == 3 and parts[2] in ("popular", "trending"):
+            return dataset.listing(page, size)
+        if len(parts) == 3 and parts[2] == "updates":
+            return dataset.listing(page, size, newest=True)
+
+        slug = parts[2]
+        index = int(slug.rpartition("-")[2]) if slug.startswith("manga-") else 0
+        if dataset.project(index) is None:
+            return None
+        if len(parts) == 3:
+            return dataset.project(index)
+        if parts[3:] == ["comments"]:
+            return dataset.comment_trees(index)
+        if parts[3:] == ["similar"]:
+            return dataset.similar_projects(index)
+        return None
+
+
+class StandInTransport(httpx.BaseTransport):
+    """Transport sending the requests of every API host to a local server.
+
+    Only the scheme, host and port of the URLs are rewritten, so cache keys,
+    endpoint names and the `Host` header keep their usual values.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The host and port of the server, see `StandInServer.address`.
+    limits : Optional[httpx.Limits], optional
+        The connection pool limits. Defaults to `constants.limits`.
+    """
+
+    def __init__(self, address: tuple[str, int], limits: Optional[httpx.Limits] = None):
+        self.host, self.port = address
+        self.transport = httpx.HTTPTransport(
+            limits=constants.limits if limits is None else limits
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(
+            scheme="http", host=self.host, port=self.port
+        )
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
@@ -0,0 +1,25 @@
+import asyncio
+
+from newmanga import AsyncNewMangaApi
+
+
+async def main():
+    async with AsyncNewMangaApi() as api:
+        # Get the first page of the catalogue
+        catalogue = await api.get_catalogue()
+
+        # Fetch full info about several manga at once
+        mangas = await asyncio.gather(
+            *(api.get_manga(manga.slug) for manga in catalogue.mangas[:5] if manga.slug)
+        )
+
+        for manga in mangas:
+            chapters = await manga.get_chapters()
+            print(manga.title_en, chapters.count)
+
+        # Go through the pages with an async for loop
+        async for page in api.get_popular.next_page(size=10):
+            print(page.page, len(page.mangas))
+
+
+asyncio.run(main())
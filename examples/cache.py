@@ -0,0 +1,25 @@
+from newmanga import NewMangaApi
+from newmanga.cache import MemoryCache, SQLiteCache
+
+# Keep up to 512 responses in memory
+api = NewMangaApi(cache=MemoryCache(max_entries=512))
+
+# Only the first call goes to the network
+api.get_tags()
+api.get_tags()
+print(api.cache.stats)  # CacheStats(hits=1, misses=1, evictions=0)
+
+# Responses can also be kept on disk, with custom lifetimes (in seconds)
+# for each endpoint. Endpoints missing from the mapping are never cached.
+api = NewMangaApi(
+    cache=SQLiteCache("newmanga-cache.sqlite3"),
+    cache_ttl={"tags": 86400, "manga": 3600, "popular": 600},
+)
+
+# When a cached response expires, it is revalidated with If-None-Match /
+# If-Modified-Since. If the server answers 304 Not Modified, the previously
+# built object is returned again without decoding or formatting the body.
+first = api.get_manga("some-slug")
+again = api.get_manga("some-slug")
+print(first is again)  # True while the content is unchanged
+print(api.cache.stats.revalidations)
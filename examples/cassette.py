@@ -0,0 +1,28 @@
+import random
+
+from newmanga import NewMangaApi
+from newmanga.cassette import Cassette, CassetteTransport
+
+# Record the responses of the live API to a JSON file
+cassette = Cassette("newmanga-cassette.json")
+with NewMangaApi(transport=CassetteTransport(cassette, mode="record")) as api:
+    api.get_popular()
+    api.get_tags()
+# The cassette is saved when the API is closed
+
+# Replay them without network access. Unrecorded requests raise
+# CassetteMissError; use mode="once" to record them instead.
+with NewMangaApi(
+    transport=CassetteTransport(Cassette("newmanga-cassette.json"))
+) as api:
+    print(api.get_popular())
+
+# Simulate a slow network: 50 ms per response on average, with bodies
+# delivered at 1 MB/s
+transport = CassetteTransport(
+    Cassette("newmanga-cassette.json"),
+    latency=lambda: random.expovariate(20),
+    bandwidth=1_000_000,
+)
+with NewMangaApi(transport=transport) as api:
+    print(api.get_tags())
@@ -15,3 +15,8 @@ print(first_manga.url)
 # Fetch chapters for the selected manga
 for chapter in first_manga.get_chapters().chapters:
     print(chapter)
+
+# Stream every chapter across all pages, stopping at a chapter already known
+known_chapter_id = 12345
+for chapter in first_manga.iter_chapters(stop=lambda c: c.id == known_chapter_id):
+    print(chapter.number, chapter.name)
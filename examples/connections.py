@@ -0,0 +1,18 @@
+import httpx
+
+from newmanga import NewMangaApi, constants
+
+# Raise the connection pool limits for thread pools or many concurrent tasks,
+# multiplex requests over HTTP/2 (requires `pip install httpx[http2]`) and
+# set custom timeouts. The client is closed when leaving the block.
+with NewMangaApi(
+    limits=constants.high_throughput_limits,
+    http2=True,
+    timeout=httpx.Timeout(15.0, connect=5.0),
+) as api:
+    print(api.get_tags().total)
+
+    # Several instances can share one connection pool. The shared client
+    # stays open until its owner is closed.
+    other_api = NewMangaApi(client=api.client)
+    print(other_api.get_popular().total)
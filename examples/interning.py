@@ -0,0 +1,14 @@
+from newmanga import NewMangaApi
+from newmanga.interning import InternRegistry
+
+# Share the tags, genres, users and teams with the same id across every
+# response instead of building new objects for each manga
+api = NewMangaApi(interning=InternRegistry())
+
+first = api.get_popular(page=1).mangas
+second = api.get_popular(page=2).mangas
+
+# Values with the same id are the same object, so identity comparisons
+# are enough
+print(first[0].genres[0] is second[0].genres[0])
+print(len(api.interning))  # The number of shared objects
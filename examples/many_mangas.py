@@ -0,0 +1,14 @@
+from newmanga import NewMangaApi
+
+api = NewMangaApi()
+
+# Collect some slugs from the catalogue
+slugs = [manga.slug for manga in api.get_catalogue(size=50).mangas if manga.slug]
+
+# Fetch full info about all of them in a thread pool of 16 workers.
+# Results keep the input order; pass ordered=False to get them as they complete.
+for result in api.get_manga.many(slugs, max_workers=16):
+    if result.error:
+        print(result.slug, "failed:", result.error)
+    else:
+        print(result.slug, result.manga.title_en)
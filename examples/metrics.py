@@ -0,0 +1,35 @@
+from newmanga import NewMangaApi
+from newmanga.metrics import CallMetrics, HistogramSink, MetricsSink, to_prometheus
+
+# Measure every call: status, bytes received, retries, time spent on the
+# network, decoding the JSON body and building the objects, and item count
+sink = HistogramSink()
+api = NewMangaApi(metrics=sink)
+
+for page in api.get_popular.next_page(size=32):
+    if page.page == 3:
+        break
+
+# See where the time goes, per endpoint
+for endpoint, stats in sink.summary().items():
+    print(
+        endpoint,
+        "calls: {}".format(stats["calls"]),
+        "network: {:.1f} ms".format(stats["network_seconds_mean"] * 1000),
+        "decode: {:.1f} ms".format(stats["decode_seconds_mean"] * 1000),
+        "format: {:.1f} ms".format(stats["format_seconds_mean"] * 1000),
+        "p95 format: {:.1f} ms".format(stats["format_seconds_p95"] * 1000),
+    )
+
+# Export the histograms in the Prometheus text format, e.g. on a /metrics page
+print(to_prometheus(sink))
+
+
+# Or send every measurement elsewhere with a custom sink
+class PrintSink(MetricsSink):
+    def record(self, metrics: CallMetrics) -> None:
+        print(metrics.endpoint, metrics.status, metrics.network_seconds)
+
+
+api = NewMangaApi(metrics=PrintSink())
+api.get_tags()
@@ -0,0 +1,14 @@
+from newmanga import NewMangaApi
+from newmanga.ratelimit import RateLimiter, RetryPolicy
+
+# Requests rejected with 429/502 are retried by default, honoring the
+# Retry-After header of the server or backing off exponentially.
+# A rate limiter additionally paces the requests: it starts at 5 requests
+# per second and adapts the rate to the throttling of the server.
+api = NewMangaApi(
+    retry=RetryPolicy(max_retries=8, max_backoff=120),
+    rate_limiter=RateLimiter(rate=5, max_rate=20),
+)
+
+for page in api.get_catalogue.next_page():
+    print(page.page, f"{api.rate_limiter.rate:.2f} req/s")
@@ -0,0 +1,16 @@
+from newmanga import NewMangaApi
+
+api = NewMangaApi()
+
+# Convert only the fields a job needs: each manga is a plain dictionary
+for page in api.get_popular.next_page(size=50, fields=["id", "slug", "rating"]):
+    for manga in page.mangas:
+        print(manga["slug"], manga["rating"])
+
+# Or skip every conversion and get the decoded JSON bodies
+for page in api.get_catalogue.next_page(size=50, raw=True):
+    print(page["result"]["found"], len(page["result"]["hits"]))
+
+# Both modes are available on every endpoint
+print(api.get_manga("some-slug", fields=["title_ru", "count_chapters"]))
+print(api.get_tags(raw=True)[:3])
@@ -1,4 +1,6 @@
 from newmanga import NewMangaApi
+from newmanga.typing.enums import MangaStatus, MangaType
+from newmanga.typing.filters import CatalogueFilter
 
 api = NewMangaApi()
 
@@ -17,6 +19,30 @@ api.get_catalogue(size=10)  # Default: 32
 # You can combine these arguments
 api.get_catalogue(query="Sword", page=10, size=10)
 
+# The API can filter and sort the results, so only the matching pages are
+# downloaded: here completed manhwa released from 2020 to 2023
+completed_manhwa = CatalogueFilter(
+    types=[MangaType.MANHWA],
+    translation_status=[MangaStatus.COMPLETED],
+    min_year=2020,
+    max_year=2023,
+)
+api.get_catalogue(filter=completed_manhwa, sort="VIEWS")  # Default: "RATING"
+
+# Genres and tags are given by id, or as the objects returned by the API
+tags = api.get_tags().tags
+api.get_catalogue(filter=CatalogueFilter(tags=tags[:2]), sort_dir="ASC")
+
 # You can use the for loop to go through all the pages.
 for page in api.get_catalogue.next_page(query="Sword", page=10, size=10):
     print(page)
+
+# Pages can be fetched in parallel: the page count is taken from the first
+# response and at most `concurrency` requests are in flight at once.
+for page in api.get_catalogue.next_page(query="Sword", size=32, concurrency=8):
+    print(page)
+
+# Keep the next pages downloading on a background thread while the current
+# one is being processed.
+for page in api.get_catalogue.next_page(query="Sword", prefetch=2):
+    print(page)
@@ -0,0 +1,26 @@
+from newmanga import NewMangaApi
+from newmanga.index import CatalogueIndex
+from newmanga.snapshot import CatalogueSnapshot
+
+api = NewMangaApi()
+
+# Build the index from a local copy of the catalogue (see snapshot.py)
+snapshot = CatalogueSnapshot("catalogue")
+if not len(snapshot):
+    snapshot.pull(api.get_catalogue, size=100)
+index = CatalogueIndex.from_snapshot(snapshot, api.client)
+
+# Same arguments as the catalogue endpoint, answered without any request.
+# The filter has the structure of the "filter" section of the catalogue query.
+response = index.search(
+    "башня",
+    filter={
+        "genres": {"included": ["Фэнтези"], "excluded": []},
+        "type": {"allowed": ["MANHWA"]},
+        "released_year": {"min": 2018, "max": None},
+    },
+    sort={"kind": "VIEWS", "dir": "DESC"},
+)
+print(response.found, "of", response.total)
+for manga in response.mangas:
+    print(manga.views, manga.title_ru)
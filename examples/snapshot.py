@@ -0,0 +1,19 @@
+from newmanga import NewMangaApi
+from newmanga.snapshot import CatalogueSnapshot
+
+api = NewMangaApi()
+
+# Write every catalogue title to ./catalogue, one checkpoint per page.
+# Running the script again after an interruption continues where it stopped.
+snapshot = CatalogueSnapshot("catalogue")
+thread = snapshot.start(api.get_catalogue, size=100, prefetch=2)
+thread.join()
+if snapshot.error is not None:
+    print("Stopped after", len(snapshot), "titles:", snapshot.error)
+
+# Stream the stored titles back without loading the whole file
+for manga in snapshot.mangas(api.client, unique=True):
+    print(manga.rating, manga.title_ru)
+
+# Pull the whole catalogue again from the first page
+# snapshot.pull(api.get_catalogue, size=100, restart=True)
@@ -0,0 +1,19 @@
+import time
+
+from newmanga import NewMangaApi
+from newmanga.sync import SQLiteStore, sync_updates
+
+api = NewMangaApi()
+store = SQLiteStore("mangas.db")
+
+# The first sync of an empty store reads the whole updates feed unless
+# max_pages is given; later syncs stop at the updates already processed
+while True:
+    result = sync_updates(api, store, max_pages=10)
+    print(result.pages, "pages,", len(result.updated), "mangas updated")
+    for slug, error in result.errors.items():
+        print("Will retry", slug, error)
+    time.sleep(600)
+
+# Read a stored manga without any request
+# print(store.manga(project_id, api.client).title_ru)
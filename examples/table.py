@@ -0,0 +1,26 @@
+from newmanga import NewMangaApi
+from newmanga.table import MangaTable
+
+api = NewMangaApi()
+
+# Store the scalar fields of every popular manga in columns instead of
+# keeping one Manga object per title; raw pages skip building the mangas
+table = MangaTable.from_pages(api.get_popular.next_page(size=50, raw=True), api.client)
+print(len(table))
+
+# Columns are typed arrays and can be scanned directly
+print(sum(table["views"]) / len(table))
+
+# Filter and sort without building any Manga
+ranked = table.where("count_chapters", lambda count: count >= 100).sort(
+    "rating", reverse=True
+)
+for index in range(min(10, len(ranked))):
+    print(ranked["rating"][index], ranked["title_ru"][index])
+
+# Build a manga on demand to call its methods
+best = ranked.manga(0)
+print(best.get_chapters().count)
+
+# With NumPy installed, the columns can be converted to arrays and used
+# as masks: table.filter(table.to_numpy()["views"] > 10000)
@@ -1 +1 @@
-from .api import NewMangaApi
+from .api import AsyncNewMangaApi, NewMangaApi
@@ -1,26 +1,309 @@
-from typing import Optional
+from typing import Optional, Union
 import httpx
 
-from .tags import Tags
-from .updates import Updates
-from .read_now import ReadNow
-from .popular import Popular
-from .catalogue import Catalogue
-from .manga import Manga
-from ..constants import headers
+from .tags import AsyncTags, Tags
+from .updates import AsyncUpdates, Updates
+from .read_now import AsyncReadNow, ReadNow
+from .popular import AsyncPopular, Popular
+from .catalogue import AsyncCatalogue, Catalogue
+from .manga import AsyncManga, Manga
+from ..cache import CacheBackend
+from .. import constants
+from ..interning import InternRegistry, register
+from ..metrics import AsyncMetricsTransport, MetricsSink, MetricsTransport
+from ..ratelimit import RateLimiter, RetryPolicy
+from ..transports import (
+    AsyncCacheTransport,
+    AsyncRetryTransport,
+    CacheTransport,
+    RetryTransport,
+)
 
 
-class NewMangaApi:
-    def __init__(self, proxy: Optional[str] = None):
-        self.client = httpx.Client(
-            headers=headers,
-            proxies={"http": f"http://{proxy}", "https": f"http://{proxy}"}
-            if proxy
-            else None,
+def _check_options(target: str, **options) -> None:
+    """
+    Ensure no option is given along with a pre-built client or transport.
+
+    Parameters
+    ----------
+    target : str
+        What the options would have configured, e.g. "client".
+
+    Raises
+    ------
+    ValueError
+        If any of the options is set.
+    """
+    given = [name for name, value in options.items() if value]
+    if given:
+        raise ValueError(
+            f"These options cannot be applied to a pre-built {target}, "
+            f"configure them on the {target} instead: " + ", ".join(given)
         )
+
+
+class NewMangaApi:
+    """Synchronous client of the NewManga API built on `httpx.Client`.
+
+    Parameters
+    ----------
+    proxy : Optional[str], optional
+        Proxy address in the `host:port` form. Defaults to None.
+    cache : Optional[CacheBackend], optional
+        Storage used to answer repeated requests without the network, e.g.
+        `MemoryCache` or `SQLiteCache`. Defaults to None (no caching).
+    cache_ttl : Optional[dict[str, float]], optional
+        Seconds a cached response stays fresh, keyed by endpoint name.
+        Defaults to `transports.DEFAULT_TTL`.
+    retry : Optional[RetryPolicy], optional
+        How requests rejected with 429 or 502 are retried. Defaults to None,
+        which uses `RetryPolicy()`; pass `RetryPolicy(max_retries=0)` to fail
+        immediately.
+    rate_limiter : Optional[RateLimiter], optional
+        Paces the requests and adapts the rate to the throttling of the
+        server. Defaults to None (no pacing).
+    limits : Optional[httpx.Limits], optional
+        The connection pool and keep-alive limits, e.g.
+        `constants.high_throughput_limits` for thread pools or hundreds of
+        concurrent tasks. Defaults to `constants.limits`.
+    http2 : bool, optional
+        Whether to multiplex requests over HTTP/2 connections. Requires the
+        `h2` package (`pip install httpx[http2]`). Defaults to False.
+    timeout : Optional[Union[httpx.Timeout, float]], optional
+        The request timeouts; `httpx.Timeout(None)` disables them. Defaults
+        to None, which uses `constants.timeout`.
+    interning : Optional[InternRegistry], optional
+        Shares the tags, genres, users and teams with the same id across
+        all responses, which saves memory on large crawls. Defaults to None
+        (every response builds its own instances).
+    transport : Optional[httpx.BaseTransport], optional
+        The transport sending the requests in place of
+        `httpx.HTTPTransport`, e.g. a `cassette.CassetteTransport`
+        replaying recorded responses. The retry and cache layers are still
+        applied on top of it; `proxy`, `limits` and `http2` must not be
+        given along with it. Defaults to None.
+    metrics : Optional[MetricsSink], optional
+        Receives the endpoint, status, bytes, retries, network, decoding
+        and formatting times and item count of every call, e.g. a
+        `metrics.HistogramSink`. Defaults to None (no measurements).
+    client : Optional[httpx.Client], optional
+        A pre-built client to use instead of creating one, e.g. the client
+        of another instance to share its connection pool. It is used as is,
+        so the options above must not be given along with it, and it is not
+        closed by `close()`. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_ttl: Optional[dict[str, float]] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        timeout: Optional[Union[httpx.Timeout, float]] = None,
+        interning: Optional[InternRegistry] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        metrics: Optional[MetricsSink] = None,
+        client: Optional[httpx.Client] = None,
+    ):
+        self.cache = cache
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.interning = interning
+        self._owns_client = client is None
+        if client is not None:
+            _check_options(
+                "client",
+                proxy=proxy,
+                cache=cache,
+                cache_ttl=cache_ttl,
+                retry=retry,
+                rate_limiter=rate_limiter,
+                limits=limits,
+                http2=http2,
+                timeout=timeout,
+                transport=transport,
+                metrics=metrics,
+            )
+            self.client = client
+        else:
+            if transport is not None:
+                _check_options("transport", proxy=proxy, limits=limits, http2=http2)
+            else:
+                transport = httpx.HTTPTransport(
+                    proxy=f"http://{proxy}" if proxy else None,
+                    limits=constants.limits if limits is None else limits,
+                    http2=http2,
+                )
+            transport = RetryTransport(transport, retry, rate_limiter)
+            if cache is not None:
+                transport = CacheTransport(transport, cache, cache_ttl)
+            if metrics is not None:
+                transport = MetricsTransport(transport, metrics)
+            self.client = httpx.Client(
+                headers=constants.headers,
+                transport=transport,
+                timeout=constants.timeout if timeout is None else timeout,
+            )
+
+        if interning is not None:
+            register(self.client, interning)
+
         self.get_catalogue = Catalogue(self.client)
         self.get_popular = Popular(self.client)
         self.get_read_now = ReadNow(self.client)
         self.get_updates = Updates(self.client)
         self.get_tags = Tags(self.client)
         self.get_manga = Manga(self.client)
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP client and release its connections.
+
+        A client passed to the constructor is left open.
+        """
+        if self._owns_client:
+            self.client.close()
+
+    def __enter__(self) -> "NewMangaApi":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class AsyncNewMangaApi:
+    """Asynchronous counterpart of `NewMangaApi` built on `httpx.AsyncClient`.
+
+    Every endpoint is awaitable, `next_page` methods are async generators
+    and mangas returned by the API are `AsyncManga` instances.
+
+    Parameters
+    ----------
+    proxy : Optional[str], optional
+        Proxy address in the `host:port` form. Defaults to None.
+    cache : Optional[CacheBackend], optional
+        Storage used to answer repeated requests without the network, e.g.
+        `MemoryCache` or `SQLiteCache`. Defaults to None (no caching).
+    cache_ttl : Optional[dict[str, float]], optional
+        Seconds a cached response stays fresh, keyed by endpoint name.
+        Defaults to `transports.DEFAULT_TTL`.
+    retry : Optional[RetryPolicy], optional
+        How requests rejected with 429 or 502 are retried. Defaults to None,
+        which uses `RetryPolicy()`; pass `RetryPolicy(max_retries=0)` to fail
+        immediately.
+    rate_limiter : Optional[RateLimiter], optional
+        Paces the requests and adapts the rate to the throttling of the
+        server. Defaults to None (no pacing).
+    limits : Optional[httpx.Limits], optional
+        The connection pool and keep-alive limits, e.g.
+        `constants.high_throughput_limits` for thread pools or hundreds of
+        concurrent tasks. Defaults to `constants.limits`.
+    http2 : bool, optional
+        Whether to multiplex requests over HTTP/2 connections. Requires the
+        `h2` package (`pip install httpx[http2]`). Defaults to False.
+    timeout : Optional[Union[httpx.Timeout, float]], optional
+        The request timeouts; `httpx.Timeout(None)` disables them. Defaults
+        to None, which uses `constants.timeout`.
+    interning : Optional[InternRegistry], optional
+        Shares the tags, genres, users and teams with the same id across
+        all responses, which saves memory on large crawls. Defaults to None
+        (every response builds its own instances).
+    transport : Optional[httpx.AsyncBaseTransport], optional
+        The transport sending the requests in place of
+        `httpx.AsyncHTTPTransport`, e.g. a `cassette.AsyncCassetteTransport`
+        replaying recorded responses. The retry and cache layers are still
+        applied on top of it; `proxy`, `limits` and `http2` must not be
+        given along with it. Defaults to None.
+    metrics : Optional[MetricsSink], optional
+        Receives the endpoint, status, bytes, retries, network, decoding
+        and formatting times and item count of every call, e.g. a
+        `metrics.HistogramSink`. Defaults to None (no measurements).
+    client : Optional[httpx.AsyncClient], optional
+        A pre-built client to use instead of creating one, e.g. the client
+        of another instance to share its connection pool. It is used as is,
+        so the options above must not be given along with it, and it is not
+        closed by `aclose()`. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_ttl: Optional[dict[str, float]] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        timeout: Optional[Union[httpx.Timeout, float]] = None,
+        interning: Optional[InternRegistry] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        metrics: Optional[MetricsSink] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.cache = cache
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.interning = interning
+        self._owns_client = client is None
+        if client is not None:
+            _check_options(
+                "client",
+                proxy=proxy,
+                cache=cache,
+                cache_ttl=cache_ttl,
+                retry=retry,
+                rate_limiter=rate_limiter,
+                limits=limits,
+                http2=http2,
+                timeout=timeout,
+                transport=transport,
+                metrics=metrics,
+            )
+            self.client = client
+        else:
+            if transport is not None:
+                _check_options("transport", proxy=proxy, limits=limits, http2=http2)
+            else:
+                transport = httpx.AsyncHTTPTransport(
+                    proxy=f"http://{proxy}" if proxy else None,
+                    limits=constants.limits if limits is None else limits,
+                    http2=http2,
+                )
+            transport = AsyncRetryTransport(transport, retry, rate_limiter)
+            if cache is not None:
+                transport = AsyncCacheTransport(transport, cache, cache_ttl)
+            if metrics is not None:
+                transport = AsyncMetricsTransport(transport, metrics)
+            self.client = httpx.AsyncClient(
+                headers=constants.headers,
+                transport=transport,
+                timeout=constants.timeout if timeout is None else timeout,
+            )
+
+        if interning is not None:
+            register(self.client, interning)
+
+        self.get_catalogue = AsyncCatalogue(self.client)
+        self.get_popular = AsyncPopular(self.client)
+        self.get_read_now = AsyncReadNow(self.client)
+        self.get_updates = AsyncUpdates(self.client)
+        self.get_tags = AsyncTags(self.client)
+        self.get_manga = AsyncManga(self.client)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and release its connections.
+
+        A client passed to the constructor is left open.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncNewMangaApi":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
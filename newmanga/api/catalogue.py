@@ -1,11 +1,156 @@
+import asyncio
+import copy
+import math
 import httpx
-from typing import Generator
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncGenerator, Generator, Optional, Sequence, Union
 
 from .. import constants, formatters, queries_data
+from .prefetch import async_prefetch_pages, prefetch_pages
+from ..typing.filters import CatalogueFilter, SortDirection, SortKind
 from ..typing.responses import CatalogueResponse
 from ..errors import CatalogueTooManyRequestsError
 
 
+def _build_query(
+    query: str,
+    page: int,
+    size: int,
+    filter: Optional[CatalogueFilter] = None,
+    sort: SortKind = "RATING",
+    sort_dir: SortDirection = "DESC",
+) -> dict[str, Any]:
+    """
+    Build the body of a catalogue request.
+
+    Parameters
+    ----------
+    query : str
+        The query to search for.
+    page : int
+        The page number to request.
+    size : int
+        The number of items per page.
+    filter : Optional[CatalogueFilter], optional
+        The filters applied by the API. Defaults to None (the defaults of
+        `queries_data.catalogue`).
+    sort : SortKind, optional
+        The field the results are sorted by. Defaults to "RATING".
+    sort_dir : SortDirection, optional
+        The sort direction. Defaults to "DESC".
+
+    Returns
+    -------
+    dict[str, Any]
+        A new query, sharing no nested dictionary with
+        `queries_data.catalogue`.
+    """
+    json_data = copy.deepcopy(queries_data.catalogue)
+    json_data["query"] = query
+    json_data["sort"] = {"kind": sort, "dir": sort_dir}
+    if filter is not None:
+        json_data["filter"] = filter.to_json()
+    json_data["pagination"]["page"] = page
+    json_data["pagination"]["size"] = size
+    return json_data
+
+
+def _page_query(json_data: dict[str, Any], page: int) -> dict[str, Any]:
+    """
+    Build a copy of the catalogue query pointing to the given page.
+
+    Parameters
+    ----------
+    json_data : dict[str, Any]
+        The catalogue query to copy.
+    page : int
+        The page number to request.
+
+    Returns
+    -------
+    dict[str, Any]
+        A deep copy of the query with the pagination page replaced.
+    """
+    page_data = copy.deepcopy(json_data)
+    page_data["pagination"]["page"] = page
+    return page_data
+
+
+def _parse_response(
+    client: httpx.Client | httpx.AsyncClient,
+    response: httpx.Response,
+    raw: bool = False,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[CatalogueResponse, dict[str, Any], None]:
+    """
+    Convert a catalogue HTTP response to a CatalogueResponse.
+
+    Parameters
+    ----------
+    client : httpx.Client | httpx.AsyncClient
+        An instance of the HTTP client attached to the returned mangas.
+    response : httpx.Response
+        The response of the catalogue API.
+    raw : bool, optional
+        If true, the decoded body is returned instead. Defaults to False.
+    fields : Optional[Sequence[str]], optional
+        If given, each manga is a dictionary of these fields only. Defaults
+        to None.
+
+    Returns
+    -------
+    Union[CatalogueResponse, dict[str, Any], None]
+        The parsed page, or None if the page is empty.
+
+    Raises
+    ------
+    CatalogueTooManyRequestsError
+        If the API still rejects the requests once the retries are exhausted.
+    httpx.HTTPStatusError
+        If the API answers with any other error status, so that a failed
+        page is never mistaken for the end of the catalogue.
+    """
+    if response.status_code in [502, 429]:
+        raise CatalogueTooManyRequestsError("You making too many requests in a row")
+
+    response.raise_for_status()
+
+    catalogue = formatters.format_response(
+        response,
+        "catalogue",
+        lambda data: formatters.json_to_catalogue_reponse(
+            client, data["result"], fields
+        ),
+        raw=raw,
+        fields=fields,
+    )
+    if raw:
+        return catalogue if catalogue["result"]["hits"] else None
+    return catalogue if catalogue.mangas else None
+
+
+def _last_page(first: Union[CatalogueResponse, dict[str, Any]], size: int) -> int:
+    """
+    Compute the number of the last non-empty page from the first response.
+
+    Parameters
+    ----------
+    first : Union[CatalogueResponse, dict[str, Any]]
+        The first page returned by the catalogue API, parsed or raw.
+    size : int
+        The number of items per page.
+
+    Returns
+    -------
+    int
+        The number of the last page holding any of the found mangas.
+    """
+    found = first["result"]["found"] if isinstance(first, dict) else first.found
+    return math.ceil(found / size)
+
+
 class Catalogue:
     """Interact with a catalogue API.
 
@@ -25,16 +170,18 @@ class Catalogue:
             An instance of the HTTP client.
         """
         self.client = client
-        self.page = 1
-        self.size = 32
-        self.query = "*"
 
     def __call__(
         self,
         query: str = "*",
         page: int = 1,
         size: int = 32,
-    ) -> CatalogueResponse:
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        filter: Optional[CatalogueFilter] = None,
+        sort: SortKind = "RATING",
+        sort_dir: SortDirection = "DESC",
+    ) -> Union[CatalogueResponse, dict[str, Any], None]:
         """
         Fetch the catalogue response for the given parameters.
 
@@ -46,26 +193,58 @@ class Catalogue:
             The page number to fetch. Defaults to 1.
         size : Optional[int], optional
             The number of items per page. Defaults to 32.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
+        filter : Optional[CatalogueFilter], optional
+            The genres, tags, types, statuses, release years and age ratings
+            the API filters the results by. Defaults to None (the filters of
+            the website).
+        sort : SortKind, optional
+            The field the results are sorted by. Defaults to "RATING".
+        sort_dir : SortDirection, optional
+            The sort direction, "ASC" or "DESC". Defaults to "DESC".
 
         Returns
         -------
-        CatalogueResponse
-            The response from the catalogue API.
+        Union[CatalogueResponse, dict[str, Any], None]
+            The response from the catalogue API, or the decoded body in raw
+            mode (None if the page is empty).
         """
-        self.query = query
-        self.page = page
-        self.size = size
         try:
-            return next(self.next_page(query, page, size))
+            return next(
+                self.next_page(
+                    query,
+                    page,
+                    size,
+                    raw=raw,
+                    fields=fields,
+                    filter=filter,
+                    sort=sort,
+                    sort_dir=sort_dir,
+                )
+            )
         except StopIteration:
-            return CatalogueResponse(mangas=[], page=self.page, found=0, total=0)
+            if raw:
+                return None
+            return CatalogueResponse(mangas=[], page=page, found=0, total=0)
 
     def next_page(
         self,
         query: str = "*",
         page: int = 1,
         size: int = 32,
-    ) -> Generator[CatalogueResponse, None, None]:
+        concurrency: Optional[int] = None,
+        prefetch: int = 0,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        filter: Optional[CatalogueFilter] = None,
+        sort: SortKind = "RATING",
+        sort_dir: SortDirection = "DESC",
+    ) -> Generator[Union[CatalogueResponse, dict[str, Any]], None, None]:
         """
         Yield catalogue responses page by page.
 
@@ -77,35 +256,439 @@ class Catalogue:
             The page number to fetch. Defaults to 1.
         size : Optional[int], optional
             The number of items per page. Defaults to 32.
+        concurrency : Optional[int], optional
+            If set, the page count is computed from the `found` total of the
+            first response and the remaining pages are fetched in parallel,
+            with at most this many requests in flight. Pages are still
+            yielded in order. Defaults to None (one page at a time).
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread while
+            the current page is being processed. Defaults to 0 (disabled).
+        raw : bool, optional
+            If true, the decoded JSON body of each page is yielded without
+            building any object. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
+        filter : Optional[CatalogueFilter], optional
+            The genres, tags, types, statuses, release years and age ratings
+            the API filters the results by. Defaults to None (the filters of
+            the website).
+        sort : SortKind, optional
+            The field the results are sorted by. Defaults to "RATING".
+        sort_dir : SortDirection, optional
+            The sort direction, "ASC" or "DESC". Defaults to "DESC".
 
         Yields
         ------
-        CatalogueResponse
-            The response from the catalogue API for each page.
+        Union[CatalogueResponse, dict[str, Any]]
+            The response from the catalogue API for each page, or its decoded
+            body in raw mode.
 
         Raises
         ------
         CatalogueTooManyRequestsError
-            If too many requests are made in a row.
+            If the API still rejects the requests once the retries are
+            exhausted.
+        httpx.HTTPStatusError
+            If the API answers with any other error status.
+        """
+        if prefetch:
+            yield from prefetch_pages(
+                self.next_page(
+                    query,
+                    page,
+                    size,
+                    concurrency,
+                    raw=raw,
+                    fields=fields,
+                    filter=filter,
+                    sort=sort,
+                    sort_dir=sort_dir,
+                ),
+                prefetch,
+            )
+            return
+
+        json_data = _build_query(query, page, size, filter, sort, sort_dir)
+
+        if concurrency:
+            yield from self._fan_out(json_data, page, size, concurrency, raw, fields)
+            return
+
+        while response := self.client.post(
+            constants.catalogue, json=json_data, extensions={"newmanga_format": True}
+        ):
+            catalogue = _parse_response(self.client, response, raw, fields)
+            if catalogue is None:
+                break
+
+            yield catalogue
+            json_data["pagination"]["page"] += 1
+
+    def _fetch_page(
+        self,
+        json_data: dict[str, Any],
+        page: int,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[CatalogueResponse, dict[str, Any], None]:
+        """
+        Fetch a single catalogue page.
+
+        Parameters
+        ----------
+        json_data : dict[str, Any]
+            The catalogue query.
+        page : int
+            The page number to fetch.
+        raw : bool, optional
+            If true, the decoded body is returned. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            The projected manga fields. Defaults to None.
+
+        Returns
+        -------
+        Union[CatalogueResponse, dict[str, Any], None]
+            The parsed page, or None if the page is empty.
+        """
+        response = self.client.post(
+            constants.catalogue,
+            json=_page_query(json_data, page),
+            extensions={"newmanga_format": True},
+        )
+        return _parse_response(self.client, response, raw, fields)
+
+    def _fan_out(
+        self,
+        json_data: dict[str, Any],
+        page: int,
+        size: int,
+        concurrency: int,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Generator[Union[CatalogueResponse, dict[str, Any]], None, None]:
+        """
+        Fetch the pages following the first one in a thread pool.
+
+        Parameters
+        ----------
+        json_data : dict[str, Any]
+            The catalogue query.
+        page : int
+            The first page number to fetch.
+        size : int
+            The number of items per page.
+        concurrency : int
+            The maximum number of requests in flight.
+        raw : bool, optional
+            If true, the decoded bodies are yielded. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            The projected manga fields. Defaults to None.
+
+        Yields
+        ------
+        Union[CatalogueResponse, dict[str, Any]]
+            The response from the catalogue API for each page, in order.
+        """
+        first = self._fetch_page(json_data, page, raw, fields)
+        if first is None:
+            return
+
+        pages = iter(range(page + 1, _last_page(first, size) + 1))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque(
+                executor.submit(self._fetch_page, json_data, number, raw, fields)
+                for number in islice(pages, concurrency)
+            )
+            try:
+                yield first
+                while pending:
+                    response = pending.popleft().result()
+                    for number in islice(pages, 1):
+                        pending.append(
+                            executor.submit(
+                                self._fetch_page, json_data, number, raw, fields
+                            )
+                        )
+                    if response is None:
+                        return
+                    yield response
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+class AsyncCatalogue:
+    """Interact with a catalogue API using an asynchronous HTTP client.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient
+        An instance of the asynchronous HTTP client.
+    """
+
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initialize the AsyncCatalogue with an asynchronous HTTP client.
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient
+            An instance of the asynchronous HTTP client.
+        """
+        self.client = client
+
+    async def __call__(
+        self,
+        query: str = "*",
+        page: int = 1,
+        size: int = 32,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        filter: Optional[CatalogueFilter] = None,
+        sort: SortKind = "RATING",
+        sort_dir: SortDirection = "DESC",
+    ) -> Union[CatalogueResponse, dict[str, Any], None]:
         """
-        json_data = queries_data.catalogue.copy()
-        json_data["query"] = query
-        json_data["pagination"]["page"] = page
-        json_data["pagination"]["size"] = size
+        Fetch the catalogue response for the given parameters.
+
+        Parameters
+        ----------
+        query : Optional[str], optional
+            The query to search for. Defaults to "*".
+        page : Optional[int], optional
+            The page number to fetch. Defaults to 1.
+        size : Optional[int], optional
+            The number of items per page. Defaults to 32.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
+        filter : Optional[CatalogueFilter], optional
+            The genres, tags, types, statuses, release years and age ratings
+            the API filters the results by. Defaults to None (the filters of
+            the website).
+        sort : SortKind, optional
+            The field the results are sorted by. Defaults to "RATING".
+        sort_dir : SortDirection, optional
+            The sort direction, "ASC" or "DESC". Defaults to "DESC".
 
-        while response := self.client.post(constants.catalogue, json=json_data):
-            if response.status_code in [502, 429]:
-                raise CatalogueTooManyRequestsError(
-                    "You making too many requests in a row"
+        Returns
+        -------
+        Union[CatalogueResponse, dict[str, Any], None]
+            The response from the catalogue API, or the decoded body in raw
+            mode (None if the page is empty).
+        """
+        try:
+            return await anext(
+                self.next_page(
+                    query,
+                    page,
+                    size,
+                    raw=raw,
+                    fields=fields,
+                    filter=filter,
+                    sort=sort,
+                    sort_dir=sort_dir,
                 )
+            )
+        except StopAsyncIteration:
+            if raw:
+                return None
+            return CatalogueResponse(mangas=[], page=page, found=0, total=0)
 
-            if (
-                response.status_code != 200
-                or len(response.json()["result"]["hits"]) == 0
+    async def next_page(
+        self,
+        query: str = "*",
+        page: int = 1,
+        size: int = 32,
+        concurrency: Optional[int] = None,
+        prefetch: int = 0,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        filter: Optional[CatalogueFilter] = None,
+        sort: SortKind = "RATING",
+        sort_dir: SortDirection = "DESC",
+    ) -> AsyncGenerator[Union[CatalogueResponse, dict[str, Any]], None]:
+        """
+        Yield catalogue responses page by page.
+
+        Parameters
+        ----------
+        query : Optional[str], optional
+            The query to search for. Defaults to "*".
+        page : Optional[int], optional
+            The page number to fetch. Defaults to 1.
+        size : Optional[int], optional
+            The number of items per page. Defaults to 32.
+        concurrency : Optional[int], optional
+            If set, the page count is computed from the `found` total of the
+            first response and the remaining pages are fetched concurrently,
+            with at most this many requests in flight. Pages are still
+            yielded in order. Defaults to None (one page at a time).
+        prefetch : int, optional
+            The number of pages to fetch ahead in a background task while
+            the current page is being processed. Defaults to 0 (disabled).
+        raw : bool, optional
+            If true, the decoded JSON body of each page is yielded without
+            building any object. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
+        filter : Optional[CatalogueFilter], optional
+            The genres, tags, types, statuses, release years and age ratings
+            the API filters the results by. Defaults to None (the filters of
+            the website).
+        sort : SortKind, optional
+            The field the results are sorted by. Defaults to "RATING".
+        sort_dir : SortDirection, optional
+            The sort direction, "ASC" or "DESC". Defaults to "DESC".
+
+        Yields
+        ------
+        Union[CatalogueResponse, dict[str, Any]]
+            The response from the catalogue API for each page, or its decoded
+            body in raw mode.
+
+        Raises
+        ------
+        CatalogueTooManyRequestsError
+            If the API still rejects the requests once the retries are
+            exhausted.
+        httpx.HTTPStatusError
+            If the API answers with any other error status.
+        """
+        if prefetch:
+            pages = async_prefetch_pages(
+                self.next_page(
+                    query,
+                    page,
+                    size,
+                    concurrency,
+                    raw=raw,
+                    fields=fields,
+                    filter=filter,
+                    sort=sort,
+                    sort_dir=sort_dir,
+                ),
+                prefetch,
+            )
+            try:
+                async for response in pages:
+                    yield response
+            finally:
+                await pages.aclose()
+            return
+
+        json_data = _build_query(query, page, size, filter, sort, sort_dir)
+
+        if concurrency:
+            async for response in self._fan_out(
+                json_data, page, size, concurrency, raw, fields
             ):
+                yield response
+            return
+
+        while response := await self.client.post(
+            constants.catalogue, json=json_data, extensions={"newmanga_format": True}
+        ):
+            catalogue = _parse_response(self.client, response, raw, fields)
+            if catalogue is None:
                 break
 
-            yield formatters.json_to_catalogue_reponse(
-                self.client, response.json()["result"]
-            )
+            yield catalogue
             json_data["pagination"]["page"] += 1
+
+    async def _fetch_page(
+        self,
+        json_data: dict[str, Any],
+        page: int,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[CatalogueResponse, dict[str, Any], None]:
+        """
+        Fetch a single catalogue page.
+
+        Parameters
+        ----------
+        json_data : dict[str, Any]
+            The catalogue query.
+        page : int
+            The page number to fetch.
+        raw : bool, optional
+            If true, the decoded body is returned. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            The projected manga fields. Defaults to None.
+
+        Returns
+        -------
+        Union[CatalogueResponse, dict[str, Any], None]
+            The parsed page, or None if the page is empty.
+        """
+        response = await self.client.post(
+            constants.catalogue,
+            json=_page_query(json_data, page),
+            extensions={"newmanga_format": True},
+        )
+        return _parse_response(self.client, response, raw, fields)
+
+    async def _fan_out(
+        self,
+        json_data: dict[str, Any],
+        page: int,
+        size: int,
+        concurrency: int,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncGenerator[Union[CatalogueResponse, dict[str, Any]], None]:
+        """
+        Fetch the pages following the first one concurrently.
+
+        Parameters
+        ----------
+        json_data : dict[str, Any]
+            The catalogue query.
+        page : int
+            The first page number to fetch.
+        size : int
+            The number of items per page.
+        concurrency : int
+            The maximum number of requests in flight.
+        raw : bool, optional
+            If true, the decoded bodies are yielded. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            The projected manga fields. Defaults to None.
+
+        Yields
+        ------
+        Union[CatalogueResponse, dict[str, Any]]
+            The response from the catalogue API for each page, in order.
+        """
+        first = await self._fetch_page(json_data, page, raw, fields)
+        if first is None:
+            return
+
+        pages = iter(range(page + 1, _last_page(first, size) + 1))
+        pending = deque(
+            asyncio.ensure_future(self._fetch_page(json_data, number, raw, fields))
+            for number in islice(pages, concurrency)
+        )
+        try:
+            yield first
+            while pending:
+                response = await pending.popleft()
+                for number in islice(pages, 1):
+                    pending.append(
+                        asyncio.ensure_future(
+                            self._fetch_page(json_data, number, raw, fields)
+                        )
+                    )
+                if response is None:
+                    return
+                yield response
+        finally:
+            for task in pending:
+                task.cancel()
@@ -1,17 +1,39 @@
+import asyncio
+import copy
+import math
 import httpx
-from typing import TYPE_CHECKING
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Iterable,
+    Optional,
+    Sequence,
+    Union,
+)
+from dataclasses import dataclass, field, fields
 
 
 from .. import constants, formatters, queries_data
-from ..typing.types import Genre, Tag, Author, Artist, Branch
+from ..interning import registry_for
+from ..typing.types import Genre, Tag, Author, Artist, Branch, Chapter
 from ..typing.enums import MangaType, MangaStatus
 
 if TYPE_CHECKING:
-    from ..typing.responses import CommentsResponse, ChaptersResponse, SimilarResponse
+    from ..typing.responses import (
+        CommentsResponse,
+        ChaptersResponse,
+        MangaResult,
+        SimilarResponse,
+    )
 
 
-@dataclass()
+@dataclass(slots=True)
 class Manga:
     """
     Data class representing a manga.
@@ -108,7 +130,9 @@ class Manga:
     english_url: str | None = None
     other_url: str | None = None
 
-    def __call__(self, slug: str) -> "Manga":
+    def __call__(
+        self, slug: str, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> Union["Manga", dict[str, Any]]:
         """
         Fetches and returns a Manga object based on the provided slug.
 
@@ -116,16 +140,113 @@ class Manga:
         ----------
         slug : str
             The URL-friendly title of the manga.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, a dictionary of these fields only is returned, by
+            default None.
 
         Returns
         -------
-        Manga
-            An instance of the Manga class with the data fetched from the API.
+        Union[Manga, dict[str, Any]]
+            An instance of the Manga class with the data fetched from the API,
+            or the decoded body in raw mode.
         """
-        response = self._client.get(constants.manga_api + "/" + slug).json()
-        return formatters.json_to_object.json_to_manga(self._client, response)
+        response = self._client.get(
+            constants.manga_api + "/" + slug, extensions={"newmanga_format": True}
+        )
+        return self._format(response, raw, fields)
+
+    def _format(
+        self,
+        response: httpx.Response,
+        raw: bool,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union["Manga", dict[str, Any]]:
+        return formatters.format_response(
+            response,
+            "manga",
+            lambda data: formatters.json_to_object.json_to_manga(
+                self._client, data, fields=fields
+            ),
+            raw=raw,
+            fields=fields,
+        )
+
+    def many(
+        self,
+        slugs: Iterable[str],
+        max_workers: int = 8,
+        ordered: bool = True,
+        raw: bool = False,
+    ) -> Generator["MangaResult", None, None]:
+        """
+        Fetches several mangas in a thread pool sharing the HTTP client.
+
+        Failures do not abort the batch: every slug produces a `MangaResult`
+        holding either the manga or the exception raised while fetching it.
+        A response with an error status, such as 404 for a removed manga,
+        is reported as an `httpx.HTTPStatusError`.
+
+        Parameters
+        ----------
+        slugs : Iterable[str]
+            The URL-friendly titles of the mangas.
+        max_workers : int, optional
+            The number of threads, and so of requests in flight, by default 8.
+            The HTTP client connection pool should allow as many connections.
+        ordered : bool, optional
+            If true, results are yielded in input order, otherwise as soon as
+            they complete, by default True.
+        raw : bool, optional
+            If true, each result holds the decoded JSON body instead of a
+            Manga, by default False.
+
+        Yields
+        ------
+        MangaResult
+            The outcome of fetching each slug.
+        """
+        from ..typing.responses import MangaResult
+
+        def fetch(slug: str) -> MangaResult:
+            try:
+                response = self._client.get(
+                    constants.manga_api + "/" + slug,
+                    extensions={"newmanga_format": True},
+                )
+                response.raise_for_status()
+                return MangaResult(slug=slug, manga=self._format(response, raw))
+            except Exception as error:
+                return MangaResult(slug=slug, error=error)
+
+        slugs = iter(slugs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                executor.submit(fetch, slug) for slug in islice(slugs, max_workers)
+            )
+            try:
+                while pending:
+                    if ordered:
+                        done = [pending.popleft()]
+                    else:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        done = [future for future in pending if future in finished]
+                        pending = deque(
+                            future for future in pending if future not in finished
+                        )
+                    for slug in islice(slugs, len(done)):
+                        pending.append(executor.submit(fetch, slug))
+                    for future in done:
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
-    def get_comments(self, sort_by: str = "new") -> "CommentsResponse":
+    def get_comments(
+        self, sort_by: str = "new", raw: bool = False
+    ) -> Union["CommentsResponse", list[dict[str, Any]]]:
         """
         Fetches comments for the manga.
 
@@ -133,38 +254,75 @@ class Manga:
         ----------
         sort_by : str, optional
             The sorting method for comments, by default "new".
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
 
         Returns
         -------
-        CommentsResponse
-            The response containing a list of comments.
+        Union[CommentsResponse, list[dict[str, Any]]]
+            The response containing a list of comments, or the decoded body
+            in raw mode.
         """
-        params = queries_data.comments.copy()
+        params = copy.deepcopy(queries_data.comments)
         params["sort_by"] = sort_by
 
         response = self._client.get(
-            constants.comments.format(slug=self.slug), params=queries_data.comments
-        ).json()
-        return formatters.json_to_comments_response(response)
+            constants.comments.format(slug=self.slug),
+            params=params,
+            extensions={"newmanga_format": True},
+        )
+        return formatters.format_response(
+            response,
+            "comments",
+            lambda data: formatters.json_to_comments_response(
+                data, registry_for(self._client)
+            ),
+            raw=raw,
+        )
 
-    def get_similar(self) -> "SimilarResponse":
+    def get_similar(
+        self, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> Union["SimilarResponse", list[dict[str, Any]]]:
         """
         Fetches similar manga recommendations.
 
+        Parameters
+        ----------
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields only,
+            by default None.
+
         Returns
         -------
-        SimilarResponse
-            The response containing a list of similar manga.
+        Union[SimilarResponse, list[dict[str, Any]]]
+            The response containing a list of similar manga, or the decoded
+            body in raw mode.
         """
-        response = self._client.get(constants.similar.format(slug=self.slug)).json()
-        return formatters.json_to_similar_response(self._client, response)
+        response = self._client.get(
+            constants.similar.format(slug=self.slug),
+            extensions={"newmanga_format": True},
+        )
+        return formatters.format_response(
+            response,
+            "similar",
+            lambda data: formatters.json_to_similar_response(
+                self._client, data, fields
+            ),
+            raw=raw,
+            fields=fields,
+        )
 
     def get_chapters(
         self,
         page: int = 1,
         size: int = 25,
         reverse: bool = False,
-    ) -> "ChaptersResponse":
+        raw: bool = False,
+    ) -> Union["ChaptersResponse", dict[str, Any]]:
         """
         Fetches a paginated list of chapters for the manga.
 
@@ -176,13 +334,17 @@ class Manga:
             The number of chapters per page, by default 25.
         reverse : bool, optional
             If true, chapters are ordered in reverse, by default False.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
 
         Returns
         -------
-        ChaptersResponse
-            The response containing a list of chapters.
+        Union[ChaptersResponse, dict[str, Any]]
+            The response containing a list of chapters, or the decoded body
+            in raw mode.
         """
-        params = queries_data.chapters.copy()
+        params = copy.deepcopy(queries_data.chapters)
         params["page"] = page
         params["size"] = size
         params["reverse"] = reverse
@@ -190,5 +352,485 @@ class Manga:
         response = self._client.get(
             constants.chapters.format(id=self.id),
             params=params,
-        ).json()
-        return formatters.json_to_chapters_response(response)
+            extensions={"newmanga_format": True},
+        )
+        return formatters.format_response(
+            response, "chapters", formatters.json_to_chapters_response, raw=raw
+        )
+
+    def iter_chapters(
+        self,
+        size: int = 25,
+        reverse: bool = False,
+        concurrency: int = 4,
+        stop: Optional[Callable[[Chapter], bool]] = None,
+    ) -> Generator[Chapter, None, None]:
+        """
+        Yields every chapter of the manga across all pages.
+
+        The number of pages is computed from the `count` of the first page and
+        the following pages are fetched in a thread pool. Only `concurrency`
+        pages are held at a time, so memory does not grow with the number of
+        chapters.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of chapters per page, by default 25.
+        reverse : bool, optional
+            If true, chapters are ordered in reverse, by default False.
+        concurrency : int, optional
+            The maximum number of page requests in flight, by default 4.
+        stop : Optional[Callable[[Chapter], bool]], optional
+            A predicate called for each chapter; iteration ends without
+            yielding the chapter once it returns true, by default None.
+
+        Yields
+        ------
+        Chapter
+            The chapters of the manga, in page order.
+        """
+        first = self.get_chapters(1, size, reverse)
+        pages = iter(range(2, math.ceil(first.count / size) + 1))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque(
+                executor.submit(self.get_chapters, page, size, reverse)
+                for page in islice(pages, concurrency)
+            )
+            try:
+                response = first
+                while True:
+                    for chapter in response.chapters:
+                        if stop is not None and stop(chapter):
+                            return
+                        yield chapter
+                    if not pending:
+                        return
+                    response = pending.popleft().result()
+                    for page in islice(pages, 1):
+                        pending.append(
+                            executor.submit(self.get_chapters, page, size, reverse)
+                        )
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+@dataclass(slots=True)
+class AsyncManga(Manga):
+    """
+    Data class representing a manga bound to an asynchronous HTTP client.
+
+    It exposes the same attributes as `Manga`, but every method performing
+    a request is a coroutine.
+
+    Attributes
+    ----------
+    _client : httpx.AsyncClient
+        An instance of the asynchronous HTTP client used for making API requests.
+    """
+
+    _client: httpx.AsyncClient = field(repr=False)
+
+    async def __call__(
+        self, slug: str, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> Union["AsyncManga", dict[str, Any]]:
+        """
+        Fetches and returns an AsyncManga object based on the provided slug.
+
+        Parameters
+        ----------
+        slug : str
+            The URL-friendly title of the manga.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, a dictionary of these fields only is returned, by
+            default None.
+
+        Returns
+        -------
+        Union[AsyncManga, dict[str, Any]]
+            An instance of the AsyncManga class with the data fetched from the API,
+            or the decoded body in raw mode.
+        """
+        response = await self._client.get(
+            constants.manga_api + "/" + slug, extensions={"newmanga_format": True}
+        )
+        return self._format(response, raw, fields)
+
+    async def many(
+        self,
+        slugs: Iterable[str],
+        concurrency: int = 8,
+        ordered: bool = True,
+        raw: bool = False,
+    ) -> AsyncGenerator["MangaResult", None]:
+        """
+        Fetches several mangas concurrently over the shared HTTP client.
+
+        Failures do not abort the batch: every slug produces a `MangaResult`
+        holding either the manga or the exception raised while fetching it.
+        A response with an error status, such as 404 for a removed manga,
+        is reported as an `httpx.HTTPStatusError`.
+
+        Parameters
+        ----------
+        slugs : Iterable[str]
+            The URL-friendly titles of the mangas.
+        concurrency : int, optional
+            The maximum number of requests in flight, by default 8.
+        ordered : bool, optional
+            If true, results are yielded in input order, otherwise as soon as
+            they complete, by default True.
+        raw : bool, optional
+            If true, each result holds the decoded JSON body instead of a
+            Manga, by default False.
+
+        Yields
+        ------
+        MangaResult
+            The outcome of fetching each slug.
+        """
+        from ..typing.responses import MangaResult
+
+        async def fetch(slug: str) -> MangaResult:
+            try:
+                response = await self._client.get(
+                    constants.manga_api + "/" + slug,
+                    extensions={"newmanga_format": True},
+                )
+                response.raise_for_status()
+                return MangaResult(slug=slug, manga=self._format(response, raw))
+            except Exception as error:
+                return MangaResult(slug=slug, error=error)
+
+        slugs = iter(slugs)
+        pending = deque(
+            asyncio.ensure_future(fetch(slug)) for slug in islice(slugs, concurrency)
+        )
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    done = [task for task in pending if task in finished]
+                    pending = deque(task for task in pending if task not in finished)
+                for slug in islice(slugs, len(done)):
+                    pending.append(asyncio.ensure_future(fetch(slug)))
+                for task in done:
+                    yield await task
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_comments(
+        self, sort_by: str = "new", raw: bool = False
+    ) -> Union["CommentsResponse", list[dict[str, Any]]]:
+        """
+        Fetches comments for the manga.
+
+        Parameters
+        ----------
+        sort_by : str, optional
+            The sorting method for comments, by default "new".
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+
+        Returns
+        -------
+        Union[CommentsResponse, list[dict[str, Any]]]
+            The response containing a list of comments, or the decoded body
+            in raw mode.
+        """
+        params = copy.deepcopy(queries_data.comments)
+        params["sort_by"] = sort_by
+
+        response = await self._client.get(
+            constants.comments.format(slug=self.slug),
+            params=params,
+            extensions={"newmanga_format": True},
+        )
+        return formatters.format_response(
+            response,
+            "comments",
+            lambda data: formatters.json_to_comments_response(
+                data, registry_for(self._client)
+            ),
+            raw=raw,
+        )
+
+    async def get_similar(
+        self, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> Union["SimilarResponse", list[dict[str, Any]]]:
+        """
+        Fetches similar manga recommendations.
+
+        Parameters
+        ----------
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields only,
+            by default None.
+
+        Returns
+        -------
+        Union[SimilarResponse, list[dict[str, Any]]]
+            The response containing a list of similar manga, or the decoded
+            body in raw mode.
+        """
+        response = await self._client.get(
+            constants.similar.format(slug=self.slug),
+            extensions={"newmanga_format": True},
+        )
+        return formatters.format_response(
+            response,
+            "similar",
+            lambda data: formatters.json_to_similar_response(
+                self._client, data, fields
+            ),
+            raw=raw,
+            fields=fields,
+        )
+
+    async def get_chapters(
+        self,
+        page: int = 1,
+        size: int = 25,
+        reverse: bool = False,
+        raw: bool = False,
+    ) -> Union["ChaptersResponse", dict[str, Any]]:
+        """
+        Fetches a paginated list of chapters for the manga.
+
+        Parameters
+        ----------
+        page : int, optional
+            The page number to fetch, by default 1.
+        size : int, optional
+            The number of chapters per page, by default 25.
+        reverse : bool, optional
+            If true, chapters are ordered in reverse, by default False.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+
+        Returns
+        -------
+        Union[ChaptersResponse, dict[str, Any]]
+            The response containing a list of chapters, or the decoded body
+            in raw mode.
+        """
+        params = copy.deepcopy(queries_data.chapters)
+        params["page"] = page
+        params["size"] = size
+        params["reverse"] = reverse
+
+        response = await self._client.get(
+            constants.chapters.format(id=self.id),
+            params=params,
+            extensions={"newmanga_format": True},
+        )
+        return formatters.format_response(
+            response, "chapters", formatters.json_to_chapters_response, raw=raw
+        )
+
+    async def iter_chapters(
+        self,
+        size: int = 25,
+        reverse: bool = False,
+        concurrency: int = 4,
+        stop: Optional[Callable[[Chapter], bool]] = None,
+    ) -> AsyncGenerator[Chapter, None]:
+        """
+        Yields every chapter of the manga across all pages.
+
+        The number of pages is computed from the `count` of the first page and
+        the following pages are fetched concurrently. Only `concurrency` pages
+        are held at a time, so memory does not grow with the number of
+        chapters.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of chapters per page, by default 25.
+        reverse : bool, optional
+            If true, chapters are ordered in reverse, by default False.
+        concurrency : int, optional
+            The maximum number of page requests in flight, by default 4.
+        stop : Optional[Callable[[Chapter], bool]], optional
+            A predicate called for each chapter; iteration ends without
+            yielding the chapter once it returns true, by default None.
+
+        Yields
+        ------
+        Chapter
+            The chapters of the manga, in page order.
+        """
+        first = await self.get_chapters(1, size, reverse)
+        pages = iter(range(2, math.ceil(first.count / size) + 1))
+        pending = deque(
+            asyncio.ensure_future(self.get_chapters(page, size, reverse))
+            for page in islice(pages, concurrency)
+        )
+        try:
+            response = first
+            while True:
+                for chapter in response.chapters:
+                    if stop is not None and stop(chapter):
+                        return
+                    yield chapter
+                if not pending:
+                    return
+                response = await pending.popleft()
+                for page in islice(pages, 1):
+                    pending.append(
+                        asyncio.ensure_future(self.get_chapters(page, size, reverse))
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class _LazyField:
+    """Descriptor converting a manga field from the raw data on first access.
+
+    The converted value is stored in the slot of the field and the bit of
+    the field is cleared from `_missing`; once every field is converted,
+    the raw data is released.
+    """
+
+    def __init__(self, name: str, bit: int):
+        self.name = name
+        self.bit = bit
+        slot = Manga.__dict__[name]
+        self.get = slot.__get__
+        self.set = slot.__set__
+        self.loader: Optional[Callable[[Any, Any], Any]] = None
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        missing = instance._missing
+        if not missing & self.bit:
+            return self.get(instance, owner)
+        loader = self.loader
+        if loader is None:
+            loader = self.loader = formatters.manga.FIELD_LOADERS[self.name]
+        value = loader(instance._data, instance._registry)
+        self.set(instance, value)
+        missing ^= self.bit
+        instance._missing = missing
+        if not missing:
+            instance._data = instance._registry = None
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.set(instance, value)
+        missing = instance._missing
+        if missing & self.bit:
+            missing ^= self.bit
+            instance._missing = missing
+            if not missing:
+                instance._data = instance._registry = None
+
+
+class _LazyFields:
+    """Base of the manga classes hydrated field by field from the raw data.
+
+    Built with the fields of the manga, like the dataclass it derives from,
+    they behave as eager mangas; `from_data` builds them lazily instead.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._missing = 0
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_data(cls, _client: Any, data: dict[str, Any]) -> Any:
+        """
+        Keep the raw data of the manga without converting any field.
+
+        Parameters
+        ----------
+        _client : httpx.Client | httpx.AsyncClient
+            An instance of the HTTP client used for making API requests.
+        data : dict[str, Any]
+            A dictionary containing raw manga data.
+
+        Returns
+        -------
+        LazyManga | AsyncLazyManga
+            The manga converting each field on first access.
+        """
+        manga = cls.__new__(cls)
+        manga._client = _client
+        manga._data = data
+        manga._registry = registry_for(_client)
+        manga._missing = _ALL_FIELDS
+        return manga
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compare the converted fields with those of an eager or lazy manga of
+        the same kind, converting the fields not read yet.
+        """
+        if _eager_class(type(other)) is not _eager_class(type(self)):
+            return NotImplemented
+        return all(
+            getattr(self, item.name) == getattr(other, item.name)
+            for item in fields(Manga)
+            if item.compare
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _eager_class(cls: type) -> type:
+    """
+    Return the eager manga class a lazy manga class stands for.
+    """
+    for base in cls.__mro__:
+        if issubclass(base, Manga) and not issubclass(base, _LazyFields):
+            return base
+    return cls
+
+
+_LAZY_FIELDS = [item.name for item in fields(Manga) if item.name != "_client"]
+_ALL_FIELDS = (1 << len(_LAZY_FIELDS)) - 1
+for _bit, _name in enumerate(_LAZY_FIELDS):
+    setattr(_LazyFields, _name, _LazyField(_name, 1 << _bit))
+
+
+class LazyManga(_LazyFields, Manga):
+    """
+    Manga whose fields are converted from the raw data on first access.
+
+    It exposes the same attributes and methods as `Manga` and compares equal
+    to the `Manga` with the same fields. Built with `from_data`, it costs
+    nothing until a field is read, which makes large listings cheap when
+    only a few fields are used.
+    """
+
+    __slots__ = ("_data", "_registry", "_missing")
+
+
+class AsyncLazyManga(_LazyFields, AsyncManga):
+    """
+    AsyncManga whose fields are converted from the raw data on first access.
+
+    It exposes the same attributes and methods as `AsyncManga` and compares
+    equal to the `AsyncManga` with the same fields. Built with `from_data`,
+    it costs nothing until a field is read.
+    """
+
+    __slots__ = ("_data", "_registry", "_missing")
@@ -1,6 +1,8 @@
+import copy
 import httpx
-from typing import Generator, Literal
+from typing import Any, AsyncGenerator, Generator, Literal, Optional, Sequence, Union
 from .. import constants, formatters, queries_data
+from .prefetch import async_prefetch_pages, prefetch_pages
 from ..typing.responses import PopularResponse
 from ..errors import CatalogueTooManyRequestsError
 
@@ -22,7 +24,9 @@ class Popular:
         self,
         page: int = 1,
         size: int = 32,
-    ) -> PopularResponse:
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[PopularResponse, dict[str, Any], None]:
         """
         Fetch a single page of popular manga.
 
@@ -32,23 +36,33 @@ class Popular:
             The page number to fetch. Defaults to 1.
         size : int, optional
             The number of items per page. Defaults to 32.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
 
         Returns
         -------
-        PopularResponse
-            The response containing popular manga information.
+        Union[PopularResponse, dict[str, Any], None]
+            The response containing popular manga information, or the
+            decoded body in raw mode (None if the page is empty).
         """
         try:
-            return next(self.next_page(page, size))
+            return next(self.next_page(page, size, raw=raw, fields=fields))
         except StopIteration:
-            return PopularResponse(mangas=[], total=0, page=page)
+            return None if raw else PopularResponse(mangas=[], total=0, page=page)
 
     def next_page(
         self,
         page: int = 1,
         size: int = 32,
         scale: Literal["day", "week", "month"] = "week",
-    ) -> Generator[PopularResponse, None, None]:
+        prefetch: int = 0,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Generator[Union[PopularResponse, dict[str, Any]], None, None]:
         """
         Generate popular manga responses page by page.
 
@@ -60,32 +74,189 @@ class Popular:
             The number of items per page. Defaults to 32.
         scale : Literal["day", "week", "month"], optional
             The time scale for popularity. Defaults to "week".
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread while
+            the current page is being processed. Defaults to 0 (disabled).
+        raw : bool, optional
+            If true, the decoded JSON body of each page is yielded without
+            building any object. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
 
         Yields
         ------
-        PopularResponse
-            The response containing popular manga information for each page.
+        Union[PopularResponse, dict[str, Any]]
+            The response containing popular manga information for each page,
+            or its decoded body in raw mode.
 
         Raises
         ------
         CatalogueTooManyRequestsError
-            If too many requests are made in a row.
+            If the API still rejects the requests once the retries are
+            exhausted.
         """
-        params = queries_data.popular.copy()
+        if prefetch:
+            yield from prefetch_pages(
+                self.next_page(page, size, scale, raw=raw, fields=fields), prefetch
+            )
+            return
+
+        params = copy.deepcopy(queries_data.popular)
+        params["scale"] = scale
+        params["page"] = page
+        params["size"] = size
+
+        while response := self.client.get(
+            constants.popular, params=params, extensions={"newmanga_format": True}
+        ):
+            if response.status_code in [502, 429]:
+                raise CatalogueTooManyRequestsError(
+                    "You making too many requests in a row"
+                )
+            if response.status_code != 200:
+                break
+            popular = formatters.format_response(
+                response,
+                "popular",
+                lambda data: formatters.json_to_popular_response(
+                    self.client, data, params["page"], fields
+                ),
+                raw=raw,
+                fields=fields,
+            )
+            if not (popular["items"] if raw else popular.mangas):
+                break
+
+            yield popular
+            params["page"] += 1
+
+
+class AsyncPopular:
+    """
+    A class to handle popular manga queries with an asynchronous HTTP client.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient
+        An instance of the asynchronous HTTP client used to make requests to the API.
+    """
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+
+    async def __call__(
+        self,
+        page: int = 1,
+        size: int = 32,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[PopularResponse, dict[str, Any], None]:
+        """
+        Fetch a single page of popular manga.
+
+        Parameters
+        ----------
+        page : int, optional
+            The page number to fetch. Defaults to 1.
+        size : int, optional
+            The number of items per page. Defaults to 32.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
+
+        Returns
+        -------
+        Union[PopularResponse, dict[str, Any], None]
+            The response containing popular manga information, or the
+            decoded body in raw mode (None if the page is empty).
+        """
+        try:
+            return await anext(self.next_page(page, size, raw=raw, fields=fields))
+        except StopAsyncIteration:
+            return None if raw else PopularResponse(mangas=[], total=0, page=page)
+
+    async def next_page(
+        self,
+        page: int = 1,
+        size: int = 32,
+        scale: Literal["day", "week", "month"] = "week",
+        prefetch: int = 0,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncGenerator[Union[PopularResponse, dict[str, Any]], None]:
+        """
+        Generate popular manga responses page by page.
+
+        Parameters
+        ----------
+        page : int, optional
+            The starting page number. Defaults to 1.
+        size : int, optional
+            The number of items per page. Defaults to 32.
+        scale : Literal["day", "week", "month"], optional
+            The time scale for popularity. Defaults to "week".
+        prefetch : int, optional
+            The number of pages to fetch ahead in a background task while
+            the current page is being processed. Defaults to 0 (disabled).
+        raw : bool, optional
+            If true, the decoded JSON body of each page is yielded without
+            building any object. Defaults to False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
+
+        Yields
+        ------
+        Union[PopularResponse, dict[str, Any]]
+            The response containing popular manga information for each page,
+            or its decoded body in raw mode.
+
+        Raises
+        ------
+        CatalogueTooManyRequestsError
+            If the API still rejects the requests once the retries are
+            exhausted.
+        """
+        if prefetch:
+            pages = async_prefetch_pages(
+                self.next_page(page, size, scale, raw=raw, fields=fields), prefetch
+            )
+            try:
+                async for response in pages:
+                    yield response
+            finally:
+                await pages.aclose()
+            return
+
+        params = copy.deepcopy(queries_data.popular)
         params["scale"] = scale
         params["page"] = page
         params["size"] = size
 
-        while response := self.client.get(constants.popular, params=params):
+        while response := await self.client.get(
+            constants.popular, params=params, extensions={"newmanga_format": True}
+        ):
             if response.status_code in [502, 429]:
                 raise CatalogueTooManyRequestsError(
                     "You making too many requests in a row"
                 )
-            if response.status_code != 200 or len(response.json()["items"]) == 0:
+            if response.status_code != 200:
                 break
-            yield formatters.json_to_popular_response(
-                self.client,
-                response.json(),
-                params["page"],
+            popular = formatters.format_response(
+                response,
+                "popular",
+                lambda data: formatters.json_to_popular_response(
+                    self.client, data, params["page"], fields
+                ),
+                raw=raw,
+                fields=fields,
             )
+            if not (popular["items"] if raw else popular.mangas):
+                break
+
+            yield popular
             params["page"] += 1
@@ -0,0 +1,128 @@
+import asyncio
+import queue
+import threading
+from contextlib import suppress
+from typing import AsyncGenerator, AsyncIterator, Generator, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+_POLL_INTERVAL = 0.1
+
+
+def prefetch_pages(pages: Iterator[T], size: int) -> Generator[T, None, None]:
+    """
+    Consume a page generator on a background thread, keeping pages ahead.
+
+    The worker thread keeps up to `size` pages requested or buffered ahead
+    of the caller, so network time overlaps with the processing of the
+    current page. Errors raised by the underlying generator are re-raised to the caller at
+    the position they occurred. Closing this generator stops the worker: the
+    request in flight is allowed to finish, but no further pages are fetched.
+
+    Parameters
+    ----------
+    pages : Iterator[T]
+        The page generator to consume.
+    size : int
+        The maximum number of pages fetched ahead of the caller.
+
+    Yields
+    ------
+    T
+        The pages of the underlying generator, in order.
+    """
+    buffer: queue.SimpleQueue = queue.SimpleQueue()
+    slots = threading.Semaphore(size)
+    stop = threading.Event()
+
+    def acquire() -> bool:
+        while not stop.is_set():
+            if slots.acquire(timeout=_POLL_INTERVAL):
+                return not stop.is_set()
+        return False
+
+    def worker() -> None:
+        try:
+            while acquire():
+                page = next(pages, _DONE)
+                buffer.put((page, None))
+                if page is _DONE:
+                    return
+        except Exception as error:
+            buffer.put((_DONE, error))
+        finally:
+            close = getattr(pages, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield page
+    finally:
+        stop.set()
+        thread.join()
+
+
+async def async_prefetch_pages(
+    pages: AsyncIterator[T], size: int
+) -> AsyncGenerator[T, None]:
+    """
+    Consume an async page generator in a background task, keeping pages ahead.
+
+    The task keeps up to `size` pages requested or buffered ahead of the
+    caller. Errors raised by the underlying generator are re-raised to the
+    caller at the position they occurred. Closing this generator cancels the task,
+    including the request in flight.
+
+    Parameters
+    ----------
+    pages : AsyncIterator[T]
+        The async page generator to consume.
+    size : int
+        The maximum number of pages fetched ahead of the caller.
+
+    Yields
+    ------
+    T
+        The pages of the underlying generator, in order.
+    """
+    buffer: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(size)
+
+    async def worker() -> None:
+        try:
+            while await slots.acquire():
+                page = await anext(pages, _DONE)
+                await buffer.put((page, None))
+                if page is _DONE:
+                    return
+        except Exception as error:
+            await buffer.put((_DONE, error))
+        finally:
+            aclose = getattr(pages, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    task = asyncio.ensure_future(worker())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield page
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
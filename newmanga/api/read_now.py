@@ -1,4 +1,5 @@
 import httpx
+from typing import Any, Optional, Sequence, Union
 
 from .. import constants, formatters
 from ..typing.responses import ReadNowResponse
@@ -25,14 +26,92 @@ class ReadNow:
         """
         self.client = client
 
-    def __call__(self) -> ReadNowResponse:
+    def __call__(
+        self, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> Union[ReadNowResponse, list[dict[str, Any]]]:
         """
         Fetches and returns the 'Read Now' data.
 
+        Parameters
+        ----------
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields only,
+            by default None.
+
+        Returns
+        -------
+        Union[ReadNowResponse, list[dict[str, Any]]]
+            An object containing the data for the 'Read Now' feature, or the
+            decoded body in raw mode.
+        """
+        response = self.client.get(
+            constants.read_now, extensions={"newmanga_format": True}
+        )
+        return formatters.format_response(
+            response,
+            "read_now",
+            lambda data: formatters.json_to_read_now_response(
+                self.client, data, fields
+            ),
+            raw=raw,
+            fields=fields,
+        )
+
+
+class AsyncReadNow:
+    """
+    A class to interact with the 'Read Now' feature of the API asynchronously.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient
+        An instance of the asynchronous HTTP client used to make requests to the API.
+    """
+
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initializes the AsyncReadNow class with an asynchronous HTTP client.
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient
+            An instance of the asynchronous HTTP client used to make requests to the API.
+        """
+        self.client = client
+
+    async def __call__(
+        self, raw: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> Union[ReadNowResponse, list[dict[str, Any]]]:
+        """
+        Fetches and returns the 'Read Now' data.
+
+        Parameters
+        ----------
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields only,
+            by default None.
+
         Returns
         -------
-        ReadNowResponse
-            An object containing the data for the 'Read Now' feature.
+        Union[ReadNowResponse, list[dict[str, Any]]]
+            An object containing the data for the 'Read Now' feature, or the
+            decoded body in raw mode.
         """
-        response = self.client.get(constants.read_now)
-        return formatters.json_to_read_now_response(self.client, response.json())
+        response = await self.client.get(
+            constants.read_now, extensions={"newmanga_format": True}
+        )
+        return formatters.format_response(
+            response,
+            "read_now",
+            lambda data: formatters.json_to_read_now_response(
+                self.client, data, fields
+            ),
+            raw=raw,
+            fields=fields,
+        )
@@ -1,6 +1,8 @@
 import httpx
+from typing import Any, Union
 
 from .. import constants, formatters
+from ..interning import registry_for
 from ..typing.responses import TagsResponse
 
 
@@ -16,14 +18,71 @@ class Tags:
         """
         self.client = client
 
-    def __call__(self) -> TagsResponse:
+    def __call__(self, raw: bool = False) -> Union[TagsResponse, list[dict[str, Any]]]:
         """
         Fetches and returns the list of tags.
 
+        Parameters
+        ----------
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+
+        Returns
+        -------
+        Union[TagsResponse, list[dict[str, Any]]]
+            An object containing the tags response data, or the decoded body
+            in raw mode.
+        """
+        response = self.client.get(constants.tags, extensions={"newmanga_format": True})
+        return formatters.format_response(
+            response,
+            "tags",
+            lambda data: formatters.json_to_tags_response(
+                data, registry_for(self.client)
+            ),
+            raw=raw,
+        )
+
+
+class AsyncTags:
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initializes the AsyncTags class with an asynchronous HTTP client.
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient
+            An instance of the asynchronous HTTP client used to make requests to the API.
+        """
+        self.client = client
+
+    async def __call__(
+        self, raw: bool = False
+    ) -> Union[TagsResponse, list[dict[str, Any]]]:
+        """
+        Fetches and returns the list of tags.
+
+        Parameters
+        ----------
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+
         Returns
         -------
-        TagsResponse
-            An object containing the tags response data.
+        Union[TagsResponse, list[dict[str, Any]]]
+            An object containing the tags response data, or the decoded body
+            in raw mode.
         """
-        response = self.client.get(constants.tags)
-        return formatters.json_to_tags_response(response.json())
+        response = await self.client.get(
+            constants.tags, extensions={"newmanga_format": True}
+        )
+        return formatters.format_response(
+            response,
+            "tags",
+            lambda data: formatters.json_to_tags_response(
+                data, registry_for(self.client)
+            ),
+            raw=raw,
+        )
@@ -1,7 +1,9 @@
+import copy
 import httpx
-from typing import Generator
+from typing import Any, AsyncGenerator, Generator, Optional, Sequence, Union
 
 from .. import constants, formatters, queries_data
+from .prefetch import async_prefetch_pages, prefetch_pages
 from ..typing.responses import UpdatesResponse
 from ..errors import CatalogueTooManyRequestsError
 
@@ -22,7 +24,9 @@ class Updates:
         self,
         page: int = 1,
         size: int = 5,
-    ) -> UpdatesResponse:
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[UpdatesResponse, dict[str, Any], None]:
         """
         Fetches and returns the updates for the specified page and size.
 
@@ -32,22 +36,32 @@ class Updates:
             The page number to fetch, by default 1.
         size : int, optional
             The number of items per page, by default 5.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields only,
+            by default None.
 
         Returns
         -------
-        UpdatesResponse
-            An object containing the updates response data.
+        Union[UpdatesResponse, dict[str, Any], None]
+            An object containing the updates response data, or the decoded
+            body in raw mode (None if the page is empty).
         """
         try:
-            return next(self.next_page(page, size))
+            return next(self.next_page(page, size, raw=raw, fields=fields))
         except StopIteration:
-            return UpdatesResponse(mangas=[], total=0, page=page)
+            return None if raw else UpdatesResponse(mangas=[], total=0, page=page)
 
     def next_page(
         self,
         page: int = 1,
         size: int = 5,
-    ) -> Generator[UpdatesResponse, None, None]:
+        prefetch: int = 0,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Generator[Union[UpdatesResponse, dict[str, Any]], None, None]:
         """
         Generator to fetch and yield the updates for each page.
 
@@ -57,33 +71,187 @@ class Updates:
             The starting page number, by default 1.
         size : int, optional
             The number of items per page, by default 5.
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread while
+            the current page is being processed, by default 0 (disabled).
+        raw : bool, optional
+            If true, the decoded JSON body of each page is yielded without
+            building any object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields only,
+            by default None.
 
         Yields
         ------
-        UpdatesResponse
-            An object containing the updates response data for each page.
+        Union[UpdatesResponse, dict[str, Any]]
+            An object containing the updates response data for each page, or
+            its decoded body in raw mode.
 
         Raises
         ------
         CatalogueTooManyRequestsError
-            If too many requests are made in a short period, causing the API to return a 429 status code.
+            If the API still answers with a 429 status code once the retries
+            are exhausted.
         """
-        params = queries_data.updates.copy()
+        if prefetch:
+            yield from prefetch_pages(
+                self.next_page(page, size, raw=raw, fields=fields), prefetch
+            )
+            return
+
+        params = copy.deepcopy(queries_data.updates)
+        params["page"] = page
+        params["size"] = size
+
+        while response := self.client.get(
+            constants.updates, params=params, extensions={"newmanga_format": True}
+        ):
+            if response.status_code in [502, 429]:
+                raise CatalogueTooManyRequestsError(
+                    "You are making too many requests in a row"
+                )
+
+            if response.status_code != 200:
+                break
+
+            updates = formatters.format_response(
+                response,
+                "updates",
+                lambda data: formatters.json_to_updates_response(
+                    self.client, data, params["page"], fields
+                ),
+                raw=raw,
+                fields=fields,
+            )
+            if not (updates["items"] if raw else updates.mangas):
+                break
+
+            yield updates
+            params["page"] += 1
+
+
+class AsyncUpdates:
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initializes the AsyncUpdates class with an asynchronous HTTP client.
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient
+            An instance of the asynchronous HTTP client used to make requests to the API.
+        """
+        self.client = client
+
+    async def __call__(
+        self,
+        page: int = 1,
+        size: int = 5,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[UpdatesResponse, dict[str, Any], None]:
+        """
+        Fetches and returns the updates for the specified page and size.
+
+        Parameters
+        ----------
+        page : int, optional
+            The page number to fetch, by default 1.
+        size : int, optional
+            The number of items per page, by default 5.
+        raw : bool, optional
+            If true, the decoded JSON body is returned without building any
+            object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields only,
+            by default None.
+
+        Returns
+        -------
+        Union[UpdatesResponse, dict[str, Any], None]
+            An object containing the updates response data, or the decoded
+            body in raw mode (None if the page is empty).
+        """
+        try:
+            return await anext(self.next_page(page, size, raw=raw, fields=fields))
+        except StopAsyncIteration:
+            return None if raw else UpdatesResponse(mangas=[], total=0, page=page)
+
+    async def next_page(
+        self,
+        page: int = 1,
+        size: int = 5,
+        prefetch: int = 0,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncGenerator[Union[UpdatesResponse, dict[str, Any]], None]:
+        """
+        Asynchronous generator to fetch and yield the updates for each page.
+
+        Parameters
+        ----------
+        page : int, optional
+            The starting page number, by default 1.
+        size : int, optional
+            The number of items per page, by default 5.
+        prefetch : int, optional
+            The number of pages to fetch ahead in a background task while
+            the current page is being processed, by default 0 (disabled).
+        raw : bool, optional
+            If true, the decoded JSON body of each page is yielded without
+            building any object, by default False.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields only,
+            by default None.
+
+        Yields
+        ------
+        Union[UpdatesResponse, dict[str, Any]]
+            An object containing the updates response data for each page, or
+            its decoded body in raw mode.
+
+        Raises
+        ------
+        CatalogueTooManyRequestsError
+            If the API still answers with a 429 status code once the retries
+            are exhausted.
+        """
+        if prefetch:
+            pages = async_prefetch_pages(
+                self.next_page(page, size, raw=raw, fields=fields), prefetch
+            )
+            try:
+                async for response in pages:
+                    yield response
+            finally:
+                await pages.aclose()
+            return
+
+        params = copy.deepcopy(queries_data.updates)
         params["page"] = page
         params["size"] = size
 
-        while response := self.client.get(constants.updates, params=params):
+        while response := await self.client.get(
+            constants.updates, params=params, extensions={"newmanga_format": True}
+        ):
             if response.status_code in [502, 429]:
                 raise CatalogueTooManyRequestsError(
                     "You are making too many requests in a row"
                 )
 
-            if response.status_code != 200 or len(response.json()["items"]) == 0:
+            if response.status_code != 200:
                 break
 
-            yield formatters.json_to_updates_response(
-                self.client,
-                response.json(),
-                params["page"],
+            updates = formatters.format_response(
+                response,
+                "updates",
+                lambda data: formatters.json_to_updates_response(
+                    self.client, data, params["page"], fields
+                ),
+                raw=raw,
+                fields=fields,
             )
+            if not (updates["items"] if raw else updates.mangas):
+                break
+
+            yield updates
             params["page"] += 1
@@ -0,0 +1,401 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+@dataclass()
+class CacheStats:
+    """Counters describing how a cache has been used.
+
+    The counters are shared by the threads using the cache, so they are
+    updated through `add`.
+
+    Attributes
+    ----------
+    hits : int
+        The number of requests answered from the cache.
+    misses : int
+        The number of requests sent to the network.
+    evictions : int
+        The number of entries removed to stay within the size limit.
+    revalidations : int
+        The number of stale entries confirmed unchanged by the server.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    revalidations: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, name: str, count: int = 1) -> None:
+        """
+        Increase a counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter, e.g. "hits".
+        count : int, optional
+            The amount added. Defaults to 1.
+        """
+        with self._lock:
+            setattr(self, name, getattr(self, name) + count)
+
+
+@dataclass()
+class CacheEntry:
+    """A response stored in a cache.
+
+    Attributes
+    ----------
+    status_code : int
+        The HTTP status code of the response.
+    headers : list[tuple[str, str]]
+        The headers of the response.
+    content : bytes
+        The decoded body of the response.
+    expires_at : float
+        The UNIX timestamp after which the entry is stale.
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    content: bytes = b""
+    expires_at: float = 0.0
+
+    @property
+    def fresh(self) -> bool:
+        """
+        Whether the entry can still be served without a request.
+        """
+        return time.time() < self.expires_at
+
+    @property
+    def etag(self) -> Optional[str]:
+        """
+        The `ETag` validator of the response, if any.
+        """
+        return self._header("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """
+        The `Last-Modified` validator of the response, if any.
+        """
+        return self._header("last-modified")
+
+    @property
+    def version(self) -> str:
+        """
+        An identifier of the response content, stable across revalidations.
+        """
+        return self.etag or self.last_modified or hashlib.sha1(self.content).hexdigest()
+
+    def _header(self, name: str) -> Optional[str]:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+
+class ParsedCache:
+    """In-memory LRU of objects built from cached responses.
+
+    It lets an unchanged response be served without decoding and
+    formatting its body again.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        The maximum number of stored objects. Defaults to 256.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._objects: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: tuple[str, str, str], create: Callable[[], T]) -> T:
+        """
+        Return the object stored under the key, building it if needed.
+
+        Parameters
+        ----------
+        key : tuple[str, str, str]
+            The cache key, content version and kind of the object.
+        create : Callable[[], T]
+            Builds the object when it is not stored yet.
+
+        Returns
+        -------
+        T
+            The stored or newly built object.
+        """
+        with self._lock:
+            value = self._objects.get(key, _MISSING)
+            if value is not _MISSING:
+                self._objects.move_to_end(key)
+                return value
+
+        value = create()
+        with self._lock:
+            self._objects[key] = value
+            while len(self._objects) > self.max_entries:
+                self._objects.popitem(last=False)
+        return value
+
+
+@dataclass()
+class CacheHandle:
+    """Link between a cached response and the objects built from it.
+
+    Transports attach it to the responses they serve under the
+    `newmanga_cache` extension.
+
+    Attributes
+    ----------
+    parsed : ParsedCache
+        The storage of the objects built from cached responses.
+    key : str
+        The cache key of the request.
+    version : str
+        The identifier of the response content.
+    """
+
+    parsed: ParsedCache
+    key: str
+    version: str
+
+    def get_or_create(self, kind: str, create: Callable[[], T]) -> T:
+        """
+        Return the object of the given kind built from this response.
+
+        Parameters
+        ----------
+        kind : str
+            The name of the conversion applied to the response body.
+        create : Callable[[], T]
+            Builds the object when the response content was not converted yet.
+
+        Returns
+        -------
+        T
+            The object built from the response content.
+        """
+        return self.parsed.get_or_create((self.key, self.version, kind), create)
+
+
+class CacheBackend:
+    """Base class for response cache storages.
+
+    Subclasses implement `get`, `set` and `clear`; the `stats` counters are
+    shared by the storage and the transport using it.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return the entry stored under the given key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the request.
+
+        Returns
+        -------
+        Optional[CacheEntry]
+            The stored entry, fresh or stale, or None if there is none.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry under the given key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the request.
+        entry : CacheEntry
+            The response to store.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """In-memory cache evicting the least recently used entries.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        The maximum number of stored responses. Defaults to 1024.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.add("evictions")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """On-disk cache stored in a SQLite database.
+
+    Entries are evicted in least recently used order once `max_entries` is
+    exceeded, so the cache survives restarts without growing unbounded.
+    Access times are kept in memory and written in one batch before the
+    next eviction, on close, or once `flush_every` of them are pending, so
+    a hit does not write to the database.
+
+    Parameters
+    ----------
+    path : str
+        The path to the database file.
+    max_entries : int, optional
+        The maximum number of stored responses. Defaults to 100000.
+    flush_every : int, optional
+        The number of pending access times that triggers a write. Defaults
+        to 1000.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000, flush_every: int = 1000):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self._accessed: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "status_code INTEGER NOT NULL, "
+            "headers TEXT NOT NULL, "
+            "content BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= self.flush_every:
+                self._flush()
+                self._connection.commit()
+        return CacheEntry(
+            status_code=row[0],
+            headers=[tuple(header) for header in json.loads(row[1])],
+            content=row[2],
+            expires_at=row[3],
+        )
+
+    def _flush(self) -> None:
+        """
+        Write the pending access times, the lock being held.
+        """
+        if self._accessed:
+            self._connection.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._flush()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.expires_at,
+                    time.time(),
+                ),
+            )
+            evicted = self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            self._connection.commit()
+            self.stats.add("evictions", evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._accessed.clear()
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """
+        Write the pending access times and close the database connection.
+        """
+        with self._lock:
+            self._flush()
+            self._connection.commit()
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
@@ -0,0 +1,288 @@
+import asyncio
+import base64
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Literal, Optional, Union
+
+import httpx
+
+from .cache import CacheEntry
+from .errors import CassetteMissError
+from .transports import _to_entry, cache_key
+
+Mode = Literal["replay", "record", "once"]
+Latency = Union[float, Callable[[], float]]
+
+
+def _dump(key: str, request: httpx.Request, entry: CacheEntry) -> dict[str, Any]:
+    """
+    Convert a recorded pair to its JSON form.
+    """
+    response: dict[str, Any] = {
+        "status_code": entry.status_code,
+        "headers": entry.headers,
+    }
+    try:
+        response["text"] = entry.content.decode()
+    except UnicodeDecodeError:
+        response["base64"] = base64.b64encode(entry.content).decode()
+    return {
+        "key": key,
+        "request": {"method": request.method, "url": str(request.url)},
+        "response": response,
+    }
+
+
+def _load(interaction: dict[str, Any]) -> CacheEntry:
+    """
+    Convert the JSON form of a recorded response back.
+    """
+    response = interaction["response"]
+    if "text" in response:
+        content = response["text"].encode()
+    else:
+        content = base64.b64decode(response["base64"])
+    return CacheEntry(
+        status_code=response["status_code"],
+        headers=[tuple(header) for header in response["headers"]],
+        content=content,
+    )
+
+
+class Cassette:
+    """Request and response pairs recorded to a JSON file.
+
+    Requests are matched by method, URL and body. A request sent several
+    times is answered with its recorded responses in order, the last one
+    being repeated once they are used up.
+
+    Parameters
+    ----------
+    path : str
+        The path of the JSON file, loaded if it exists.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._interactions: list[dict[str, Any]] = []
+        self._responses: dict[str, list[CacheEntry]] = {}
+        self._played: dict[str, int] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for interaction in json.load(file)["interactions"]:
+                    self._add(interaction)
+
+    def _add(self, interaction: dict[str, Any]) -> None:
+        self._interactions.append(interaction)
+        self._responses.setdefault(interaction["key"], []).append(_load(interaction))
+
+    def record(self, request: httpx.Request, response: httpx.Response) -> None:
+        """
+        Add a request and its read response.
+
+        Parameters
+        ----------
+        request : httpx.Request
+            The request sent.
+        response : httpx.Response
+            The response received, with its content already read.
+        """
+        entry = _to_entry(response, 0.0)
+        with self._lock:
+            self._add(_dump(cache_key(request), request, entry))
+
+    def play(self, request: httpx.Request) -> Optional[CacheEntry]:
+        """
+        Return the next recorded response of a request.
+
+        Parameters
+        ----------
+        request : httpx.Request
+            The request to answer.
+
+        Returns
+        -------
+        Optional[CacheEntry]
+            The recorded response, or None if the request was not recorded.
+        """
+        key = cache_key(request)
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                return None
+            played = self._played.get(key, 0)
+            self._played[key] = played + 1
+        return responses[min(played, len(responses) - 1)]
+
+    def rewind(self) -> None:
+        """
+        Replay every request from its first recorded response again.
+        """
+        with self._lock:
+            self._played.clear()
+
+    def save(self) -> None:
+        """
+        Write the recorded pairs to the file.
+        """
+        with self._lock:
+            interactions = list(self._interactions)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"interactions": interactions}, file, ensure_ascii=False)
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+
+def _delay(entry: CacheEntry, latency: Latency, bandwidth: Optional[float]) -> float:
+    """
+    Compute how long a replayed response takes to arrive.
+    """
+    delay = latency() if callable(latency) else latency
+    if bandwidth:
+        delay += len(entry.content) / bandwidth
+    return delay
+
+
+def _to_response(entry: CacheEntry, request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        entry.status_code,
+        headers=entry.headers,
+        content=entry.content,
+        request=request,
+    )
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """Transport recording responses to a cassette or replaying them.
+
+    Replayed responses can be delayed to simulate a network, so the whole
+    client stack can be benchmarked offline and reproducibly.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        The recorded pairs.
+    transport : Optional[httpx.BaseTransport], optional
+        The transport sending the requests that are recorded. Defaults to
+        None, which uses `httpx.HTTPTransport()`.
+    mode : Literal["replay", "record", "once"], optional
+        "replay" only answers from the cassette, "record" sends every
+        request and records it, "once" replays the recorded requests and
+        records the others. Defaults to "replay".
+    latency : Union[float, Callable[[], float]], optional
+        Seconds waited before a replayed response, or a function returning
+        them, e.g. `lambda: random.lognormvariate(-3, 0.5)`. Defaults to 0.
+    bandwidth : Optional[float], optional
+        Bytes per second a replayed body is delivered at. Defaults to None
+        (no limit).
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        transport: Optional[httpx.BaseTransport] = None,
+        mode: Mode = "replay",
+        latency: Latency = 0.0,
+        bandwidth: Optional[float] = None,
+    ):
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.transport = transport
+        self._recorded = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode != "record":
+            entry = self.cassette.play(request)
+            if entry is not None:
+                time.sleep(_delay(entry, self.latency, self.bandwidth))
+                return _to_response(entry, request)
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No recorded response for {request.method} {request.url}"
+                )
+
+        if self.transport is None:
+            self.transport = httpx.HTTPTransport()
+        response = self.transport.handle_request(request)
+        response.read()
+        self.cassette.record(request, response)
+        self._recorded = True
+        return response
+
+    def close(self) -> None:
+        if self._recorded:
+            self.cassette.save()
+        if self.transport is not None:
+            self.transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """Asynchronous transport recording responses to a cassette or replaying them.
+
+    Replayed responses can be delayed to simulate a network, so the whole
+    client stack can be benchmarked offline and reproducibly.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        The recorded pairs.
+    transport : Optional[httpx.AsyncBaseTransport], optional
+        The transport sending the requests that are recorded. Defaults to
+        None, which uses `httpx.AsyncHTTPTransport()`.
+    mode : Literal["replay", "record", "once"], optional
+        "replay" only answers from the cassette, "record" sends every
+        request and records it, "once" replays the recorded requests and
+        records the others. Defaults to "replay".
+    latency : Union[float, Callable[[], float]], optional
+        Seconds waited before a replayed response, or a function returning
+        them. Defaults to 0.
+    bandwidth : Optional[float], optional
+        Bytes per second a replayed body is delivered at. Defaults to None
+        (no limit).
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        mode: Mode = "replay",
+        latency: Latency = 0.0,
+        bandwidth: Optional[float] = None,
+    ):
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.transport = transport
+        self._recorded = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode != "record":
+            entry = self.cassette.play(request)
+            if entry is not None:
+                await asyncio.sleep(_delay(entry, self.latency, self.bandwidth))
+                return _to_response(entry, request)
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No recorded response for {request.method} {request.url}"
+                )
+
+        if self.transport is None:
+            self.transport = httpx.AsyncHTTPTransport()
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        self.cassette.record(request, response)
+        self._recorded = True
+        return response
+
+    async def aclose(self) -> None:
+        if self._recorded:
+            self.cassette.save()
+        if self.transport is not None:
+            await self.transport.aclose()
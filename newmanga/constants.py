@@ -1,3 +1,5 @@
+import httpx
+
 # Domain section
 api_domain = "neo.newmanga.org"
 api_v2_domain = "api.newmanga.org"
@@ -16,6 +18,18 @@ similar = "https://" + api_v2_domain + "/v2/projects/{slug}/similar"
 chapters = "https://" + api_v2_domain + "/v2/branches/{id}/chapters"
 manga_api = f"https://{api_v2_domain}/v2/projects"
 
+endpoints = {
+    "catalogue": catalogue,
+    "popular": popular,
+    "read_now": read_now,
+    "updates": updates,
+    "tags": tags,
+    "comments": comments,
+    "similar": similar,
+    "chapters": chapters,
+    "manga": manga_api + "/{slug}",
+}
+
 image_storage_url = f"https://{images_storage_domain}/ProjectCard/webp"
 
 # Auth section
@@ -23,3 +37,16 @@ headers = {
     "Accept": "application/json, text/plain, */*",
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
 }
+
+# Connection section
+limits = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=5.0,
+)
+high_throughput_limits = httpx.Limits(
+    max_connections=256,
+    max_keepalive_connections=128,
+    keepalive_expiry=60.0,
+)
+timeout = httpx.Timeout(10.0, connect=5.0)
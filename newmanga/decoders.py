@@ -0,0 +1,84 @@
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+Decoder = Callable[[bytes], Any]
+
+
+def stdlib_decoder(content: bytes) -> Any:
+    """
+    Decode a JSON document with the standard library.
+
+    Parameters
+    ----------
+    content : bytes
+        The raw body of a response.
+
+    Returns
+    -------
+    Any
+        The decoded document.
+    """
+    return json.loads(content)
+
+
+def default_decoder() -> Decoder:
+    """
+    Return the fastest available decoder.
+
+    Returns
+    -------
+    Decoder
+        `orjson.loads` if orjson is installed, otherwise `stdlib_decoder`.
+    """
+    return stdlib_decoder if orjson is None else orjson.loads
+
+
+_decoder: Decoder = default_decoder()
+
+
+def set_decoder(decoder: Optional[Decoder]) -> None:
+    """
+    Replace the decoder of every API response.
+
+    Parameters
+    ----------
+    decoder : Optional[Decoder]
+        A function decoding the raw bytes of a JSON body, e.g.
+        `stdlib_decoder`. None restores `default_decoder()`.
+    """
+    global _decoder
+    _decoder = default_decoder() if decoder is None else decoder
+
+
+def get_decoder() -> Decoder:
+    """
+    Return the decoder of the API responses.
+
+    Returns
+    -------
+    Decoder
+        The decoder in use.
+    """
+    return _decoder
+
+
+def decode(content: bytes) -> Any:
+    """
+    Decode the raw body of a JSON response.
+
+    Parameters
+    ----------
+    content : bytes
+        The raw body of a response.
+
+    Returns
+    -------
+    Any
+        The decoded document.
+    """
+    return _decoder(content)
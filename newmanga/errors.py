@@ -1,2 +1,6 @@
 class CatalogueTooManyRequestsError(Exception):
     pass
+
+
+class CassetteMissError(Exception):
+    pass
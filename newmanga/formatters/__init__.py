@@ -1,6 +1,12 @@
-from typing import Any
+import copy
+import dataclasses
+import time
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
 
 import httpx
+from ..decoders import decode
+from ..interning import InternRegistry
+from ..metrics import PendingCall, count_items
 from ..typing.responses import (
     CatalogueResponse,
     ChaptersResponse,
@@ -13,19 +19,145 @@ from ..typing.responses import (
 )
 from . import json_to_object
 
+T = TypeVar("T")
+
+
+def format_response(
+    response: httpx.Response,
+    kind: str,
+    formatter: Callable[[Any], T],
+    raw: bool = False,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[T, Any]:
+    """
+    Decode the JSON body of a response and convert it with a formatter.
+
+    The raw body is decoded once, by the decoder set in `newmanga.decoders`.
+    When the response was served by a cache transport, the object built from
+    the same unchanged content is reused instead of decoding and formatting
+    the body again. Each caller gets its own shallow copy of that object and
+    of its lists, so adding or removing items does not leak to the other
+    callers; the items themselves are shared and must be treated as
+    read-only. When the call is measured by a
+    `metrics.MetricsTransport`, the decoding and formatting times and the
+    item count are added and the call is recorded, also when the body
+    cannot be converted.
+
+    Parameters
+    ----------
+    response : httpx.Response
+        The response of the API.
+    kind : str
+        The name of the conversion, used to tell apart objects built from
+        the same response.
+    formatter : Callable[[Any], T]
+        Converts the decoded body to the resulting object.
+    raw : bool, optional
+        If true, the decoded body is returned without conversion. Defaults
+        to False.
+    fields : Optional[Sequence[str]], optional
+        The manga fields the formatter projects the mangas to, used to tell
+        apart the objects built with different projections. Unknown names
+        are rejected. Defaults to None.
+
+    Returns
+    -------
+    Union[T, Any]
+        The object built from the response body, or the decoded body.
+
+    Raises
+    ------
+    ValueError
+        If a projected field is not a field of `Manga`.
+    """
+    pending = _pending_metrics(response)
+    try:
+        result = _format_response(response, kind, formatter, raw, fields, pending)
+        if pending is not None:
+            pending.metrics.items = count_items(result)
+        return result
+    finally:
+        # Recorded even if the body could not be converted
+        if pending is not None:
+            pending.record()
+
+
+def _format_response(
+    response: httpx.Response,
+    kind: str,
+    formatter: Callable[[Any], T],
+    raw: bool,
+    fields: Optional[Sequence[str]],
+    pending: Optional[PendingCall],
+) -> Union[T, Any]:
+    """
+    Convert the body of a response, timing it for the pending measurements.
+    """
+    if fields is not None and not raw:
+        json_to_object.check_fields(fields)
+        kind = kind + ":" + ",".join(fields)
+
+    def build() -> Any:
+        if pending is None:
+            data = decode(response.content)
+            return data if raw else formatter(data)
+        metrics = pending.metrics
+        started = time.perf_counter()
+        data = decode(response.content)
+        decoded = time.perf_counter()
+        result = data if raw else formatter(data)
+        metrics.decode_seconds = decoded - started
+        metrics.format_seconds = time.perf_counter() - decoded
+        return result
+
+    handle = response.extensions.get("newmanga_cache")
+    if raw or handle is None:
+        return build()
+    return _detach(handle.get_or_create(kind, build))
+
+
+def _detach(value: T) -> T:
+    """
+    Return a shallow copy of a shared object with its lists copied too.
+    """
+    if isinstance(value, dict):
+        return dict(value)
+    detached = copy.copy(value)
+    for item in dataclasses.fields(detached):
+        attribute = getattr(detached, item.name)
+        if isinstance(attribute, list):
+            setattr(detached, item.name, list(attribute))
+    return detached
+
+
+def _pending_metrics(response: httpx.Response) -> Optional[PendingCall]:
+    """
+    Return the measurements left on the response by a `MetricsTransport`,
+    unless they were recorded already.
+    """
+    pending = response.extensions.get("newmanga_metrics")
+    if pending is None or pending.recorded:
+        return None
+    return pending
+
 
 def json_to_catalogue_reponse(
-    client: httpx.Client, data: dict[str, Any]
+    client: httpx.Client | httpx.AsyncClient,
+    data: dict[str, Any],
+    fields: Optional[Sequence[str]] = None,
 ) -> CatalogueResponse:
     """
     Convert JSON data to a CatalogueResponse object.
 
     Parameters
     ----------
-    client : httpx.Client
+    client : httpx.Client | httpx.AsyncClient
         An instance of the HTTP client.
     data : dict[str, Any]
         A dictionary containing catalogue data.
+    fields : Optional[Sequence[str]], optional
+        If given, each manga is a dictionary of these fields only. Defaults
+        to None.
 
     Returns
     -------
@@ -37,28 +169,34 @@ def json_to_catalogue_reponse(
         found=data["found"],
         total=data["out_of"],
         mangas=[
-            json_to_object.json_to_manga(client, row["document"])
+            json_to_object.json_to_manga(
+                client, row["document"], lazy=True, fields=fields
+            )
             for row in data["hits"]
         ],
     )
 
 
 def json_to_popular_response(
-    client: httpx.Client,
+    client: httpx.Client | httpx.AsyncClient,
     data: dict[str, Any],
     page: int,
+    fields: Optional[Sequence[str]] = None,
 ) -> PopularResponse:
     """
     Convert JSON data to a PopularResponse object.
 
     Parameters
     ----------
-    client : httpx.Client
+    client : httpx.Client | httpx.AsyncClient
         An instance of the HTTP client.
     data : dict[str, Any]
         The JSON data containing popular manga information.
     page : int
         The current page number.
+    fields : Optional[Sequence[str]], optional
+        If given, each manga is a dictionary of these fields only. Defaults
+        to None.
 
     Returns
     -------
@@ -68,23 +206,30 @@ def json_to_popular_response(
     return PopularResponse(
         page=page,
         total=data["count"],
-        mangas=[json_to_object.json_to_manga(client, row) for row in data["items"]],
+        mangas=[
+            json_to_object.json_to_manga(client, row, lazy=True, fields=fields)
+            for row in data["items"]
+        ],
     )
 
 
 def json_to_read_now_response(
-    client: httpx.Client,
+    client: httpx.Client | httpx.AsyncClient,
     data: list[dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
 ) -> ReadNowResponse:
     """
     Convert JSON data to a ReadNowResponse object.
 
     Parameters
     ----------
-    client : httpx.Client
+    client : httpx.Client | httpx.AsyncClient
         An instance of the HTTP client.
     data : list[dict[str, Any]]
         The JSON data containing 'Read Now' manga information.
+    fields : Optional[Sequence[str]], optional
+        If given, each manga is a dictionary of these fields only. Defaults
+        to None.
 
     Returns
     -------
@@ -93,26 +238,33 @@ def json_to_read_now_response(
     """
     return ReadNowResponse(
         total=len(data),
-        mangas=[json_to_object.json_to_manga(client, row) for row in data],
+        mangas=[
+            json_to_object.json_to_manga(client, row, lazy=True, fields=fields)
+            for row in data
+        ],
     )
 
 
 def json_to_updates_response(
-    client: httpx.Client,
+    client: httpx.Client | httpx.AsyncClient,
     data: dict[str, Any],
     page: int,
+    fields: Optional[Sequence[str]] = None,
 ) -> UpdatesResponse:
     """
     Convert JSON data to an UpdatesResponse object.
 
     Parameters
     ----------
-    client : httpx.Client
+    client : httpx.Client | httpx.AsyncClient
         An instance of the HTTP client.
     data : dict[str, Any]
         The JSON data containing manga updates information.
     page : int
         The current page number.
+    fields : Optional[Sequence[str]], optional
+        If given, each manga is a dictionary of these fields only. Defaults
+        to None.
 
     Returns
     -------
@@ -122,12 +274,16 @@ def json_to_updates_response(
     return UpdatesResponse(
         page=page,
         total=data["count"],
-        mangas=[json_to_object.json_to_manga(client, row) for row in data["items"]],
+        mangas=[
+            json_to_object.json_to_manga(client, row, lazy=True, fields=fields)
+            for row in data["items"]
+        ],
     )
 
 
 def json_to_tags_response(
     data: list[dict[str, Any]],
+    registry: Optional[InternRegistry] = None,
 ) -> TagsResponse:
     """
     Convert JSON data to a TagsResponse object.
@@ -136,18 +292,23 @@ def json_to_tags_response(
     ----------
     data : list[dict[str, Any]]
         The JSON data containing tags information.
+    registry : Optional[InternRegistry], optional
+        If given, the tags are the instances shared through it. Defaults to
+        None.
 
     Returns
     -------
     TagsResponse
         A TagsResponse object containing the parsed and sorted tags data.
     """
-    tags = [json_to_object.json_to_tag(row) for row in data]
+    tags = [json_to_object.json_to_tag(row, registry) for row in data]
     tags.sort(key=lambda tag: tag.id if tag.id else 0)
     return TagsResponse(tags=tags, total=len(data))
 
 
-def json_to_comments_response(data: list[dict[str, Any]]) -> CommentsResponse:
+def json_to_comments_response(
+    data: list[dict[str, Any]], registry: Optional[InternRegistry] = None
+) -> CommentsResponse:
     """
     Converts a list of dictionaries representing comments to a CommentsResponse object.
 
@@ -155,6 +316,9 @@ def json_to_comments_response(data: list[dict[str, Any]]) -> CommentsResponse:
     ----------
     data : list[dict[str, Any]]
         A list of dictionaries, each representing a comment.
+    registry : Optional[InternRegistry], optional
+        If given, the authors of the comments are the instances shared
+        through it. Defaults to None.
 
     Returns
     -------
@@ -162,22 +326,27 @@ def json_to_comments_response(data: list[dict[str, Any]]) -> CommentsResponse:
         An object containing the list of comments.
     """
     return CommentsResponse(
-        comments=[json_to_object.json_to_comment(row) for row in data]
+        comments=[json_to_object.json_to_comment(row, registry) for row in data]
     )
 
 
 def json_to_similar_response(
-    client: httpx.Client, data: list[dict[str, Any]]
+    client: httpx.Client | httpx.AsyncClient,
+    data: list[dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
 ) -> SimilarResponse:
     """
     Converts a list of dictionaries representing similar manga to a SimilarResponse object.
 
     Parameters
     ----------
-    client : httpx.Client
+    client : httpx.Client | httpx.AsyncClient
         An instance of the HTTP client.
     data : list[dict[str, Any]]
         A list of dictionaries, each representing a similar manga.
+    fields : Optional[Sequence[str]], optional
+        If given, each manga is a dictionary of these fields only. Defaults
+        to None.
 
     Returns
     -------
@@ -185,7 +354,10 @@ def json_to_similar_response(
         An object containing the list of similar manga.
     """
     return SimilarResponse(
-        mangas=[json_to_object.json_to_manga(client, row) for row in data]
+        mangas=[
+            json_to_object.json_to_manga(client, row, lazy=True, fields=fields)
+            for row in data
+        ]
     )
 
 
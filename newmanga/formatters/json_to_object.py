@@ -1,33 +1,101 @@
 import httpx
-from typing import Any
+from dataclasses import fields as dataclass_fields
+from typing import Any, Optional, Sequence, Union
 from datetime import datetime
-from .manga import MangaFormatter
+from .manga import MangaFormatter, convert_manga
 from ..constants import image_storage_url
-from ..api.manga import Manga
-from ..typing.types import Tag, User, Comment, Chapter
+from ..api.manga import AsyncLazyManga, AsyncManga, LazyManga, Manga
+from ..interning import InternRegistry, registry_for
+from ..typing.types import (
+    Branch,
+    Chapter,
+    Comment,
+    Genre,
+    Member,
+    Tag,
+    Team,
+    Translator,
+    User,
+)
 
 
-def json_to_manga(client: httpx.Client, data: dict[str, Any]) -> Manga:
+MANGA_FIELDS = frozenset(
+    field.name for field in dataclass_fields(Manga) if field.name != "_client"
+)
+
+
+def check_fields(fields: Sequence[str]) -> None:
+    """
+    Ensure every projected name is a field of `Manga`.
+
+    Parameters
+    ----------
+    fields : Sequence[str]
+        The names of the projected fields.
+
+    Raises
+    ------
+    ValueError
+        If a name is not a field of `Manga`.
+    """
+    if isinstance(fields, str):
+        raise ValueError("fields must be a sequence of field names, not a string")
+    unknown = [name for name in fields if name not in MANGA_FIELDS]
+    if unknown:
+        raise ValueError("Unknown manga fields: " + ", ".join(unknown))
+
+
+def json_to_manga(
+    client: httpx.Client | httpx.AsyncClient,
+    data: dict[str, Any],
+    lazy: bool = False,
+    fields: Optional[Sequence[str]] = None,
+) -> Union[Manga, dict[str, Any]]:
     """
     Convert JSON data to a Manga object.
 
+    An `AsyncManga` is returned when the client is an `httpx.AsyncClient`.
+
     Parameters
     ----------
-    client : httpx.Client
+    client : httpx.Client | httpx.AsyncClient
         An instance of the HTTP client used for making API requests.
     data : dict[str, Any]
         A dictionary containing manga data with various attributes.
+    lazy : bool, optional
+        If true, a `LazyManga` (or `AsyncLazyManga`) converting each field on
+        first access is returned. Defaults to False.
+    fields : Optional[Sequence[str]], optional
+        If given, only these fields are converted and returned in a
+        dictionary instead of a Manga. Defaults to None.
 
     Returns
     -------
-    Manga
+    Union[Manga, dict[str, Any]]
         A Manga object initialized with the data from the input dictionary,
         containing attributes such as title, description, chapters, etc.
     """
-    return Manga(_client=client, **MangaFormatter(data).get_vars())
+    if fields is not None:
+        formatter = MangaFormatter(data, lazy=True, registry=registry_for(client))
+        return {name: formatter.load(name) for name in fields}
+    if isinstance(client, httpx.AsyncClient):
+        if lazy:
+            return AsyncLazyManga.from_data(client, data)
+        return AsyncManga(
+            _client=client,
+            **convert_manga(data, registry_for(client)),
+        )
+    if lazy:
+        return LazyManga.from_data(client, data)
+    return Manga(
+        _client=client,
+        **convert_manga(data, registry_for(client)),
+    )
 
 
-def json_to_user(data: dict[str, Any]) -> User:
+def json_to_user(
+    data: dict[str, Any], registry: Optional[InternRegistry] = None
+) -> User:
     """
     Convert JSON data to a User object.
 
@@ -44,6 +112,9 @@ def json_to_user(data: dict[str, Any]) -> User:
         - 'last_login': ISO format string of last login time
         - 'is_online': Boolean indicating if the user is currently online
         - 'image': A dictionary containing 'name' key for the user's image
+    registry : Optional[InternRegistry], optional
+        If given, the instance shared for the user id is returned. Defaults
+        to None.
 
     Returns
     -------
@@ -51,6 +122,8 @@ def json_to_user(data: dict[str, Any]) -> User:
         A User object containing the parsed data with attributes corresponding
         to the input dictionary keys.
     """
+    if registry is not None:
+        return registry.get_or_create(User, data["id"], lambda: json_to_user(data))
     return User(
         id=data["id"],
         name=data["name"],
@@ -64,7 +137,9 @@ def json_to_user(data: dict[str, Any]) -> User:
     )
 
 
-def json_to_comment(data: dict[str, Any]) -> Comment:
+def json_to_comment(
+    data: dict[str, Any], registry: Optional[InternRegistry] = None
+) -> Comment:
     """
     Convert JSON data to a Comment object.
 
@@ -84,6 +159,9 @@ def json_to_comment(data: dict[str, Any]) -> Comment:
         - 'dislikes': Number of dislikes
         - 'rating': The comment's rating
         - 'parent_id': ID of the parent comment (optional)
+    registry : Optional[InternRegistry], optional
+        If given, the authors of the comments are shared instances. Defaults
+        to None.
 
     Returns
     -------
@@ -97,9 +175,9 @@ def json_to_comment(data: dict[str, Any]) -> Comment:
         chapter_id=data.get("chapter_id"),
         manga_id=data.get("project_id"),
         team_id=data.get("team_id"),
-        user=json_to_user(data["user"]),
+        user=json_to_user(data["user"], registry),
         created_at=datetime.fromisoformat(data["created_at"]),
-        answers=[json_to_comment(answer) for answer in data["children"]],
+        answers=[json_to_comment(answer, registry) for answer in data["children"]],
         likes=data["likes"],
         dislikes=data["dislikes"],
         rating=data["rating"],
@@ -148,7 +226,7 @@ def json_to_chapter(data: dict[str, Any]) -> Chapter:
     )
 
 
-def json_to_tag(data: dict[str, Any]) -> Tag:
+def json_to_tag(data: dict[str, Any], registry: Optional[InternRegistry] = None) -> Tag:
     """
     Convert JSON data to a Tag object.
 
@@ -161,6 +239,9 @@ def json_to_tag(data: dict[str, Any]) -> Tag:
             - 'ru': Russian title
             - 'en': English title
             - 'original': Original language title
+    registry : Optional[InternRegistry], optional
+        If given, the instance shared for the tag id is returned. Defaults
+        to None.
 
     Returns
     -------
@@ -171,9 +252,141 @@ def json_to_tag(data: dict[str, Any]) -> Tag:
         - title_en: English title
         - title_original: Original language title
     """
+    if registry is not None:
+        return registry.get_or_create(Tag, data["id"], lambda: json_to_tag(data))
     return Tag(
         id=data["id"],
         title_ru=data["title"]["ru"],
         title_en=data["title"]["en"],
         title_original=data["title"]["original"],
     )
+
+
+def json_to_genre(
+    data: dict[str, Any], registry: Optional[InternRegistry] = None
+) -> Genre:
+    """
+    Convert JSON data to a Genre object.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        A dictionary containing genre information with the following keys:
+        - 'id': The genre's identifier
+        - 'title': A nested dictionary with language-specific titles
+    registry : Optional[InternRegistry], optional
+        If given, the instance shared for the genre id is returned. Defaults
+        to None.
+
+    Returns
+    -------
+    Genre
+        A Genre object containing the parsed data.
+    """
+    if registry is not None:
+        return registry.get_or_create(Genre, data["id"], lambda: json_to_genre(data))
+    return Genre(
+        id=data["id"],
+        title_ru=data["title"]["ru"],
+        title_en=data["title"]["en"],
+        title_original=data["title"]["original"],
+    )
+
+
+def json_to_team(
+    data: dict[str, Any], registry: Optional[InternRegistry] = None
+) -> Team:
+    """
+    Convert JSON data to a Team object.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        A dictionary containing team information with the following keys:
+        - 'id': The team's identifier
+        - 'name': The team's name
+        - 'image': A dictionary containing 'name' key for the team's image
+        - 'members': A list of dictionaries representing the members (optional)
+    registry : Optional[InternRegistry], optional
+        If given, the instance shared for the team id is returned, and its
+        members are shared users. Defaults to None.
+
+    Returns
+    -------
+    Team
+        A Team object containing the parsed data.
+    """
+    if registry is not None:
+        return registry.get_or_create(
+            Team, data["id"], lambda: _json_to_team(data, registry)
+        )
+    return _json_to_team(data, None)
+
+
+def _json_to_team(data: dict[str, Any], registry: Optional[InternRegistry]) -> Team:
+    return Team(
+        id=data["id"],
+        name=data["name"],
+        image_url=image_storage_url + "/" + data["image"]["name"],
+        members=[
+            Member(
+                id=member["id"],
+                statuses=member["statuses"],
+                user=json_to_user(member["user"], registry)
+                if member.get("user")
+                else None,
+            )
+            for member in data["members"]
+        ]
+        if data.get("members")
+        else [],
+    )
+
+
+def json_to_branch(
+    data: dict[str, Any], registry: Optional[InternRegistry] = None
+) -> Branch:
+    """
+    Convert JSON data to a Branch object.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        A dictionary containing branch information with the following keys:
+        - 'id': The branch's identifier
+        - 'chapters_total': Number of chapters (optional)
+        - 'likes_total': Number of likes (optional)
+        - 'is_default': Whether the branch is the default one (optional)
+        - 'subscription': Subscription information (optional)
+        - 'translators': A list of dictionaries representing the translators
+    registry : Optional[InternRegistry], optional
+        If given, the users and teams of the translators are shared
+        instances. Defaults to None.
+
+    Returns
+    -------
+    Branch
+        A Branch object containing the parsed data.
+    """
+    return Branch(
+        id=data["id"],
+        chapters_total=data.get("chapters_total"),
+        likes_total=data.get("likes_total"),
+        is_default=data.get("is_default"),
+        subscription=data.get("subscription"),
+        translators=[
+            Translator(
+                id=translator["id"],
+                balance=translator.get("balance"),
+                is_team=translator["is_team"],
+                is_verified=translator["is_verified"],
+                user=json_to_user(translator["user"], registry)
+                if translator.get("user")
+                else None,
+                team=json_to_team(translator["team"], registry)
+                if translator.get("team")
+                else None,
+            )
+            for translator in data["translators"]
+        ],
+    )
@@ -1,20 +1,269 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from ..typing.enums import MangaType, MangaStatus
 from ..typing.types import (
     Artist,
     Author,
     Branch,
     Genre,
-    Member,
     Tag,
-    Translator,
-    Team,
 )
 from ..constants import image_storage_url, manga
+from ..interning import InternRegistry
 from . import json_to_object
 
 
+Loader = Callable[[Dict[str, Any], Optional["InternRegistry"]], Any]
+
+_MANGA_TYPES = {member.value: member for member in MangaType}
+_MANGA_STATUSES = {member.value: member for member in MangaStatus}
+
+
+def manga_type(value: Any) -> MangaType:
+    """
+    Return the manga type of a raw value, using a cached lookup.
+
+    Parameters
+    ----------
+    value : Any
+        The raw value of the type.
+
+    Returns
+    -------
+    MangaType
+        The matching member.
+
+    Raises
+    ------
+    ValueError
+        If the value is not a manga type.
+    """
+    member = _MANGA_TYPES.get(value)
+    return MangaType(value) if member is None else member
+
+
+def manga_status(value: Any) -> Optional[MangaStatus]:
+    """
+    Return the manga status of a raw value, using a cached lookup.
+
+    Parameters
+    ----------
+    value : Any
+        The raw value of the status.
+
+    Returns
+    -------
+    Optional[MangaStatus]
+        The matching member, or None if the value is empty.
+
+    Raises
+    ------
+    ValueError
+        If the value is not a manga status.
+    """
+    if not value:
+        return None
+    member = _MANGA_STATUSES.get(value)
+    return MangaStatus(value) if member is None else member
+
+
+def parse_date(value: str) -> datetime:
+    """
+    Parse a `YYYY-MM-DD` release date.
+
+    Parameters
+    ----------
+    value : str
+        The raw date.
+
+    Returns
+    -------
+    datetime
+        The date at midnight.
+
+    Raises
+    ------
+    ValueError
+        If the value is not a date in this format.
+    """
+    if len(value) == 10:
+        # Several times faster than strptime for the same format
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def titled(kind: type, title: str, registry: Optional[InternRegistry]) -> Any:
+    """
+    Build a genre or tag known only by its Russian title.
+
+    Parameters
+    ----------
+    kind : type
+        `Genre` or `Tag`.
+    title : str
+        The Russian title.
+    registry : Optional[InternRegistry]
+        If given, the instance shared for the title is returned.
+
+    Returns
+    -------
+    Any
+        The genre or tag.
+    """
+    if registry is None:
+        return kind(title_ru=title)
+    return registry.get_or_create(kind, title, lambda: kind(title_ru=title))
+
+
+def _person(kind: type, data: Optional[dict[str, Any]]) -> Any:
+    """
+    Build the author or artist of a manga.
+    """
+    if not data:
+        return None
+    return kind(
+        id=data["id"],
+        name=data["name"],
+        description=data["description"],
+        image_url=image_storage_url + "/" + data["image"]["name"],
+    )
+
+
+def _key(name: str) -> Loader:
+    """
+    Build the loader of a field copied from the raw data as is.
+    """
+    return lambda data, registry: data.get(name)
+
+
+def _id(data: Dict[str, Any], registry: Optional[InternRegistry]) -> Optional[int]:
+    return int(data["id"]) if data.get("id") else None
+
+
+def _title(language: str) -> Loader:
+    """
+    Build the loader of a title, nested in projects and flat in documents.
+    """
+    flat = "title_" + language
+
+    def load(data: Dict[str, Any], registry: Optional[InternRegistry]) -> Any:
+        title = data.get("title")
+        return title[language] if title else data.get(flat)
+
+    return load
+
+
+def _image(data: Dict[str, Any], registry: Optional[InternRegistry]) -> str:
+    image = data.get("image")
+    return (
+        image_storage_url
+        + "/"
+        + str(image["name"] if image else data.get("image_large"))
+    )
+
+
+def _type(data: Dict[str, Any], registry: Optional[InternRegistry]) -> MangaType:
+    return manga_type(data.get("type"))
+
+
+def _status(name: str) -> Loader:
+    """
+    Build the loader of a publication status.
+    """
+    return lambda data, registry: manga_status(data.get(name))
+
+
+def _titled_list(name: str, kind: type, converter: str) -> Loader:
+    """
+    Build the loader of the genres or tags, given by their Russian title in
+    documents and as objects in projects, converted by the named function
+    of `json_to_object`.
+    """
+
+    def load(data: Dict[str, Any], registry: Optional[InternRegistry]) -> list[Any]:
+        values = data.get(name)
+        if not values:
+            return []
+        if isinstance(values[0], str):
+            return [titled(kind, value, registry) for value in values]
+        convert = getattr(json_to_object, converter)
+        return [convert(value, registry) for value in values]
+
+    return load
+
+
+def _person_loader(name: str, kind: type) -> Loader:
+    """
+    Build the loader of the author or artist.
+    """
+    return lambda data, registry: _person(kind, data.get(name))
+
+
+def _release_date(
+    data: Dict[str, Any], registry: Optional[InternRegistry]
+) -> Optional[datetime]:
+    released_at = data.get("released_at")
+    if released_at:
+        return datetime.fromtimestamp(released_at)
+    release_date = data.get("release_date")
+    return parse_date(release_date) if release_date else None
+
+
+def _adult(data: Dict[str, Any], registry: Optional[InternRegistry]) -> Optional[int]:
+    adult = data.get("adult")
+    return int(adult) if adult else None
+
+
+def _branches(data: Dict[str, Any], registry: Optional[InternRegistry]) -> list[Any]:
+    branches = data.get("branches")
+    if not branches:
+        return []
+    return [json_to_object.json_to_branch(branch, registry) for branch in branches]
+
+
+def _url(data: Dict[str, Any], registry: Optional[InternRegistry]) -> str:
+    return manga + "/" + data["slug"]
+
+
+# The loader of every Manga field, except the client. Each one accepts both
+# shapes of the API: catalogue documents (flat titles, `image_large`, genres
+# and tags given by their Russian title, `released_at`) and v2 projects
+# (nested title and image, genre and tag objects, `release_date`). They
+# convert single fields, for lazy mangas and projections; whole mangas of a
+# known shape go through `convert_document` or `convert_project`, which must
+# give the same values.
+FIELD_LOADERS: dict[str, Loader] = {
+    "id": _id,
+    "title_ru": _title("ru"),
+    "title_en": _title("en"),
+    "title_original": _title("original"),
+    "image": _image,
+    "type": _type,
+    "rating": _key("rating"),
+    "rating_count": lambda data, registry: None,
+    "hearts": _key("hearts"),
+    "views": _key("views"),
+    "bookmarks": _key("bookmarks"),
+    "status": _status("status"),
+    "description": _key("description"),
+    "genres": _titled_list("genres", Genre, "json_to_genre"),
+    "tags": _titled_list("tags", Tag, "json_to_tag"),
+    "author": _person_loader("author", Author),
+    "artist": _person_loader("artist", Artist),
+    "release_date": _release_date,
+    "adult": _adult,
+    "tomes": _key("tomes"),
+    "count_chapters": _key("count_chapters"),
+    "original_status": _status("original_status"),
+    "slug": _key("slug"),
+    "branches": _branches,
+    "url": _url,
+    "original_url": _key("original_url"),
+    "english_url": _key("english_url"),
+    "other_url": _key("other_url"),
+}
+
+
 class MangaFormatter:
     """Formatter for converting raw manga data into a structured Manga object.
 
@@ -24,7 +273,14 @@ class MangaFormatter:
         A dictionary containing raw manga data.
     """
 
-    def __init__(self, data: Dict[str, Any]):
+    registry: Optional[InternRegistry] = None
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        lazy: bool = False,
+        registry: Optional[InternRegistry] = None,
+    ):
         """
         Initialize the MangaFormatter with raw data.
 
@@ -32,8 +288,20 @@ class MangaFormatter:
         ----------
         data : Dict[str, Any]
             A dictionary containing raw manga data.
+        lazy : bool, optional
+            If true, no field is loaded, nor set to its default, until
+            `load` is called for it. Defaults to False.
+        registry : Optional[InternRegistry], optional
+            If given, the genres, tags, users and teams are the instances
+            shared through it. Defaults to None.
         """
         self.data = data
+        if registry is not None:
+            # Set only when given, keeping the instance dictionary compact
+            self.registry = registry
+        if lazy:
+            # Fields are set by `load` only, keeping the instance compact
+            return
         self.id: Optional[int] = None
         self.title_ru: Optional[str] = None
         self.title_en: Optional[str] = None
@@ -62,312 +330,35 @@ class MangaFormatter:
         self.original_url: Optional[str] = None
         self.english_url: Optional[str] = None
         self.other_url: Optional[str] = None
-
         self._load_variables()
 
     def _load_variables(self) -> None:
         """
         Load all variables from the raw data dictionary.
         """
-        self._load_id()
-        self._load_title_ru()
-        self._load_title_en()
-        self._load_title_original()
-        self._load_image()
-        self._load_type()
-        self._load_rating()
-        self._load_hearts()
-        self._load_views()
-        self._load_bookmarks()
-        self._load_status()
-        self._load_description()
-        self._load_genres()
-        self._load_tags()
-        self._load_author()
-        self._load_artist()
-        self._load_release_date()
-        self._load_adult()
-        self._load_tomes()
-        self._load_count_chapters()
-        self._load_original_status()
-        self._load_slug()
-        self._load_branches()
-        self._load_url()
-        self._load_original_url()
-        self._load_english_url()
-        self._load_other_url()
-
-    def _load_id(self) -> None:
-        """
-        Load the manga ID from the raw data.
-        """
-        self.id = int(self.data["id"]) if self.data.get("id") else None
+        for name, load in FIELD_LOADERS.items():
+            setattr(self, name, load(self.data, self.registry))
 
-    def _load_title_ru(self) -> None:
+    def load(self, name: str) -> Any:
         """
-        Load the Russian title from the raw data.
-        """
-        self.title_ru = (
-            self.data["title"]["ru"]
-            if self.data.get("title")
-            else self.data.get("title_ru")
-        )
-
-    def _load_title_en(self) -> None:
-        """
-        Load the English title from the raw data.
-        """
-        self.title_en = (
-            self.data["title"]["en"]
-            if self.data.get("title")
-            else self.data.get("title_en")
-        )
-
-    def _load_title_original(self) -> None:
-        """
-        Load the original title from the raw data.
-        """
-        self.title_original = (
-            self.data["title"]["original"]
-            if self.data.get("title")
-            else self.data.get("title_original")
-        )
-
-    def _load_image(self) -> None:
-        """
-        Load the image URL from the raw data.
-        """
-        self.image = (
-            image_storage_url
-            + "/"
-            + str(
-                self.data["image"]["name"]
-                if self.data.get("image")
-                else self.data.get("image_large")
-            )
-        )
-
-    def _load_type(self) -> None:
-        """
-        Load the manga type from the raw data.
-        """
-        self.type = MangaType(self.data.get("type"))
+        Load a single variable from the raw data dictionary.
 
-    def _load_rating(self) -> None:
-        """
-        Load the rating from the raw data.
-        """
-        self.rating = self.data.get("rating")
-
-    def _load_hearts(self) -> None:
-        """
-        Load the number of hearts (likes) from the raw data.
-        """
-        self.hearts = self.data.get("hearts")
-
-    def _load_views(self) -> None:
-        """
-        Load the number of views from the raw data.
-        """
-        self.views = self.data.get("views")
-
-    def _load_bookmarks(self) -> None:
-        """
-        Load the number of bookmarks from the raw data.
-        """
-        self.bookmarks = self.data.get("bookmarks")
-
-    def _load_status(self) -> None:
-        """
-        Load the manga status from the raw data.
-        """
-        if self.data.get("status"):
-            self.status = MangaStatus(self.data.get("status"))
-
-    def _load_description(self) -> None:
-        """
-        Load the description from the raw data.
-        """
-        self.description = self.data.get("description")
-
-    def _load_genres(self) -> None:
-        """
-        Load the genres from the raw data.
-        """
-        if self.data.get("genres") is None:
-            return
-
-        if len(self.data["genres"]) == 0:
-            return
-
-        if isinstance(self.data["genres"][0], str):
-            self.genres = [Genre(title_ru=genre) for genre in self.data["genres"]]
-        else:
-            self.genres = [
-                Genre(
-                    id=genre["id"],
-                    title_ru=genre["title"]["ru"],
-                    title_en=genre["title"]["en"],
-                    title_original=genre["title"]["original"],
-                )
-                for genre in self.data["genres"]
-            ]
-
-    def _load_tags(self) -> None:
-        """
-        Load the tags from the raw data.
-        """
-        if self.data.get("tags") is None:
-            return
-
-        if len(self.data["tags"]) == 0:
-            return
-
-        if isinstance(self.data["tags"][0], str):
-            self.tags = [Tag(title_ru=tag) for tag in self.data["tags"]]
-        else:
-            self.tags = [json_to_object.json_to_tag(tag) for tag in self.data["tags"]]
-
-    def _load_author(self) -> None:
-        """
-        Load the author from the raw data.
-        """
-        if self.data.get("author"):
-            self.author = Author(
-                id=self.data["author"]["id"],
-                name=self.data["author"]["name"],
-                description=self.data["author"]["description"],
-                image_url=image_storage_url
-                + "/"
-                + self.data["author"]["image"]["name"],
-            )
-
-    def _load_artist(self) -> None:
-        """
-        Load the artist from the raw data.
-        """
-        if self.data.get("artist"):
-            self.artist = Artist(
-                id=self.data["artist"]["id"],
-                name=self.data["artist"]["name"],
-                description=self.data["artist"]["description"],
-                image_url=image_storage_url
-                + "/"
-                + self.data["artist"]["image"]["name"],
-            )
-
-    def _load_release_date(self) -> None:
-        """
-        Load the release date from the raw data.
-        """
-        if self.data.get("released_at"):
-            self.release_date = datetime.fromtimestamp(self.data["released_at"])
-        elif self.data.get("release_date"):
-            self.release_date = datetime.strptime(self.data["release_date"], "%Y-%m-%d")
-
-    def _load_adult(self) -> None:
-        """
-        Load the adult rating from the raw data.
-        """
-        self.adult = int(self.data["adult"]) if self.data.get("adult") else None
-
-    def _load_tomes(self) -> None:
-        """
-        Load the list of tomes from the raw data.
-        """
-        self.tomes = self.data.get("tomes")
-
-    def _load_count_chapters(self) -> None:
-        """
-        Load the number of chapters from the raw data.
-        """
-        self.count_chapters = self.data.get("count_chapters")
-
-    def _load_original_status(self) -> None:
-        """
-        Load the original status from the raw data.
-        """
-        if self.data.get("original_status"):
-            self.original_status = MangaStatus(self.data.get("original_status"))
-
-    def _load_slug(self) -> None:
-        """
-        Load the slug from the raw data.
-        """
-        self.slug = self.data.get("slug")
-
-    def _load_branches(self) -> None:
-        """
-        Load the branches from the raw data.
-        """
-        if self.data.get("branches"):
-            self.branches = [
-                Branch(
-                    id=branch["id"],
-                    chapters_total=branch.get("chapters_total"),
-                    likes_total=branch.get("likes_total"),
-                    is_default=branch.get("is_default"),
-                    subscription=branch.get("subscription"),
-                    translators=[
-                        Translator(
-                            id=translator["id"],
-                            balance=translator.get("balance"),
-                            is_team=translator["is_team"],
-                            is_verified=translator["is_verified"],
-                            user=json_to_object.json_to_user(translator["user"])
-                            if translator.get("user")
-                            else None,
-                            team=Team(
-                                id=translator["team"]["id"],
-                                name=translator["team"]["name"],
-                                image_url=image_storage_url
-                                + "/"
-                                + translator["team"]["image"]["name"],
-                                members=[
-                                    Member(
-                                        id=member["id"],
-                                        statuses=member["statuses"],
-                                        user=json_to_object.json_to_user(member["user"])
-                                        if member.get("user")
-                                        else None,
-                                    )
-                                    for member in translator["team"]["members"]
-                                ]
-                                if translator["team"].get("members")
-                                else [],
-                            )
-                            if translator.get("team")
-                            else None,
-                        )
-                        for translator in branch["translators"]
-                    ],
-                )
-                for branch in self.data["branches"]
-            ]
-
-    def _load_url(self) -> None:
-        """
-        Load the NewManga URL from the raw data.
-        """
-        self.url = manga + "/" + self.data["slug"]
-
-    def _load_original_url(self) -> None:
-        """
-        Load the original URL from the raw data.
-        """
-        self.original_url = self.data.get("original_url")
-
-    def _load_english_url(self) -> None:
-        """
-        Load the English URL from the raw data.
-        """
-        self.english_url = self.data.get("english_url")
+        Parameters
+        ----------
+        name : str
+            The name of the variable to load.
 
-    def _load_other_url(self) -> None:
-        """
-        Load the other URL from the raw data.
+        Returns
+        -------
+        Any
+            The loaded value, or its default if the variable has no loader.
         """
-        self.other_url = self.data.get("other_url")
+        load = FIELD_LOADERS.get(name)
+        if load is None:
+            return getattr(self, name)
+        value = load(self.data, self.registry)
+        setattr(self, name, value)
+        return value
 
     def get_vars(self) -> dict[str, Any]:
         """
@@ -380,6 +371,206 @@ class MangaFormatter:
         """
         vars = self.__dict__
         vars.pop("data")
+        vars.pop("registry", None)
         if vars.get("created_at"):
             vars.pop("created_at")
         return vars
+
+
+def convert_document(
+    data: Dict[str, Any], registry: Optional[InternRegistry] = None
+) -> dict[str, Any]:
+    """
+    Convert a manga document of the catalogue search to Manga fields.
+
+    Documents have flat titles, an `image_large` file name, genres and tags
+    given by their Russian title, and a `released_at` timestamp.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        The raw document.
+    registry : Optional[InternRegistry], optional
+        If given, the genres and tags are shared instances. Defaults to None.
+
+    Returns
+    -------
+    dict[str, Any]
+        The keyword arguments of `Manga`, except the client.
+    """
+    genres = data.get("genres")
+    tags = data.get("tags")
+    released_at = data.get("released_at")
+    release_date = data.get("release_date")
+    adult = data.get("adult")
+    branches = data.get("branches")
+    return {
+        "id": int(data["id"]) if data.get("id") else None,
+        "title_ru": data.get("title_ru"),
+        "title_en": data.get("title_en"),
+        "title_original": data.get("title_original"),
+        "image": image_storage_url + "/" + str(data.get("image_large")),
+        "type": manga_type(data.get("type")),
+        "rating": data.get("rating"),
+        "rating_count": None,
+        "hearts": data.get("hearts"),
+        "views": data.get("views"),
+        "bookmarks": data.get("bookmarks"),
+        "status": manga_status(data.get("status")),
+        "description": data.get("description"),
+        "genres": [titled(Genre, genre, registry) for genre in genres]
+        if genres
+        else [],
+        "tags": [titled(Tag, tag, registry) for tag in tags] if tags else [],
+        "author": _person(Author, data.get("author")),
+        "artist": _person(Artist, data.get("artist")),
+        "release_date": datetime.fromtimestamp(released_at)
+        if released_at
+        else parse_date(release_date)
+        if release_date
+        else None,
+        "adult": int(adult) if adult else None,
+        "tomes": data.get("tomes"),
+        "count_chapters": data.get("count_chapters"),
+        "original_status": manga_status(data.get("original_status")),
+        "slug": data.get("slug"),
+        "branches": [
+            json_to_object.json_to_branch(branch, registry) for branch in branches
+        ]
+        if branches
+        else [],
+        "url": manga + "/" + data["slug"],
+        "original_url": data.get("original_url"),
+        "english_url": data.get("english_url"),
+        "other_url": data.get("other_url"),
+    }
+
+
+def convert_project(
+    data: Dict[str, Any], registry: Optional[InternRegistry] = None
+) -> dict[str, Any]:
+    """
+    Convert a v2 project object to Manga fields.
+
+    Projects have nested titles and image, genres and tags given as
+    objects, and a `release_date` string.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        The raw project.
+    registry : Optional[InternRegistry], optional
+        If given, the genres, tags, users and teams are shared instances.
+        Defaults to None.
+
+    Returns
+    -------
+    dict[str, Any]
+        The keyword arguments of `Manga`, except the client.
+    """
+    title = data["title"]
+    genres = data.get("genres")
+    tags = data.get("tags")
+    release_date = data.get("release_date")
+    adult = data.get("adult")
+    branches = data.get("branches")
+    return {
+        "id": int(data["id"]) if data.get("id") else None,
+        "title_ru": title["ru"],
+        "title_en": title["en"],
+        "title_original": title["original"],
+        "image": image_storage_url + "/" + str(data["image"]["name"]),
+        "type": manga_type(data.get("type")),
+        "rating": data.get("rating"),
+        "rating_count": None,
+        "hearts": data.get("hearts"),
+        "views": data.get("views"),
+        "bookmarks": data.get("bookmarks"),
+        "status": manga_status(data.get("status")),
+        "description": data.get("description"),
+        "genres": [json_to_object.json_to_genre(genre, registry) for genre in genres]
+        if genres
+        else [],
+        "tags": [json_to_object.json_to_tag(tag, registry) for tag in tags]
+        if tags
+        else [],
+        "author": _person(Author, data.get("author")),
+        "artist": _person(Artist, data.get("artist")),
+        "release_date": parse_date(release_date) if release_date else None,
+        "adult": int(adult) if adult else None,
+        "tomes": data.get("tomes"),
+        "count_chapters": data.get("count_chapters"),
+        "original_status": manga_status(data.get("original_status")),
+        "slug": data.get("slug"),
+        "branches": [
+            json_to_object.json_to_branch(branch, registry) for branch in branches
+        ]
+        if branches
+        else [],
+        "url": manga + "/" + data["slug"],
+        "original_url": data.get("original_url"),
+        "english_url": data.get("english_url"),
+        "other_url": data.get("other_url"),
+    }
+
+
+def _convert_any(
+    data: Dict[str, Any], registry: Optional[InternRegistry] = None
+) -> dict[str, Any]:
+    """
+    Convert manga data of an unknown shape, field by field.
+    """
+    return {name: load(data, registry) for name, load in FIELD_LOADERS.items()}
+
+
+def converter_for(
+    data: Dict[str, Any]
+) -> Callable[[Dict[str, Any], Optional[InternRegistry]], dict[str, Any]]:
+    """
+    Return the converter matching the shape of raw manga data.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        A dictionary containing raw manga data.
+
+    Returns
+    -------
+    Callable[[Dict[str, Any], Optional[InternRegistry]], dict[str, Any]]
+        `convert_document`, `convert_project`, or a field by field
+        conversion through `MangaFormatter` for any other shape.
+    """
+    title = data.get("title")
+    if title:
+        if (
+            isinstance(title, dict)
+            and data.get("image")
+            and not data.get("released_at")
+        ):
+            return convert_project
+        return _convert_any
+    if data.get("image"):
+        return _convert_any
+    return convert_document
+
+
+def convert_manga(
+    data: Dict[str, Any], registry: Optional[InternRegistry] = None
+) -> dict[str, Any]:
+    """
+    Convert raw manga data to Manga fields with the converter of its shape.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        A dictionary containing raw manga data.
+    registry : Optional[InternRegistry], optional
+        If given, the genres, tags, users and teams are shared instances.
+        Defaults to None.
+
+    Returns
+    -------
+    dict[str, Any]
+        The keyword arguments of `Manga`, except the client.
+    """
+    return converter_for(data)(data, registry)
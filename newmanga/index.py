@@ -0,0 +1,450 @@
+import re
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable, Optional, Sequence, Union
+
+import httpx
+
+from . import queries_data
+from .formatters import json_to_object
+from .formatters.manga import parse_date
+from .snapshot import CatalogueSnapshot
+from .typing.filters import CatalogueFilter
+from .typing.responses import CatalogueResponse
+
+# Sort kinds of the catalogue query and the document field they order by.
+SORT_FIELDS = {
+    "RATING": "rating",
+    "VIEWS": "views",
+    "HEARTS": "hearts",
+    "BOOKMARKS": "bookmarks",
+    "COUNT_CHAPTERS": "count_chapters",
+    "RELEASE_DATE": "released_at",
+}
+TITLE_FIELDS = ("title_ru", "title_en", "title_original")
+
+_TOKEN = re.compile(r"\w+")
+# Reading the presorted rows costs about this many rows per match sorted.
+_WALK_RATIO = 8
+_PREFIX_CACHE_SIZE = 1024
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """
+    Split a title or a query into lowercase words.
+
+    Parameters
+    ----------
+    text : Optional[str]
+        The text to split.
+
+    Returns
+    -------
+    list[str]
+        The words of the text, with "ё" folded to "е".
+    """
+    if not text:
+        return []
+    return _TOKEN.findall(text.lower().replace("ё", "е"))
+
+
+def _key(value: Any) -> str:
+    """
+    Normalize a filter value or a document value for comparison.
+    """
+    if isinstance(value, Enum):
+        value = value.value
+    return str(value).lower()
+
+
+def _bitset(rows: Iterable[int], count: int) -> int:
+    """
+    Build an integer whose set bits are the given rows.
+    """
+    bits = bytearray((count >> 3) + 1)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _rows(mask: int) -> list[int]:
+    """
+    Return the positions of the set bits of an integer, in order.
+    """
+    bits = bin(mask)[:1:-1]
+    rows = []
+    row = bits.find("1")
+    while row >= 0:
+        rows.append(row)
+        row = bits.find("1", row + 1)
+    return rows
+
+
+class CatalogueIndex:
+    """Search index over catalogue documents, queried without the network.
+
+    Title words are kept in an inverted index and every filter of the
+    catalogue query (genres, tags, type, translation and original status,
+    adult rating, release year, chapters) in per value row sets stored as
+    integer bitsets, so a query is a handful of bitwise operations. Like
+    the catalogue search, every word of the query must match a title word
+    and the last one may be a prefix.
+
+    Parameters
+    ----------
+    documents : Iterable[dict[str, Any]], optional
+        The raw catalogue documents, e.g. `CatalogueSnapshot.read()`.
+    client : Optional[httpx.Client | httpx.AsyncClient], optional
+        The client attached to the returned mangas. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[dict[str, Any]] = (),
+        client: Optional[httpx.Client | httpx.AsyncClient] = None,
+    ):
+        self.client = client
+        self.documents: list[dict[str, Any]] = []
+        self._ids: dict[int, int] = {}
+        self._postings: dict[str, dict[Any, list[int]]] = {
+            "words": {},
+            "genres": {},
+            "tags": {},
+            "type": {},
+            "translation_status": {},
+            "original_status": {},
+            "adult": {},
+            "released_year": {},
+        }
+        self._chapters: list[int] = []
+        self._unrated: list[int] = []
+        self._reset()
+        self.extend(documents)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: CatalogueSnapshot,
+        client: Optional[httpx.Client | httpx.AsyncClient] = None,
+    ) -> "CatalogueIndex":
+        """
+        Build an index from the titles of a catalogue snapshot.
+
+        Parameters
+        ----------
+        snapshot : CatalogueSnapshot
+            The snapshot, each title is indexed once.
+        client : Optional[httpx.Client | httpx.AsyncClient], optional
+            The client attached to the returned mangas. Defaults to None.
+
+        Returns
+        -------
+        CatalogueIndex
+            The index of the snapshot.
+        """
+        return cls(snapshot.read(unique=True), client)
+
+    def _reset(self) -> None:
+        """
+        Drop the bitsets and sort orders built for the previous documents.
+        """
+        self._bitsets: dict[tuple[str, Any], int] = {}
+        self._prefixes: dict[str, int] = {}
+        self._vocabulary: Optional[list[str]] = None
+        self._orders: dict[tuple[str, bool], tuple[list[int], array]] = {}
+
+    def append(self, document: dict[str, Any]) -> None:
+        """
+        Add a catalogue document to the index.
+
+        Parameters
+        ----------
+        document : dict[str, Any]
+            The raw document, as found in the hits of the catalogue.
+        """
+        row = len(self.documents)
+        self.documents.append(document)
+        if document.get("id"):
+            self._ids[int(document["id"])] = row
+
+        def add(facet: str, value: Any) -> None:
+            self._postings[facet].setdefault(value, []).append(row)
+
+        words = set()
+        for name in TITLE_FIELDS:
+            words.update(tokenize(document.get(name)))
+        for word in words:
+            add("words", word)
+        for genre in document.get("genres") or ():
+            add("genres", _key(genre))
+        for tag in document.get("tags") or ():
+            add("tags", _key(tag))
+        if document.get("type"):
+            add("type", _key(document["type"]))
+        if document.get("status"):
+            add("translation_status", _key(document["status"]))
+        if document.get("original_status"):
+            add("original_status", _key(document["original_status"]))
+        if document.get("adult") and document["adult"] != "0":
+            add("adult", "adult_" + _key(document["adult"]))
+        else:
+            self._unrated.append(row)
+        if document.get("released_at"):
+            add("released_year", datetime.fromtimestamp(document["released_at"]).year)
+        elif document.get("release_date"):
+            add("released_year", parse_date(document["release_date"]).year)
+        if document.get("count_chapters"):
+            self._chapters.append(row)
+        self._reset()
+
+    def extend(self, documents: Iterable[dict[str, Any]]) -> None:
+        """
+        Add catalogue documents to the index.
+
+        Parameters
+        ----------
+        documents : Iterable[dict[str, Any]]
+            The raw documents.
+        """
+        for document in documents:
+            self.append(document)
+
+    def _bitset(self, facet: str, value: Any) -> int:
+        """
+        Return the rows of a facet value as a bitset.
+        """
+        key = (facet, value)
+        bitset = self._bitsets.get(key)
+        if bitset is None:
+            rows = self._postings[facet].get(value, ())
+            bitset = self._bitsets[key] = _bitset(rows, len(self.documents))
+        return bitset
+
+    def _prefix(self, prefix: str) -> int:
+        """
+        Return the rows having a title word starting with a prefix.
+        """
+        bitset = self._prefixes.get(prefix)
+        if bitset is not None:
+            return bitset
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings["words"])
+        if len(self._prefixes) >= _PREFIX_CACHE_SIZE:
+            self._prefixes.clear()
+
+        words = self._postings["words"]
+        rows: set[int] = set()
+        start = bisect_left(self._vocabulary, prefix)
+        for word in self._vocabulary[start:]:
+            if not word.startswith(prefix):
+                break
+            rows.update(words[word])
+        bitset = self._prefixes[prefix] = _bitset(rows, len(self.documents))
+        return bitset
+
+    def _any(self, facet: str, values: Iterable[Any]) -> int:
+        """
+        Return the rows matching any of the facet values.
+        """
+        bitset = 0
+        for value in values:
+            bitset |= self._bitset(facet, value)
+        return bitset
+
+    def match(
+        self,
+        query: str = "*",
+        filter: Union[CatalogueFilter, dict[str, Any], None] = None,
+    ) -> int:
+        """
+        Return the documents matching a query and a filter as a bitset.
+
+        Parameters
+        ----------
+        query : str, optional
+            The words to search for in the titles, "*" or "" for all the
+            documents. Defaults to "*".
+        filter : Union[CatalogueFilter, dict[str, Any], None], optional
+            The filters of the catalogue endpoint, or the filter section of
+            a catalogue query, see `queries_data.catalogue`. Genres and tags
+            are matched by title. Missing keys take the defaults of the
+            catalogue endpoint. Defaults to None.
+
+        Returns
+        -------
+        int
+            An integer whose bit n is set if document n matches.
+        """
+        if isinstance(filter, CatalogueFilter):
+            filter = filter.to_json(by_title=True)
+        options = {**queries_data.catalogue["filter"], **(filter or {})}
+        mask = (1 << len(self.documents)) - 1
+
+        words = tokenize(query)
+        if words:
+            # Like the API, the last word may be incomplete
+            for word in words[:-1]:
+                mask &= self._bitset("words", word)
+            mask &= self._prefix(words[-1])
+
+        for facet in ("genres", "tags"):
+            section = options.get(facet) or {}
+            for value in section.get("included") or ():
+                mask &= self._bitset(facet, _key(value))
+            excluded = self._any(facet, map(_key, section.get("excluded") or ()))
+            mask &= ~excluded
+
+        for facet in ("type", "translation_status", "original_status"):
+            allowed = (options.get(facet) or {}).get("allowed")
+            if allowed:
+                mask &= self._any(facet, map(_key, allowed))
+
+        allowed = (options.get("adult") or {}).get("allowed")
+        if allowed:
+            unrated = self._bitsets.get(("adult", None))
+            if unrated is None:
+                unrated = _bitset(self._unrated, len(self.documents))
+                self._bitsets[("adult", None)] = unrated
+            mask &= unrated | self._any("adult", map(_key, allowed))
+
+        years = options.get("released_year") or {}
+        if years.get("min") is not None or years.get("max") is not None:
+            low = years.get("min") or -1
+            high = years.get("max") if years.get("max") is not None else 1 << 16
+            mask &= self._any(
+                "released_year",
+                [
+                    year
+                    for year in self._postings["released_year"]
+                    if low <= year <= high
+                ],
+            )
+
+        if options.get("require_chapters"):
+            chapters = self._bitsets.get(("count_chapters", None))
+            if chapters is None:
+                chapters = _bitset(self._chapters, len(self.documents))
+                self._bitsets[("count_chapters", None)] = chapters
+            mask &= chapters
+
+        hidden = [
+            self._ids[int(project)]
+            for project in options.get("hidden_projects") or ()
+            if int(project) in self._ids
+        ]
+        if hidden:
+            mask &= ~_bitset(hidden, len(self.documents))
+        return mask
+
+    def _order(self, kind: str, descending: bool) -> tuple[list[int], array]:
+        """
+        Return the rows sorted by a sort kind, and the rank of every row.
+        """
+        cached = self._orders.get((kind, descending))
+        if cached is not None:
+            return cached
+        try:
+            name = SORT_FIELDS[kind]
+        except KeyError:
+            raise ValueError(
+                "Unknown sort kind {!r}, expected one of {}".format(
+                    kind, ", ".join(SORT_FIELDS)
+                )
+            ) from None
+
+        present, missing = [], []
+        for row, document in enumerate(self.documents):
+            (missing if document.get(name) is None else present).append(row)
+        present.sort(key=lambda row: self.documents[row][name], reverse=descending)
+        order = present + missing
+
+        rank = array("q", bytes(8 * len(order)))
+        for position, row in enumerate(order):
+            rank[row] = position
+        cached = self._orders[(kind, descending)] = (order, rank)
+        return cached
+
+    def search(
+        self,
+        query: str = "*",
+        page: int = 1,
+        size: int = 32,
+        filter: Union[CatalogueFilter, dict[str, Any], None] = None,
+        sort: Optional[dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> CatalogueResponse:
+        """
+        Search the index like the catalogue endpoint.
+
+        Parameters
+        ----------
+        query : str, optional
+            The words to search for in the titles. Defaults to "*".
+        page : int, optional
+            The page number to return. Defaults to 1.
+        size : int, optional
+            The number of items per page. Defaults to 32.
+        filter : Union[CatalogueFilter, dict[str, Any], None], optional
+            The filters of the catalogue endpoint, or the filter section of
+            a catalogue query, see `queries_data.catalogue`. Genres and tags
+            are matched by title. Defaults to None.
+        sort : Optional[dict[str, str]], optional
+            The sort section of a catalogue query, with a `kind` among the
+            keys of `SORT_FIELDS` and a `dir` of "ASC" or "DESC". Defaults
+            to the rating, highest first.
+        fields : Optional[Sequence[str]], optional
+            If given, each manga is a dictionary of these `Manga` fields
+            only. Defaults to None.
+
+        Returns
+        -------
+        CatalogueResponse
+            The page of lazy mangas, with the number of matching documents
+            in `found` and the size of the index in `total`.
+
+        Raises
+        ------
+        ValueError
+            If the sort kind or a projected field is unknown.
+        """
+        if fields is not None:
+            json_to_object.check_fields(fields)
+        sort = {**queries_data.catalogue["sort"], **(sort or {})}
+        order, rank = self._order(sort["kind"], sort["dir"] != "ASC")
+
+        mask = self.match(query, filter)
+        found = mask.bit_count()
+        start = (page - 1) * size
+        # Walk the presorted rows when the page is found in fewer steps
+        # than sorting all the matches would take
+        if (start + size) * len(self.documents) < _WALK_RATIO * found * found:
+            bits = mask.to_bytes((len(self.documents) >> 3) + 1, "little")
+            rows = []
+            skipped = 0
+            for row in order:
+                if bits[row >> 3] >> (row & 7) & 1:
+                    if skipped < start:
+                        skipped += 1
+                        continue
+                    rows.append(row)
+                    if len(rows) == size:
+                        break
+        else:
+            rows = sorted(_rows(mask), key=rank.__getitem__)[start : start + size]
+
+        return CatalogueResponse(
+            page=page,
+            found=found,
+            total=len(self.documents),
+            mangas=[
+                json_to_object.json_to_manga(
+                    self.client, self.documents[row], lazy=True, fields=fields
+                )
+                for row in rows
+            ],
+        )
+
+    def __len__(self) -> int:
+        return len(self.documents)
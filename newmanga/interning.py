@@ -0,0 +1,103 @@
+import weakref
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+_registries: "weakref.WeakKeyDictionary[Any, InternRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class InternRegistry:
+    """Storage sharing the tags, genres, users and teams built by the API.
+
+    While a registry is attached to a client, every response returns the same
+    `Tag`, `Genre`, `User` and `Team` instance for the same id (or title, for
+    catalogue genres and tags, which have no id). Large crawls then keep a
+    single copy of each value, and identity comparisons are enough to tell
+    them apart.
+
+    The first instance built for an id is kept: values that change over
+    time, such as `User.is_online`, are not refreshed by later responses.
+    Shared instances should therefore not be modified.
+    """
+
+    def __init__(self):
+        self._objects: dict[tuple[type, Hashable], Any] = {}
+
+    def get_or_create(self, kind: type[T], key: Hashable, create: Callable[[], T]) -> T:
+        """
+        Return the shared instance stored under the key, building it if needed.
+
+        Parameters
+        ----------
+        kind : type[T]
+            The class of the instance.
+        key : Hashable
+            The id of the instance.
+        create : Callable[[], T]
+            Builds the instance when it is not stored yet.
+
+        Returns
+        -------
+        T
+            The shared instance.
+        """
+        value = self._objects.get((kind, key), _MISSING)
+        if value is _MISSING:
+            value = self._objects.setdefault((kind, key), create())
+        return value
+
+    def clear(self) -> None:
+        """
+        Forget every shared instance.
+        """
+        self._objects.clear()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
+def register(
+    client: httpx.Client | httpx.AsyncClient, registry: Optional[InternRegistry]
+) -> None:
+    """
+    Attach a registry to a client, or detach it when None is given.
+
+    Parameters
+    ----------
+    client : httpx.Client | httpx.AsyncClient
+        The client whose responses share instances.
+    registry : Optional[InternRegistry]
+        The registry storing the shared instances.
+    """
+    if registry is None:
+        _registries.pop(client, None)
+    else:
+        _registries[client] = registry
+
+
+def registry_for(
+    client: Optional[httpx.Client | httpx.AsyncClient],
+) -> Optional[InternRegistry]:
+    """
+    Return the registry attached to a client.
+
+    Parameters
+    ----------
+    client : Optional[httpx.Client | httpx.AsyncClient]
+        The client of the API, or None for mangas built without one (e.g.
+        by a `CatalogueIndex` loaded from a snapshot).
+
+    Returns
+    -------
+    Optional[InternRegistry]
+        The attached registry, or None if interning is disabled.
+    """
+    if client is None or not _registries:
+        return None
+    return _registries.get(client)
@@ -0,0 +1,517 @@
+import bisect
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+import httpx
+
+from . import constants
+from .transports import endpoint_name
+
+SECONDS_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+BYTES_BUCKETS = tuple(256 * 4**power for power in range(8))
+ITEMS_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# The series of every call, with their default buckets
+SERIES = {
+    "network_seconds": SECONDS_BUCKETS,
+    "decode_seconds": SECONDS_BUCKETS,
+    "format_seconds": SECONDS_BUCKETS,
+    "wire_bytes": BYTES_BUCKETS,
+    "items": ITEMS_BUCKETS,
+}
+
+
+@dataclass(slots=True)
+class CallMetrics:
+    """Measurements of one API call.
+
+    Attributes
+    ----------
+    endpoint : str
+        The name of the endpoint in `constants.endpoints`, or "other".
+    url_template : str
+        The URL of the endpoint with its placeholders, e.g.
+        "https://api.newmanga.org/v2/projects/{slug}/comments".
+    status : int
+        The HTTP status code of the response, 0 if the request failed
+        without one, e.g. on a timeout.
+    wire_bytes : int
+        The size of the body as received from the network, before
+        decompression; 0 for a response served by the cache.
+    network_seconds : float
+        The time from sending the request to receiving the whole body,
+        retries included.
+    decode_seconds : float
+        The time spent decoding the JSON body.
+    format_seconds : float
+        The time spent building the objects from the decoded body.
+    items : int
+        The number of mangas, chapters, comments or tags in the response, 1
+        for a single manga.
+    retries : int
+        The number of retried attempts.
+    cached : bool
+        Whether the response was served by the cache without a request.
+    """
+
+    endpoint: str
+    url_template: str
+    status: int = 0
+    wire_bytes: int = 0
+    network_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    format_seconds: float = 0.0
+    items: int = 0
+    retries: int = 0
+    cached: bool = False
+
+
+class MetricsSink:
+    """Base class for the receivers of the call measurements.
+
+    Subclasses implement `record`, which may be called from several threads
+    at once.
+    """
+
+    def record(self, metrics: CallMetrics) -> None:
+        """
+        Receive the measurements of a finished call.
+
+        Parameters
+        ----------
+        metrics : CallMetrics
+            The measurements.
+        """
+        raise NotImplementedError
+
+
+class Histogram:
+    """Cumulative histogram of observed values, as kept by Prometheus.
+
+    Parameters
+    ----------
+    buckets : Sequence[float]
+        The upper bounds of the buckets; values above the last one are
+        counted in an implicit "+Inf" bucket.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add a value.
+
+        Parameters
+        ----------
+        value : float
+            The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean of the observed values, 0 if there are none.
+        """
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimate a quantile by interpolating within its bucket.
+
+        Parameters
+        ----------
+        fraction : float
+            The quantile, e.g. 0.95.
+
+        Returns
+        -------
+        float
+            The estimated value, the last bucket bound if it falls in the
+            "+Inf" bucket, 0 if there are no values.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+class HistogramSink(MetricsSink):
+    """Sink keeping histograms of every series per endpoint, in memory.
+
+    Parameters
+    ----------
+    buckets : Optional[dict[str, Sequence[float]]], optional
+        Bucket bounds replacing the defaults of some series (see `SERIES`).
+        Defaults to None.
+
+    Attributes
+    ----------
+    histograms : dict[tuple[str, str], Histogram]
+        The histograms by series name and endpoint.
+    responses : Counter[tuple[str, str, int]]
+        The number of calls by endpoint, URL template and status.
+    retries : Counter[str]
+        The number of retried attempts by endpoint.
+    cache_hits : Counter[str]
+        The number of responses served by the cache by endpoint.
+    """
+
+    def __init__(self, buckets: Optional[dict[str, Sequence[float]]] = None):
+        self.buckets = {**SERIES, **(buckets or {})}
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        self.responses: Counter[tuple[str, str, int]] = Counter()
+        self.retries: Counter[str] = Counter()
+        self.cache_hits: Counter[str] = Counter()
+        self._lock = threading.RLock()
+
+    def record(self, metrics: CallMetrics) -> None:
+        with self._lock:
+            endpoint = metrics.endpoint
+            self.responses[endpoint, metrics.url_template, metrics.status] += 1
+            self.retries[endpoint] += metrics.retries
+            self.cache_hits[endpoint] += metrics.cached
+            for name, bounds in self.buckets.items():
+                histogram = self.histograms.get((name, endpoint))
+                if histogram is None:
+                    histogram = self.histograms[name, endpoint] = Histogram(bounds)
+                histogram.observe(getattr(metrics, name))
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Summarize the series of every endpoint.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            By endpoint, the number of calls and the mean and 95th
+            percentile of every series, e.g. "format_seconds_p95".
+        """
+        with self._lock:
+            result: dict[str, dict[str, float]] = {}
+            for (name, endpoint), histogram in sorted(self.histograms.items()):
+                stats = result.setdefault(endpoint, {"calls": histogram.count})
+                stats[name + "_mean"] = histogram.mean
+                stats[name + "_p95"] = histogram.quantile(0.95)
+            return result
+
+    def clear(self) -> None:
+        """
+        Forget every measurement.
+        """
+        with self._lock:
+            self.histograms.clear()
+            self.responses.clear()
+            self.retries.clear()
+            self.cache_hits.clear()
+
+
+def _labels(**labels: Any) -> str:
+    def escape(value: Any) -> str:
+        text = str(value)
+        return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+
+def _bound(value: float) -> str:
+    return repr(float(value))
+
+
+def to_prometheus(sink: HistogramSink, prefix: str = "newmanga") -> str:
+    """
+    Export the measurements in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    sink : HistogramSink
+        The measurements.
+    prefix : str, optional
+        The prefix of every metric name. Defaults to "newmanga".
+
+    Returns
+    -------
+    str
+        The metrics, e.g. to serve on a `/metrics` page.
+    """
+    lines = []
+
+    def counter(name: str, description: str, values: dict[str, int]) -> None:
+        lines.append(f"# HELP {prefix}_{name} {description}")
+        lines.append(f"# TYPE {prefix}_{name} counter")
+        lines.extend(
+            f"{prefix}_{name}{{{labels}}} {value}" for labels, value in values.items()
+        )
+
+    with sink._lock:
+        counter(
+            "responses_total",
+            "Calls by endpoint, URL template and status.",
+            {
+                _labels(endpoint=endpoint, template=template, status=status): count
+                for (endpoint, template, status), count in sorted(
+                    sink.responses.items()
+                )
+            },
+        )
+        counter(
+            "retries_total",
+            "Retried attempts by endpoint.",
+            {
+                _labels(endpoint=endpoint): count
+                for endpoint, count in sorted(sink.retries.items())
+            },
+        )
+        counter(
+            "cache_hits_total",
+            "Responses served by the cache by endpoint.",
+            {
+                _labels(endpoint=endpoint): count
+                for endpoint, count in sorted(sink.cache_hits.items())
+            },
+        )
+        for series in sink.buckets:
+            name = f"{prefix}_{series}"
+            lines.append(f"# HELP {name} The {series.replace('_', ' ')} of a call.")
+            lines.append(f"# TYPE {name} histogram")
+            for (kind, endpoint), histogram in sorted(sink.histograms.items()):
+                if kind != series:
+                    continue
+                cumulative = 0
+                bounds = [_bound(bound) for bound in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    labels = _labels(endpoint=endpoint, le=bound)
+                    lines.append(f"{name}_bucket{{{labels}}} {cumulative}")
+                labels = _labels(endpoint=endpoint)
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return "\n".join(lines) + "\n"
+
+
+def count_items(value: Any) -> int:
+    """
+    Count the items of a formatted response or of a decoded body.
+
+    Parameters
+    ----------
+    value : Any
+        The object returned by an endpoint, raw or not.
+
+    Returns
+    -------
+    int
+        The number of mangas, chapters, comments or tags, 1 for anything
+        else.
+    """
+    for name in ("mangas", "chapters", "comments", "tags"):
+        items = getattr(value, name, None)
+        if isinstance(items, list):
+            return len(items)
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, dict):
+        if isinstance(value.get("items"), list):
+            return len(value["items"])
+        if isinstance(value.get("result"), dict):
+            return len(value["result"].get("hits") or [])
+    return 1
+
+
+def _start(request: httpx.Request) -> CallMetrics:
+    name = endpoint_name(request.url)
+    if name is None:
+        template = f"{request.url.scheme}://{request.url.host}{request.url.path}"
+    else:
+        template = constants.endpoints[name]
+    return CallMetrics(endpoint=name or "other", url_template=template)
+
+
+class PendingCall:
+    """Measurements of a successful call waiting for its body to be converted.
+
+    `MetricsTransport` leaves it on the response under the
+    `newmanga_metrics` extension when the request carries the
+    `newmanga_format` extension, as the requests of the endpoints do.
+    `formatters.format_response` adds the decoding and formatting times and
+    the item count, then records the call.
+
+    Parameters
+    ----------
+    sink : MetricsSink
+        The receiver of the measurements.
+    metrics : CallMetrics
+        The measurements of the call.
+    """
+
+    def __init__(self, sink: MetricsSink, metrics: CallMetrics):
+        self.sink = sink
+        self.metrics = metrics
+        self.recorded = False
+        self._lock = threading.Lock()
+
+    def record(self) -> None:
+        """
+        Report the call to the sink, unless it was already.
+        """
+        with self._lock:
+            if self.recorded:
+                return
+            self.recorded = True
+        self.sink.record(self.metrics)
+
+
+def _measure(
+    request: httpx.Request,
+    response: Optional[httpx.Response],
+    metrics: CallMetrics,
+    started: float,
+) -> None:
+    metrics.network_seconds = time.perf_counter() - started
+    metrics.retries = request.extensions.get("newmanga_retries", 0)
+    if response is None:
+        metrics.wire_bytes = request.extensions.get("newmanga_wire_bytes", 0)
+        return
+    metrics.status = response.status_code
+    metrics.wire_bytes = request.extensions.get(
+        "newmanga_wire_bytes", response.num_bytes_downloaded
+    )
+    metrics.cached = request.extensions.get("newmanga_cache_hit", False)
+
+
+def _finish(
+    request: httpx.Request,
+    response: httpx.Response,
+    sink: MetricsSink,
+    metrics: CallMetrics,
+    started: float,
+) -> None:
+    """
+    Record the call, or attach it to its response if an endpoint is about
+    to convert the body.
+    """
+    _measure(request, response, metrics, started)
+    if response.status_code != 200 or not request.extensions.get("newmanga_format"):
+        sink.record(metrics)
+        return
+    # Completed and recorded by `formatters.format_response`
+    response.extensions["newmanga_metrics"] = PendingCall(sink, metrics)
+
+
+def _failed(
+    request: httpx.Request, sink: MetricsSink, metrics: CallMetrics, started: float
+) -> None:
+    """
+    Record a call that raised before a response was received.
+    """
+    _measure(request, None, metrics, started)
+    sink.record(metrics)
+
+
+class MetricsTransport(httpx.BaseTransport):
+    """Transport measuring every call and reporting it to a sink.
+
+    It must wrap the whole transport stack, cache and retries included. The
+    network part is measured here; the decoding and formatting times and
+    the item count are added by the endpoint once the body is converted,
+    and the call is recorded then. Other calls, e.g. made directly with
+    the client, and unsuccessful responses are recorded right away, and
+    requests that raise are recorded with status 0.
+
+    Parameters
+    ----------
+    transport : httpx.BaseTransport
+        The transport performing the requests.
+    sink : MetricsSink
+        The receiver of the measurements.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, sink: MetricsSink):
+        self.transport = transport
+        self.sink = sink
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = _start(request)
+        started = time.perf_counter()
+        try:
+            response = self.transport.handle_request(request)
+            response.read()
+        except Exception:
+            _failed(request, self.sink, metrics, started)
+            raise
+        _finish(request, response, self.sink, metrics, started)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncMetricsTransport(httpx.AsyncBaseTransport):
+    """Asynchronous transport measuring every call and reporting it to a sink.
+
+    It must wrap the whole transport stack, cache and retries included. The
+    network part is measured here; the decoding and formatting times and
+    the item count are added by the endpoint once the body is converted,
+    and the call is recorded then. Other calls, e.g. made directly with
+    the client, and unsuccessful responses are recorded right away, and
+    requests that raise are recorded with status 0.
+
+    Parameters
+    ----------
+    transport : httpx.AsyncBaseTransport
+        The transport performing the requests.
+    sink : MetricsSink
+        The receiver of the measurements.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, sink: MetricsSink):
+        self.transport = transport
+        self.sink = sink
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = _start(request)
+        started = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+            await response.aread()
+        except Exception:
+            _failed(request, self.sink, metrics, started)
+            raise
+        _finish(request, response, self.sink, metrics, started)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
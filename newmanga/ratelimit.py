@@ -0,0 +1,188 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a `Retry-After` header.
+
+    Parameters
+    ----------
+    value : Optional[str]
+        The header value, either a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    Optional[float]
+        The number of seconds to wait, or None if the value is missing or
+        invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass()
+class RetryPolicy:
+    """Describes when and how long to wait before retrying a request.
+
+    Attributes
+    ----------
+    max_retries : int
+        The maximum number of retries of a single request.
+    backoff : float
+        The base delay in seconds, doubled after every attempt.
+    max_backoff : float
+        The upper bound of a delay in seconds, `Retry-After` values included.
+    statuses : frozenset[int]
+        The response status codes that are retried.
+    retry_on_errors : bool
+        Whether timeouts and connection errors are retried as well.
+    """
+
+    max_retries: int = 5
+    backoff: float = 0.5
+    max_backoff: float = 60.0
+    statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    retry_on_errors: bool = True
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute how long to wait before the next attempt.
+
+        The `Retry-After` value of the server is honored when given, up to
+        `max_backoff`, otherwise an exponential backoff with full jitter is
+        used.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of the failed attempt, starting from 0.
+        retry_after : Optional[float], optional
+            The delay requested by the server, in seconds. Defaults to None.
+
+        Returns
+        -------
+        float
+            The number of seconds to wait.
+        """
+        if retry_after is not None:
+            return min(self.max_backoff, retry_after)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+class RateLimiter:
+    """Token bucket limiting the request rate, adapted to the server (AIMD).
+
+    Every successful response raises the rate additively, by `increase`
+    requests per second for each second of traffic, and every throttled one
+    (429) multiplies it by `decrease`. Over a long crawl the rate settles just
+    below what the server tolerates.
+
+    Parameters
+    ----------
+    rate : float, optional
+        The initial number of requests per second. Defaults to 5.
+    burst : int, optional
+        The number of requests that may be sent at once. Defaults to 1.
+    min_rate : float, optional
+        The lowest rate the limiter can fall to. Defaults to 0.2.
+    max_rate : float, optional
+        The highest rate the limiter can climb to. Defaults to 50.
+    increase : float, optional
+        The additive increase of the rate. Defaults to 0.5.
+    decrease : float, optional
+        The multiplicative decrease of the rate. Defaults to 0.5.
+    adaptive : bool, optional
+        If false, the rate stays fixed. Defaults to True.
+    max_pause : float, optional
+        The longest pause a `Retry-After` value can impose, in seconds.
+        Defaults to 60, the default `RetryPolicy.max_backoff`.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 1,
+        min_rate: float = 0.2,
+        max_rate: float = 50.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        adaptive: bool = True,
+        max_pause: float = 60.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.adaptive = adaptive
+        self.max_pause = max_pause
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket.
+
+        Returns
+        -------
+        float
+            The number of seconds the caller has to wait before sending the
+            request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._paused_until - now)
+
+    def on_success(self) -> None:
+        """
+        Record a request the server accepted.
+        """
+        if not self.adaptive:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Record a request the server rejected as too frequent.
+
+        Parameters
+        ----------
+        retry_after : Optional[float], optional
+            The delay requested by the server, in seconds. No request is let
+            through until it has passed, up to `max_pause`. Defaults to None.
+        """
+        with self._lock:
+            if self.adaptive:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+            if retry_after:
+                self._paused_until = max(
+                    self._paused_until,
+                    time.monotonic() + min(self.max_pause, retry_after),
+                )
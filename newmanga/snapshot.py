@@ -0,0 +1,312 @@
+import gzip
+import io
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Generator, Optional
+
+import httpx
+
+from .api.catalogue import Catalogue, _last_page
+from .api.manga import Manga
+from .decoders import decode
+from .formatters import json_to_object
+
+HITS_FILE = "hits.jsonl.gz"
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+@dataclass()
+class SnapshotCheckpoint:
+    """The progress of a catalogue snapshot.
+
+    Attributes
+    ----------
+    query : str
+        The catalogue query of the snapshot.
+    size : int
+        The number of items per page.
+    page : int
+        The last page completely written.
+    count : int
+        The number of documents written.
+    offset : int
+        The size of the hits file once the last page was written.
+    complete : bool
+        Whether the last page of the catalogue was reached.
+    """
+
+    query: str
+    size: int
+    page: int = 0
+    count: int = 0
+    offset: int = 0
+    complete: bool = False
+
+
+class _LimitedReader(io.RawIOBase):
+    """Read-only view of the first `limit` bytes of a binary file."""
+
+    def __init__(self, file: io.BufferedReader, limit: int):
+        self._file = file
+        self._remaining = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        data = self._file.read(size)
+        buffer[: len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
+class CatalogueSnapshot:
+    """Copy of the catalogue stored on disk, written page by page.
+
+    Every page is appended to `hits.jsonl.gz` as its own gzip member, one
+    document per line, and `checkpoint.json` is then replaced atomically.
+    An interrupted pull (a crash, or the API still throttling once the
+    retries are exhausted) loses at most the page in progress: the next
+    `pull` truncates the partial data and continues after the last
+    checkpointed page. Readers only see checkpointed pages, so a snapshot
+    can be read while it is being pulled.
+
+    The catalogue is sorted by rating, so titles may move between pages
+    during a long pull; `read(unique=True)` skips repeated ids.
+
+    Parameters
+    ----------
+    path : str
+        The directory of the snapshot, created if needed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def hits_path(self) -> str:
+        """
+        The path of the compressed JSON lines file.
+        """
+        return os.path.join(self.path, HITS_FILE)
+
+    @property
+    def checkpoint(self) -> Optional[SnapshotCheckpoint]:
+        """
+        The progress of the snapshot, or None if nothing was pulled yet.
+        """
+        try:
+            with open(os.path.join(self.path, CHECKPOINT_FILE)) as file:
+                return SnapshotCheckpoint(**json.load(file))
+        except FileNotFoundError:
+            return None
+
+    def _save(self, checkpoint: SnapshotCheckpoint) -> None:
+        """
+        Replace the checkpoint file atomically.
+        """
+        path = os.path.join(self.path, CHECKPOINT_FILE)
+        with open(path + ".tmp", "w") as file:
+            json.dump(asdict(checkpoint), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path + ".tmp", path)
+
+    def pull(
+        self,
+        catalogue: Catalogue,
+        query: str = "*",
+        size: int = 100,
+        prefetch: int = 0,
+        restart: bool = False,
+    ) -> SnapshotCheckpoint:
+        """
+        Write the catalogue to disk, resuming after the last checkpoint.
+
+        Parameters
+        ----------
+        catalogue : Catalogue
+            The catalogue endpoint, e.g. `NewMangaApi().get_catalogue`.
+        query : str, optional
+            The query to search for. Defaults to "*".
+        size : int, optional
+            The number of items per page. Defaults to 100.
+        prefetch : int, optional
+            The number of pages fetched ahead while a page is written.
+            Defaults to 0 (disabled).
+        restart : bool, optional
+            If true, the existing snapshot is discarded and pulled again
+            from the first page. Defaults to False.
+
+        Returns
+        -------
+        SnapshotCheckpoint
+            The progress once the last page was reached.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot was started with another query or page size.
+        CatalogueTooManyRequestsError
+            If the API still rejects the requests once the retries are
+            exhausted. The pages written so far are kept.
+        httpx.HTTPStatusError
+            If the API answers with any other error status. The pages
+            written so far are kept and the snapshot is not complete.
+        """
+        with self._lock:
+            checkpoint = None if restart else self.checkpoint
+            if checkpoint is None:
+                checkpoint = SnapshotCheckpoint(query=query, size=size)
+            elif (checkpoint.query, checkpoint.size) != (query, size):
+                raise ValueError(
+                    "The snapshot was started with query={!r} and size={}, "
+                    "pass restart=True to discard it".format(
+                        checkpoint.query, checkpoint.size
+                    )
+                )
+            if checkpoint.complete:
+                return checkpoint
+
+            with open(self.hits_path, "ab") as file:
+                # Drop whatever was written after the last checkpoint
+                file.truncate(checkpoint.offset)
+                file.seek(checkpoint.offset)
+                pages = catalogue.next_page(
+                    query, checkpoint.page + 1, size, prefetch=prefetch, raw=True
+                )
+                try:
+                    for data in pages:
+                        documents = [hit["document"] for hit in data["result"]["hits"]]
+                        lines = "".join(
+                            json.dumps(document, ensure_ascii=False) + "\n"
+                            for document in documents
+                        )
+                        file.write(gzip.compress(lines.encode()))
+                        file.flush()
+                        os.fsync(file.fileno())
+                        checkpoint.page += 1
+                        checkpoint.count += len(documents)
+                        checkpoint.offset = file.tell()
+                        self._save(checkpoint)
+                        if checkpoint.page >= _last_page(data, size):
+                            break
+                finally:
+                    pages.close()
+
+            # Reached either the last page announced by `found` or an empty
+            # page: any failed request raises before getting here.
+            checkpoint.complete = True
+            self._save(checkpoint)
+            return checkpoint
+
+    def start(
+        self,
+        catalogue: Catalogue,
+        query: str = "*",
+        size: int = 100,
+        prefetch: int = 0,
+        restart: bool = False,
+    ) -> threading.Thread:
+        """
+        Run `pull` on a background thread.
+
+        An exception stopping the pull is stored in `error`; calling `start`
+        again resumes from the last checkpoint.
+
+        Parameters
+        ----------
+        catalogue : Catalogue
+            The catalogue endpoint, e.g. `NewMangaApi().get_catalogue`.
+        query : str, optional
+            The query to search for. Defaults to "*".
+        size : int, optional
+            The number of items per page. Defaults to 100.
+        prefetch : int, optional
+            The number of pages fetched ahead while a page is written.
+            Defaults to 0 (disabled).
+        restart : bool, optional
+            If true, the existing snapshot is pulled again from the first
+            page. Defaults to False.
+
+        Returns
+        -------
+        threading.Thread
+            The started thread.
+        """
+
+        def run() -> None:
+            try:
+                self.pull(catalogue, query, size, prefetch, restart)
+            except BaseException as error:
+                self.error = error
+
+        self.error = None
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def read(self, unique: bool = False) -> Generator[dict[str, Any], None, None]:
+        """
+        Stream the documents of the checkpointed pages.
+
+        Parameters
+        ----------
+        unique : bool, optional
+            If true, documents whose id was already read are skipped.
+            Defaults to False.
+
+        Yields
+        ------
+        dict[str, Any]
+            The raw catalogue documents, in the order they were pulled.
+        """
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return
+
+        seen = set()
+        with open(self.hits_path, "rb") as file:
+            limited = io.BufferedReader(_LimitedReader(file, checkpoint.offset))
+            with gzip.GzipFile(fileobj=limited) as lines:
+                for line in lines:
+                    document = decode(line)
+                    if unique:
+                        if document.get("id") in seen:
+                            continue
+                        seen.add(document.get("id"))
+                    yield document
+
+    def mangas(
+        self, client: httpx.Client | httpx.AsyncClient, unique: bool = False
+    ) -> Generator[Manga, None, None]:
+        """
+        Stream the mangas of the checkpointed pages.
+
+        Parameters
+        ----------
+        client : httpx.Client | httpx.AsyncClient
+            The client attached to the mangas, e.g. `NewMangaApi().client`.
+        unique : bool, optional
+            If true, mangas whose id was already read are skipped. Defaults
+            to False.
+
+        Yields
+        ------
+        Manga
+            Lazy mangas converting their fields on first access.
+        """
+        for document in self.read(unique):
+            yield json_to_object.json_to_manga(client, document, lazy=True)
+
+    def __len__(self) -> int:
+        checkpoint = self.checkpoint
+        return 0 if checkpoint is None else checkpoint.count
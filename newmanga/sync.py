@@ -0,0 +1,469 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator, Optional
+
+import httpx
+
+from .api import AsyncNewMangaApi, NewMangaApi
+from .api.manga import Manga
+from .formatters import json_to_object
+from .typing.responses import MangaResult
+
+
+def update_mark(item: dict[str, Any]) -> str:
+    """
+    Identify a project as listed in the updates.
+
+    A project is listed again with another mark once a chapter is added.
+
+    Parameters
+    ----------
+    item : dict[str, Any]
+        The raw project of an updates page.
+
+    Returns
+    -------
+    str
+        The project id and its number of chapters.
+    """
+    return "{}:{}".format(item["id"], item.get("count_chapters"))
+
+
+@dataclass()
+class SyncResult:
+    """The outcome of an incremental sync.
+
+    Attributes
+    ----------
+    pages : int
+        The number of updates pages read.
+    updated : list[str]
+        The slugs of the mangas fetched and stored.
+    errors : dict[str, Exception]
+        The exception raised while fetching each failed slug. Failed mangas
+        are fetched again by the next sync.
+    complete : bool
+        Whether the updates were read up to the previous sync. False when
+        `max_pages` stopped the walk first, in which case older changes
+        were not fetched.
+    """
+
+    pages: int = 0
+    updated: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    complete: bool = False
+
+
+class MangaStore:
+    """Base class for the local storages of manga details.
+
+    Subclasses implement every method; the details are stored as the raw
+    JSON bodies of the manga endpoint, keyed by project id.
+    """
+
+    def get(self, project_id: int) -> Optional[dict[str, Any]]:
+        """
+        Return the stored details of a manga.
+
+        Parameters
+        ----------
+        project_id : int
+            The id of the manga.
+
+        Returns
+        -------
+        Optional[dict[str, Any]]
+            The raw details, or None if the manga is not stored.
+        """
+        raise NotImplementedError
+
+    def version(self, project_id: int) -> Optional[str]:
+        """
+        Return the update mark of the stored details of a manga.
+
+        Parameters
+        ----------
+        project_id : int
+            The id of the manga.
+
+        Returns
+        -------
+        Optional[str]
+            The mark the details were fetched for, or None.
+        """
+        raise NotImplementedError
+
+    def put(self, project_id: int, version: str, data: dict[str, Any]) -> None:
+        """
+        Store the details of a manga, replacing the previous ones.
+
+        Parameters
+        ----------
+        project_id : int
+            The id of the manga.
+        version : str
+            The update mark the details were fetched for.
+        data : dict[str, Any]
+            The raw details.
+        """
+        raise NotImplementedError
+
+    @property
+    def high_water(self) -> list[str]:
+        """
+        The marks of the newest updates seen by the last complete sync.
+        """
+        raise NotImplementedError
+
+    @high_water.setter
+    def high_water(self, marks: list[str]) -> None:
+        raise NotImplementedError
+
+    def ids(self) -> Generator[int, None, None]:
+        """
+        Yield the ids of the stored mangas.
+        """
+        raise NotImplementedError
+
+    def manga(self, project_id: int, client: httpx.Client) -> Optional[Manga]:
+        """
+        Build a stored manga.
+
+        Parameters
+        ----------
+        project_id : int
+            The id of the manga.
+        client : httpx.Client
+            The client attached to the manga, e.g. `NewMangaApi().client`.
+
+        Returns
+        -------
+        Optional[Manga]
+            The manga, or None if it is not stored.
+        """
+        data = self.get(project_id)
+        if data is None:
+            return None
+        return json_to_object.json_to_manga(client, data)
+
+
+class MemoryStore(MangaStore):
+    """Manga details kept in memory, for a process syncing periodically."""
+
+    def __init__(self):
+        self._details: dict[int, tuple[str, dict[str, Any]]] = {}
+        self._high_water: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, project_id: int) -> Optional[dict[str, Any]]:
+        stored = self._details.get(project_id)
+        return None if stored is None else stored[1]
+
+    def version(self, project_id: int) -> Optional[str]:
+        stored = self._details.get(project_id)
+        return None if stored is None else stored[0]
+
+    def put(self, project_id: int, version: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            self._details[project_id] = (version, data)
+
+    @property
+    def high_water(self) -> list[str]:
+        return list(self._high_water)
+
+    @high_water.setter
+    def high_water(self, marks: list[str]) -> None:
+        self._high_water = list(marks)
+
+    def ids(self) -> Generator[int, None, None]:
+        yield from list(self._details)
+
+    def __len__(self) -> int:
+        return len(self._details)
+
+
+class SQLiteStore(MangaStore):
+    """Manga details stored in a SQLite database, kept between runs.
+
+    Parameters
+    ----------
+    path : str
+        The path to the database file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS mangas ("
+            "id INTEGER PRIMARY KEY, "
+            "version TEXT NOT NULL, "
+            "data TEXT NOT NULL, "
+            "synced_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS state (name TEXT PRIMARY KEY, value TEXT)"
+        )
+        self._connection.commit()
+
+    def _select(self, column: str, project_id: int) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {column} FROM mangas WHERE id = ?", (project_id,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def get(self, project_id: int) -> Optional[dict[str, Any]]:
+        data = self._select("data", project_id)
+        return None if data is None else json.loads(data)
+
+    def version(self, project_id: int) -> Optional[str]:
+        return self._select("version", project_id)
+
+    def put(self, project_id: int, version: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO mangas VALUES (?, ?, ?, ?)",
+                (
+                    project_id,
+                    version,
+                    json.dumps(data, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+            self._connection.commit()
+
+    @property
+    def high_water(self) -> list[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM state WHERE name = 'high_water'"
+            ).fetchone()
+        return [] if row is None else json.loads(row[0])
+
+    @high_water.setter
+    def high_water(self, marks: list[str]) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO state VALUES ('high_water', ?)",
+                (json.dumps(marks),),
+            )
+            self._connection.commit()
+
+    def ids(self) -> Generator[int, None, None]:
+        with self._lock:
+            rows = self._connection.execute("SELECT id FROM mangas").fetchall()
+        for row in rows:
+            yield row[0]
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM mangas").fetchone()[0]
+
+
+def _changes(
+    store: MangaStore,
+    items: list[dict[str, Any]],
+    stop: set[str],
+    changed: dict[int, tuple[str, str]],
+    newest: list[str],
+    mark: Callable[[dict[str, Any]], str],
+    size: int,
+) -> bool:
+    """
+    Collect the changed projects of an updates page.
+
+    Returns True once an update seen by the previous sync is reached.
+    """
+    for item in items:
+        version = mark(item)
+        if version in stop:
+            return True
+        if len(newest) < size:
+            newest.append(version)
+        if item["id"] not in changed and store.version(item["id"]) != version:
+            changed[item["id"]] = (item["slug"], version)
+    return False
+
+
+def _store(
+    store: MangaStore, result: SyncResult, fetched: MangaResult, version: str
+) -> None:
+    """
+    Store a fetched manga, or record in the result why it could not be.
+
+    Error statuses are reported by `Manga.many` as `httpx.HTTPStatusError`;
+    a body without a manga id is recorded as a `ValueError` rather than
+    aborting the sync.
+    """
+    error = fetched.error
+    if error is None:
+        manga = fetched.manga
+        manga_id = manga.get("id") if isinstance(manga, dict) else None
+        if manga_id is not None:
+            store.put(manga_id, version, manga)
+            result.updated.append(fetched.slug)
+            return
+        error = ValueError(f"The response for {fetched.slug} has no manga id")
+    result.errors[fetched.slug] = error
+
+
+def sync_updates(
+    api: NewMangaApi,
+    store: MangaStore,
+    size: int = 20,
+    max_pages: Optional[int] = None,
+    max_workers: int = 8,
+    mark: Callable[[dict[str, Any]], str] = update_mark,
+) -> SyncResult:
+    """
+    Refresh a local store with the mangas updated since the last sync.
+
+    The updates are read page by page, newest first, until an update seen
+    by the previous sync is reached. The details of the listed mangas whose
+    mark differs from the stored one are then fetched and stored. The marks
+    of the newest updates are recorded in the store only once every manga
+    was fetched, so a failed manga is fetched again by the next sync.
+
+    Parameters
+    ----------
+    api : NewMangaApi
+        The API used to read the updates and fetch the mangas.
+    store : MangaStore
+        The local store of manga details.
+    size : int, optional
+        The number of updates per page. Defaults to 20.
+    max_pages : Optional[int], optional
+        The maximum number of pages read, mainly for the first sync of an
+        empty store. When it stops the walk of a store that already has
+        marks, the marks are kept so the next sync reads the skipped
+        changes. Defaults to None (no limit).
+    max_workers : int, optional
+        The number of mangas fetched concurrently. Defaults to 8.
+    mark : Callable[[dict[str, Any]], str], optional
+        Identifies a listed project and its state. Defaults to
+        `update_mark`.
+
+    Returns
+    -------
+    SyncResult
+        The pages read, the mangas stored and the failures.
+
+    Raises
+    ------
+    CatalogueTooManyRequestsError
+        If the updates are still throttled once the retries are exhausted.
+        Nothing is stored in that case.
+    """
+    result = SyncResult()
+    stop = set(store.high_water)
+    changed: dict[int, tuple[str, str]] = {}
+    newest: list[str] = []
+
+    pages = api.get_updates.next_page(size=size, raw=True)
+    try:
+        for data in pages:
+            result.pages += 1
+            if _changes(store, data["items"], stop, changed, newest, mark, size):
+                result.complete = True
+                break
+            if max_pages is not None and result.pages >= max_pages:
+                break
+        else:
+            result.complete = True
+    finally:
+        pages.close()
+
+    versions = dict(changed.values())
+    slugs = [slug for slug, _ in changed.values()]
+    for fetched in api.get_manga.many(slugs, max_workers, raw=True):
+        _store(store, result, fetched, versions[fetched.slug])
+
+    # A capped walk keeps the previous marks, the next sync would otherwise
+    # stop at updates newer than the changes it skipped
+    if not result.errors and newest and (result.complete or not stop):
+        store.high_water = newest
+    return result
+
+
+async def async_sync_updates(
+    api: AsyncNewMangaApi,
+    store: MangaStore,
+    size: int = 20,
+    max_pages: Optional[int] = None,
+    concurrency: int = 8,
+    mark: Callable[[dict[str, Any]], str] = update_mark,
+) -> SyncResult:
+    """
+    Refresh a local store with the mangas updated since the last sync.
+
+    See `sync_updates`, the mangas are fetched concurrently over the
+    asynchronous client.
+
+    Parameters
+    ----------
+    api : AsyncNewMangaApi
+        The API used to read the updates and fetch the mangas.
+    store : MangaStore
+        The local store of manga details.
+    size : int, optional
+        The number of updates per page. Defaults to 20.
+    max_pages : Optional[int], optional
+        The maximum number of pages read. Defaults to None (no limit).
+    concurrency : int, optional
+        The maximum number of requests in flight. Defaults to 8.
+    mark : Callable[[dict[str, Any]], str], optional
+        Identifies a listed project and its state. Defaults to
+        `update_mark`.
+
+    Returns
+    -------
+    SyncResult
+        The pages read, the mangas stored and the failures.
+
+    Raises
+    ------
+    CatalogueTooManyRequestsError
+        If the updates are still throttled once the retries are exhausted.
+        Nothing is stored in that case.
+    """
+    result = SyncResult()
+    stop = set(store.high_water)
+    changed: dict[int, tuple[str, str]] = {}
+    newest: list[str] = []
+
+    pages = api.get_updates.next_page(size=size, raw=True)
+    try:
+        async for data in pages:
+            result.pages += 1
+            if _changes(store, data["items"], stop, changed, newest, mark, size):
+                result.complete = True
+                break
+            if max_pages is not None and result.pages >= max_pages:
+                break
+        else:
+            result.complete = True
+    finally:
+        await pages.aclose()
+
+    versions = dict(changed.values())
+    slugs = [slug for slug, _ in changed.values()]
+    async for fetched in api.get_manga.many(slugs, concurrency, raw=True):
+        _store(store, result, fetched, versions[fetched.slug])
+
+    # A capped walk keeps the previous marks, the next sync would otherwise
+    # stop at updates newer than the changes it skipped
+    if not result.errors and newest and (result.complete or not stop):
+        store.high_water = newest
+    return result
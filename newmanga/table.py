@@ -0,0 +1,493 @@
+import math
+from array import array
+from datetime import datetime
+from enum import Enum
+from itertools import compress
+from typing import Any, Callable, Generator, Iterable, Optional, Sequence, Union
+
+import httpx
+
+from .api.manga import AsyncManga, Manga
+from .formatters.manga import MangaFormatter
+from .typing.enums import MangaStatus, MangaType
+
+# Typecodes of the numeric columns. Missing integers are stored as 0 and
+# flagged in `MangaTable.missing`, missing floats as NaN.
+NUMERIC_COLUMNS = {
+    "id": "q",
+    "rating": "d",
+    "hearts": "q",
+    "views": "q",
+    "bookmarks": "q",
+    "count_chapters": "q",
+    "adult": "q",
+    "release_date": "d",
+}
+STRING_COLUMNS = ("slug", "title_ru", "title_en", "title_original", "image")
+ENUM_COLUMNS = {
+    "type": MangaType,
+    "status": MangaStatus,
+    "original_status": MangaStatus,
+}
+
+
+class StringColumn:
+    """Column of optional strings stored in a single UTF-8 buffer.
+
+    Parameters
+    ----------
+    values : Iterable[Optional[str]], optional
+        The initial values of the column.
+    """
+
+    def __init__(self, values: Iterable[Optional[str]] = ()):
+        self._buffer = bytearray()
+        self._ends = array("q")
+        self._missing = bytearray()
+        for value in values:
+            self.append(value)
+
+    def append(self, value: Optional[str]) -> None:
+        """
+        Add a value at the end of the column.
+
+        Parameters
+        ----------
+        value : Optional[str]
+            The value to add.
+        """
+        if value is not None:
+            self._buffer += value.encode()
+        self._ends.append(len(self._buffer))
+        self._missing.append(value is None)
+
+    def take(self, indices: Iterable[int]) -> "StringColumn":
+        """
+        Return a new column with the values at the given positions.
+
+        Parameters
+        ----------
+        indices : Iterable[int]
+            The positions of the values, in the order of the new column.
+
+        Returns
+        -------
+        StringColumn
+            The selected values.
+        """
+        return StringColumn(self[index] for index in indices)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if index < 0:
+            index += len(self)
+        if self._missing[index]:
+            return None
+        start = self._ends[index - 1] if index else 0
+        return self._buffer[start : self._ends[index]].decode()
+
+    def __iter__(self) -> Generator[Optional[str], None, None]:
+        return (self[index] for index in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+
+class EnumColumn:
+    """Column of optional enum members stored as one byte codes.
+
+    Parameters
+    ----------
+    enum : type[Enum]
+        The enumeration of the values.
+    values : Iterable[Optional[Enum]], optional
+        The initial values of the column.
+    """
+
+    def __init__(self, enum: type[Enum], values: Iterable[Optional[Enum]] = ()):
+        self.enum = enum
+        self.members = list(enum)
+        self._codes = {member: code for code, member in enumerate(self.members)}
+        self.codes = array("b")
+        for value in values:
+            self.append(value)
+
+    def append(self, value: Optional[Enum]) -> None:
+        """
+        Add a value at the end of the column.
+
+        Parameters
+        ----------
+        value : Optional[Enum]
+            The value to add.
+        """
+        self.codes.append(-1 if value is None else self._codes[value])
+
+    def take(self, indices: Iterable[int]) -> "EnumColumn":
+        """
+        Return a new column with the values at the given positions.
+
+        Parameters
+        ----------
+        indices : Iterable[int]
+            The positions of the values, in the order of the new column.
+
+        Returns
+        -------
+        EnumColumn
+            The selected values.
+        """
+        column = EnumColumn(self.enum)
+        column.codes = array("b", (self.codes[index] for index in indices))
+        return column
+
+    def __getitem__(self, index: int) -> Optional[Enum]:
+        code = self.codes[index]
+        return None if code < 0 else self.members[code]
+
+    def __iter__(self) -> Generator[Optional[Enum], None, None]:
+        return (None if code < 0 else self.members[code] for code in self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+Column = Union[array, StringColumn, EnumColumn]
+
+
+class MangaTable:
+    """Columnar storage of the scalar fields of many mangas.
+
+    Each field is kept in its own column: numbers in typed arrays, strings
+    in a single buffer and enums as one byte codes. Tens of thousands of
+    titles take a fraction of the memory of `Manga` objects and can be
+    filtered and sorted without building any of them.
+
+    The columns are the keys of `NUMERIC_COLUMNS`, `STRING_COLUMNS` and
+    `ENUM_COLUMNS`; list fields such as genres or branches are not stored.
+    Release dates are stored as POSIX timestamps. Integer columns have a
+    mask in `missing`, one byte per row, telling apart missing values from
+    zeros.
+
+    Parameters
+    ----------
+    client : Optional[httpx.Client | httpx.AsyncClient], optional
+        The client of the mangas built by `manga`. Defaults to None, which
+        uses the client of the first added manga.
+    """
+
+    def __init__(self, client: Optional[httpx.Client | httpx.AsyncClient] = None):
+        self.client = client
+        self.columns: dict[str, Column] = {
+            **{name: array(code) for name, code in NUMERIC_COLUMNS.items()},
+            **{name: StringColumn() for name in STRING_COLUMNS},
+            **{name: EnumColumn(enum) for name, enum in ENUM_COLUMNS.items()},
+        }
+        self.missing: dict[str, bytearray] = {
+            name: bytearray() for name, code in NUMERIC_COLUMNS.items() if code == "q"
+        }
+
+    @classmethod
+    def from_pages(
+        cls,
+        pages: Iterable[Any],
+        client: Optional[httpx.Client | httpx.AsyncClient] = None,
+    ) -> "MangaTable":
+        """
+        Build a table from the pages of a `next_page` generator.
+
+        Listing pages hold lazy mangas, so only the stored fields are ever
+        converted. Pages yielded with `raw=True` are read without building
+        any manga, and pages yielded with `fields=...` fill the projected
+        columns only.
+
+        Parameters
+        ----------
+        pages : Iterable[Any]
+            The responses yielded by `next_page`, e.g. of the catalogue,
+            popular or updates endpoint, parsed or raw.
+        client : Optional[httpx.Client | httpx.AsyncClient], optional
+            The client of the mangas built by `manga`. Defaults to None.
+
+        Returns
+        -------
+        MangaTable
+            The table of every manga of the pages.
+        """
+        table = cls(client)
+        for page in pages:
+            if isinstance(page, (dict, list)):
+                table.extend(_raw_rows(page))
+                continue
+            for manga in page.mangas:
+                if isinstance(manga, dict):
+                    table._append(manga.get)
+                else:
+                    table.append(manga)
+        return table
+
+    def append(self, manga: Union[Manga, dict[str, Any]]) -> None:
+        """
+        Add a manga at the end of the table.
+
+        Parameters
+        ----------
+        manga : Union[Manga, dict[str, Any]]
+            The manga, or its raw data as returned by the API.
+        """
+        if isinstance(manga, dict):
+            self._append(MangaFormatter(manga, lazy=True).load)
+        else:
+            if self.client is None:
+                self.client = manga._client
+            self._append(manga.__getattribute__)
+
+    def _append(self, get: Callable[[str], Any]) -> None:
+        """
+        Add a row whose fields are read with the given function.
+        """
+        for name, code in NUMERIC_COLUMNS.items():
+            value = get(name)
+            if name in self.missing:
+                self.missing[name].append(value is None)
+            if value is None:
+                value = math.nan if code == "d" else 0
+            elif isinstance(value, datetime):
+                value = value.timestamp()
+            self.columns[name].append(value)
+        for name in STRING_COLUMNS:
+            self.columns[name].append(get(name))
+        for name in ENUM_COLUMNS:
+            self.columns[name].append(get(name))
+
+    def extend(self, mangas: Iterable[Union[Manga, dict[str, Any]]]) -> None:
+        """
+        Add mangas at the end of the table.
+
+        Parameters
+        ----------
+        mangas : Iterable[Union[Manga, dict[str, Any]]]
+            The mangas, or their raw data as returned by the API.
+        """
+        for manga in mangas:
+            self.append(manga)
+
+    def take(self, indices: Iterable[int]) -> "MangaTable":
+        """
+        Return a new table with the rows at the given positions.
+
+        Parameters
+        ----------
+        indices : Iterable[int]
+            The positions of the rows, in the order of the new table.
+
+        Returns
+        -------
+        MangaTable
+            The selected rows.
+        """
+        indices = list(indices)
+        table = MangaTable(self.client)
+        for name, column in self.columns.items():
+            if isinstance(column, array):
+                table.columns[name] = array(
+                    column.typecode, (column[index] for index in indices)
+                )
+            else:
+                table.columns[name] = column.take(indices)
+        for name, mask in self.missing.items():
+            table.missing[name] = bytearray(mask[index] for index in indices)
+        return table
+
+    def filter(self, mask: Iterable[Any]) -> "MangaTable":
+        """
+        Return a new table with the rows where the mask is true.
+
+        Parameters
+        ----------
+        mask : Iterable[Any]
+            One truth value per row, e.g. a NumPy boolean array computed
+            from `to_numpy()`.
+
+        Returns
+        -------
+        MangaTable
+            The selected rows.
+        """
+        return self.take(compress(range(len(self)), mask))
+
+    def where(self, name: str, predicate: Callable[[Any], bool]) -> "MangaTable":
+        """
+        Return a new table with the rows whose value matches a predicate.
+
+        Rows whose value is missing are left out without calling the
+        predicate.
+
+        Parameters
+        ----------
+        name : str
+            The name of the column.
+        predicate : Callable[[Any], bool]
+            Tells whether a value of the column is kept.
+
+        Returns
+        -------
+        MangaTable
+            The selected rows.
+        """
+        return self.filter(
+            value is not None and predicate(value) for value in self._values(name)
+        )
+
+    def sort(self, name: str, reverse: bool = False) -> "MangaTable":
+        """
+        Return a new table sorted by a column.
+
+        Missing values are placed last in both orders.
+
+        Parameters
+        ----------
+        name : str
+            The name of the column.
+        reverse : bool, optional
+            If true, the largest values come first. Defaults to False.
+
+        Returns
+        -------
+        MangaTable
+            The sorted rows.
+        """
+        values: Sequence[Any] = self._values(name)
+        if isinstance(self.columns[name], EnumColumn):
+            values = [None if member is None else member.value for member in values]
+
+        present, missing = [], []
+        for index, value in enumerate(values):
+            if value is None:
+                missing.append(index)
+            else:
+                present.append(index)
+        present.sort(key=values.__getitem__, reverse=reverse)
+        return self.take(present + missing)
+
+    def row(self, index: int) -> dict[str, Any]:
+        """
+        Return the stored fields of a row.
+
+        Parameters
+        ----------
+        index : int
+            The position of the row.
+
+        Returns
+        -------
+        dict[str, Any]
+            The value of every column, with None for missing numbers.
+        """
+        row = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            if name in self.missing and self.missing[name][index]:
+                value = None
+            elif isinstance(column, array) and column.typecode == "d":
+                if math.isnan(value):
+                    value = None
+                elif name == "release_date":
+                    value = datetime.fromtimestamp(value)
+            row[name] = value
+        return row
+
+    def manga(self, index: int) -> Manga:
+        """
+        Build the manga of a row.
+
+        Only the stored fields are set; fetch the manga by its slug for the
+        full details.
+
+        Parameters
+        ----------
+        index : int
+            The position of the row.
+
+        Returns
+        -------
+        Manga
+            The manga, an `AsyncManga` if the client is asynchronous.
+        """
+        cls = AsyncManga if isinstance(self.client, httpx.AsyncClient) else Manga
+        return cls(_client=self.client, **self.row(index))
+
+    def mangas(self) -> Generator[Manga, None, None]:
+        """
+        Build the mangas of the table one at a time.
+
+        Yields
+        ------
+        Manga
+            The manga of every row, in order.
+        """
+        for index in range(len(self)):
+            yield self.manga(index)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Return the columns as NumPy arrays.
+
+        Numeric columns are converted without copying the values one by one,
+        missing integers being 0 as stored (see `missing`); string and enum
+        columns become object arrays.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            The arrays, keyed by column name.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        """
+        try:
+            import numpy
+        except ImportError as error:
+            raise ImportError(
+                "MangaTable.to_numpy requires NumPy: pip install numpy"
+            ) from error
+
+        arrays = {}
+        for name, column in self.columns.items():
+            if isinstance(column, array):
+                arrays[name] = numpy.frombuffer(column, dtype=column.typecode).copy()
+            else:
+                arrays[name] = numpy.array(list(column), dtype=object)
+        return arrays
+
+    def _values(self, name: str) -> list[Any]:
+        """
+        Return the values of a column, with None for missing numbers.
+        """
+        column = self.columns[name]
+        if name in self.missing:
+            return [
+                None if missing else value
+                for value, missing in zip(column, self.missing[name])
+            ]
+        if isinstance(column, array) and column.typecode == "d":
+            return [None if math.isnan(value) else value for value in column]
+        return list(column)
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+
+def _raw_rows(page: Union[dict[str, Any], list[Any]]) -> list[dict[str, Any]]:
+    """
+    Return the raw manga data of a page decoded in raw mode.
+    """
+    if isinstance(page, list):
+        return page
+    if "result" in page:
+        return [hit["document"] for hit in page["result"]["hits"]]
+    return page["items"]
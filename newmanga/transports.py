@@ -0,0 +1,405 @@
+import asyncio
+import dataclasses
+import hashlib
+import re
+import time
+import httpx
+from typing import Optional
+
+from . import constants
+from .cache import CacheBackend, CacheEntry, CacheHandle, ParsedCache
+from .ratelimit import RateLimiter, RetryPolicy, parse_retry_after
+
+DEFAULT_TTL = {
+    "catalogue": 60.0,
+    "popular": 600.0,
+    "read_now": 600.0,
+    "tags": 3600.0,
+    "comments": 60.0,
+    "similar": 600.0,
+    "chapters": 60.0,
+    "manga": 600.0,
+}
+
+_ENDPOINT_PATTERNS = [
+    (name, re.compile(re.sub(r"\\{\w+\\}", "[^/]+", re.escape(template))))
+    for name, template in constants.endpoints.items()
+]
+_UNCACHED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def endpoint_name(url: httpx.URL) -> Optional[str]:
+    """
+    Find the name of the API endpoint a URL belongs to.
+
+    Parameters
+    ----------
+    url : httpx.URL
+        The URL of the request.
+
+    Returns
+    -------
+    Optional[str]
+        The key of the endpoint in `constants.endpoints`, or None if the URL
+        does not belong to a known endpoint.
+    """
+    address = f"{url.scheme}://{url.host}{url.path}"
+    for name, pattern in _ENDPOINT_PATTERNS:
+        if pattern.fullmatch(address):
+            return name
+    return None
+
+
+def cache_key(request: httpx.Request) -> str:
+    """
+    Build the cache key of a request from its method, URL and body.
+
+    Parameters
+    ----------
+    request : httpx.Request
+        The request to identify.
+
+    Returns
+    -------
+    str
+        A key identifying requests that return the same response.
+    """
+    key = f"{request.method} {request.url}"
+    if request.content:
+        key += " " + hashlib.sha256(request.content).hexdigest()
+    return key
+
+
+def _to_entry(response: httpx.Response, ttl: float) -> CacheEntry:
+    return CacheEntry(
+        status_code=response.status_code,
+        headers=[
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _UNCACHED_HEADERS
+        ],
+        content=response.content,
+        expires_at=time.time() + ttl,
+    )
+
+
+def _revalidated(entry: CacheEntry, response: httpx.Response, ttl: float) -> CacheEntry:
+    validators = {
+        name: response.headers[name]
+        for name in ("etag", "last-modified")
+        if name in response.headers
+    }
+    headers = [
+        (name, value) for name, value in entry.headers if name.lower() not in validators
+    ]
+    return dataclasses.replace(
+        entry,
+        headers=headers + list(validators.items()),
+        expires_at=time.time() + ttl,
+    )
+
+
+def _add_validators(request: httpx.Request, entry: CacheEntry) -> None:
+    if entry.etag:
+        request.headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        request.headers["If-Modified-Since"] = entry.last_modified
+
+
+def _to_response(
+    entry: CacheEntry, request: httpx.Request, handle: CacheHandle
+) -> httpx.Response:
+    return httpx.Response(
+        entry.status_code,
+        headers=entry.headers,
+        content=entry.content,
+        request=request,
+        extensions={"newmanga_cache": handle},
+    )
+
+
+def _retry_error(policy: RetryPolicy, attempt: int) -> bool:
+    return policy.retry_on_errors and attempt < policy.max_retries
+
+
+def _retry_delay(
+    policy: RetryPolicy,
+    limiter: Optional[RateLimiter],
+    attempt: int,
+    response: httpx.Response,
+) -> Optional[float]:
+    if response.status_code not in policy.statuses:
+        if limiter is not None:
+            limiter.on_success()
+        return None
+
+    retry_after = parse_retry_after(response.headers.get("retry-after"))
+    if retry_after is not None:
+        retry_after = min(retry_after, policy.max_backoff)
+    if response.status_code == 429 and limiter is not None:
+        limiter.on_throttle(retry_after)
+    if attempt >= policy.max_retries:
+        return None
+    return policy.delay(attempt, retry_after)
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Transport serving repeated requests from a response cache.
+
+    Only successful responses of endpoints with a positive TTL are cached.
+    Stale entries carrying an `ETag` or `Last-Modified` validator are
+    refreshed with a conditional request; on `304 Not Modified` the stored
+    body, and the objects already built from it, are reused.
+
+    Parameters
+    ----------
+    transport : httpx.BaseTransport
+        The transport performing the actual requests.
+    cache : CacheBackend
+        The storage of the cached responses.
+    ttl : Optional[dict[str, float]], optional
+        Seconds a response stays fresh, keyed by endpoint name (see
+        `constants.endpoints`). Defaults to `DEFAULT_TTL`.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        cache: CacheBackend,
+        ttl: Optional[dict[str, float]] = None,
+    ):
+        self.transport = transport
+        self.cache = cache
+        self.ttl = DEFAULT_TTL if ttl is None else ttl
+        self.parsed = ParsedCache()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        ttl = self.ttl.get(endpoint_name(request.url) or "", 0)
+        if ttl <= 0:
+            return self.transport.handle_request(request)
+
+        key = cache_key(request)
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            self.cache.stats.add("hits")
+            request.extensions["newmanga_cache_hit"] = True
+            return self._respond(key, entry, request)
+
+        self.cache.stats.add("misses")
+        if entry is not None:
+            _add_validators(request, entry)
+        response = self.transport.handle_request(request)
+        response.read()
+        if response.status_code == 304 and entry is not None:
+            self.cache.stats.add("revalidations")
+            entry = _revalidated(entry, response, ttl)
+        elif response.status_code == 200:
+            entry = _to_entry(response, ttl)
+        else:
+            return response
+
+        self.cache.set(key, entry)
+        return self._respond(key, entry, request)
+
+    def _respond(
+        self, key: str, entry: CacheEntry, request: httpx.Request
+    ) -> httpx.Response:
+        return _to_response(
+            entry, request, CacheHandle(self.parsed, key, entry.version)
+        )
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Asynchronous transport serving repeated requests from a response cache.
+
+    Only successful responses of endpoints with a positive TTL are cached.
+    Stale entries carrying an `ETag` or `Last-Modified` validator are
+    refreshed with a conditional request; on `304 Not Modified` the stored
+    body, and the objects already built from it, are reused.
+
+    Parameters
+    ----------
+    transport : httpx.AsyncBaseTransport
+        The transport performing the actual requests.
+    cache : CacheBackend
+        The storage of the cached responses.
+    ttl : Optional[dict[str, float]], optional
+        Seconds a response stays fresh, keyed by endpoint name (see
+        `constants.endpoints`). Defaults to `DEFAULT_TTL`.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        cache: CacheBackend,
+        ttl: Optional[dict[str, float]] = None,
+    ):
+        self.transport = transport
+        self.cache = cache
+        self.ttl = DEFAULT_TTL if ttl is None else ttl
+        self.parsed = ParsedCache()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        ttl = self.ttl.get(endpoint_name(request.url) or "", 0)
+        if ttl <= 0:
+            return await self.transport.handle_async_request(request)
+
+        key = cache_key(request)
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            self.cache.stats.add("hits")
+            request.extensions["newmanga_cache_hit"] = True
+            return self._respond(key, entry, request)
+
+        self.cache.stats.add("misses")
+        if entry is not None:
+            _add_validators(request, entry)
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        if response.status_code == 304 and entry is not None:
+            self.cache.stats.add("revalidations")
+            entry = _revalidated(entry, response, ttl)
+        elif response.status_code == 200:
+            entry = _to_entry(response, ttl)
+        else:
+            return response
+
+        self.cache.set(key, entry)
+        return self._respond(key, entry, request)
+
+    def _respond(
+        self, key: str, entry: CacheEntry, request: httpx.Request
+    ) -> httpx.Response:
+        return _to_response(
+            entry, request, CacheHandle(self.parsed, key, entry.version)
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Transport pacing requests and retrying the rejected ones.
+
+    Responses with a status listed in the retry policy (429 and 502 by
+    default) are retried after the `Retry-After` delay of the server or a
+    jittered exponential backoff. Once the retries are exhausted the last
+    response is returned as is. Bodies are read before returning, so a
+    connection lost in the middle of a body is retried like any other
+    transport error.
+
+    Parameters
+    ----------
+    transport : httpx.BaseTransport
+        The transport performing the actual requests.
+    policy : Optional[RetryPolicy], optional
+        When and how long to wait before retrying. Defaults to `RetryPolicy()`.
+    limiter : Optional[RateLimiter], optional
+        The rate limiter every request waits for. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.transport = transport
+        self.policy = RetryPolicy() if policy is None else policy
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                time.sleep(self.limiter.reserve())
+
+            try:
+                response = self.transport.handle_request(request)
+                response.read()
+            except httpx.TransportError:
+                if not _retry_error(self.policy, attempt):
+                    raise
+                time.sleep(self.policy.delay(attempt))
+                attempt += 1
+                continue
+
+            delay = _retry_delay(self.policy, self.limiter, attempt, response)
+            if delay is None:
+                request.extensions["newmanga_retries"] = attempt
+                request.extensions[
+                    "newmanga_wire_bytes"
+                ] = response.num_bytes_downloaded
+                return response
+
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Asynchronous transport pacing requests and retrying the rejected ones.
+
+    Responses with a status listed in the retry policy (429 and 502 by
+    default) are retried after the `Retry-After` delay of the server or a
+    jittered exponential backoff. Once the retries are exhausted the last
+    response is returned as is. Bodies are read before returning, so a
+    connection lost in the middle of a body is retried like any other
+    transport error.
+
+    Parameters
+    ----------
+    transport : httpx.AsyncBaseTransport
+        The transport performing the actual requests.
+    policy : Optional[RetryPolicy], optional
+        When and how long to wait before retrying. Defaults to `RetryPolicy()`.
+    limiter : Optional[RateLimiter], optional
+        The rate limiter every request waits for. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.transport = transport
+        self.policy = RetryPolicy() if policy is None else policy
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                await asyncio.sleep(self.limiter.reserve())
+
+            try:
+                response = await self.transport.handle_async_request(request)
+                await response.aread()
+            except httpx.TransportError:
+                if not _retry_error(self.policy, attempt):
+                    raise
+                await asyncio.sleep(self.policy.delay(attempt))
+                attempt += 1
+                continue
+
+            delay = _retry_delay(self.policy, self.limiter, attempt, response)
+            if delay is None:
+                request.extensions["newmanga_retries"] = attempt
+                request.extensions[
+                    "newmanga_wire_bytes"
+                ] = response.num_bytes_downloaded
+                return response
+
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
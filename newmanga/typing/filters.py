@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Literal, Optional, Sequence, Union
+
+from .enums import MangaStatus, MangaType
+from .types import Genre, Tag
+
+SortKind = Literal[
+    "RATING", "VIEWS", "HEARTS", "BOOKMARKS", "COUNT_CHAPTERS", "RELEASE_DATE"
+]
+SortDirection = Literal["ASC", "DESC"]
+AdultRating = Literal["ADULT_13", "ADULT_16", "ADULT_18"]
+
+
+def _value(value: Any, by_title: bool = False) -> Any:
+    """
+    Convert a filter value to the form expected by the catalogue API.
+
+    Genres and tags are sent by id, or by Russian title when the id is
+    unknown, e.g. for those read from catalogue documents; `by_title`
+    prefers the title, which the local index matches. Enum members are sent
+    by name.
+
+    Raises
+    ------
+    ValueError
+        If a genre or tag has neither an id nor a Russian title.
+    """
+    if isinstance(value, (Genre, Tag)):
+        preferred, fallback = value.id, value.title_ru
+        if by_title:
+            preferred, fallback = fallback, preferred
+        if preferred is not None:
+            return preferred
+        if fallback is not None:
+            return fallback
+        raise ValueError(f"{value!r} has neither an id nor a title to filter by")
+    if isinstance(value, Enum):
+        return value.name
+    return value
+
+
+@dataclass(slots=True)
+class CatalogueFilter:
+    """Filters applied by the catalogue API to the search results.
+
+    Every field maps to the `filter` section of the catalogue query; empty
+    sequences and None values leave the results unfiltered.
+
+    Attributes
+    ----------
+    genres : Sequence[Union[Genre, int, str]]
+        The genres every manga must have.
+    excluded_genres : Sequence[Union[Genre, int, str]]
+        The genres no manga may have.
+    tags : Sequence[Union[Tag, int, str]]
+        The tags every manga must have.
+    excluded_tags : Sequence[Union[Tag, int, str]]
+        The tags no manga may have.
+    types : Sequence[Union[MangaType, str]]
+        The allowed types.
+    translation_status : Sequence[Union[MangaStatus, str]]
+        The allowed statuses of the translation.
+    original_status : Sequence[Union[MangaStatus, str]]
+        The allowed statuses of the original work.
+    min_year : Optional[int]
+        The earliest release year.
+    max_year : Optional[int]
+        The latest release year.
+    adult : Sequence[AdultRating]
+        The allowed age ratings. Defaults to "ADULT_13" and "ADULT_16", as
+        on the website.
+    require_chapters : bool
+        Whether mangas without chapters are left out. Defaults to True.
+    hidden_projects : Sequence[int]
+        The ids of the mangas left out.
+    """
+
+    genres: Sequence[Union[Genre, int, str]] = ()
+    excluded_genres: Sequence[Union[Genre, int, str]] = ()
+    tags: Sequence[Union[Tag, int, str]] = ()
+    excluded_tags: Sequence[Union[Tag, int, str]] = ()
+    types: Sequence[Union[MangaType, str]] = ()
+    translation_status: Sequence[Union[MangaStatus, str]] = ()
+    original_status: Sequence[Union[MangaStatus, str]] = ()
+    min_year: Optional[int] = None
+    max_year: Optional[int] = None
+    adult: Sequence[AdultRating] = ("ADULT_13", "ADULT_16")
+    require_chapters: bool = True
+    hidden_projects: Sequence[int] = ()
+
+    def to_json(self, by_title: bool = False) -> dict[str, Any]:
+        """
+        Build the `filter` section of a catalogue query.
+
+        Parameters
+        ----------
+        by_title : bool, optional
+            If true, genres and tags are given by their Russian title when
+            known instead of their id. Defaults to False.
+
+        Returns
+        -------
+        dict[str, Any]
+            A new dictionary shaped like `queries_data.catalogue["filter"]`.
+
+        Raises
+        ------
+        ValueError
+            If a genre or tag has neither an id nor a Russian title.
+        """
+
+        def values(items: Sequence[Any]) -> list[Any]:
+            return [_value(item, by_title) for item in items]
+
+        return {
+            "hidden_projects": list(self.hidden_projects),
+            "genres": {
+                "excluded": values(self.excluded_genres),
+                "included": values(self.genres),
+            },
+            "tags": {
+                "excluded": values(self.excluded_tags),
+                "included": values(self.tags),
+            },
+            "type": {"allowed": values(self.types)},
+            "translation_status": {"allowed": values(self.translation_status)},
+            "released_year": {"min": self.min_year, "max": self.max_year},
+            "require_chapters": self.require_chapters,
+            "original_status": {"allowed": values(self.original_status)},
+            "adult": {"allowed": list(self.adult)},
+        }
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from ..api.manga import Manga
 from .types import Comment, Chapter, Tag
 
 
-@dataclass()
+@dataclass(slots=True)
 class CatalogueResponse:
     """Response object for a catalogue query.
 
@@ -26,7 +27,7 @@ class CatalogueResponse:
     total: int
 
 
-@dataclass()
+@dataclass(slots=True)
 class PopularResponse:
     """
     Represents a response containing popular manga information.
@@ -55,7 +56,7 @@ class PopularResponse:
     page: int
 
 
-@dataclass()
+@dataclass(slots=True)
 class ReadNowResponse:
     """
     Represents a response containing 'Read Now' manga information.
@@ -79,7 +80,7 @@ class ReadNowResponse:
     total: int
 
 
-@dataclass()
+@dataclass(slots=True)
 class UpdatesResponse:
     """
     Represents a response containing manga updates information.
@@ -108,7 +109,7 @@ class UpdatesResponse:
     page: int
 
 
-@dataclass()
+@dataclass(slots=True)
 class TagsResponse:
     """
     Represents a response containing tags information.
@@ -132,7 +133,7 @@ class TagsResponse:
     total: int
 
 
-@dataclass()
+@dataclass(slots=True)
 class CommentsResponse:
     """
     Data class representing a response containing a list of comments.
@@ -146,7 +147,7 @@ class CommentsResponse:
     comments: list[Comment]
 
 
-@dataclass()
+@dataclass(slots=True)
 class SimilarResponse:
     """
     Data class representing a response containing a list of similar mangas.
@@ -160,7 +161,7 @@ class SimilarResponse:
     mangas: list[Manga]
 
 
-@dataclass()
+@dataclass(slots=True)
 class ChaptersResponse:
     """
     Data class representing a response containing a list of chapters and the total count.
@@ -175,3 +176,24 @@ class ChaptersResponse:
 
     chapters: list[Chapter]
     count: int
+
+
+@dataclass(slots=True)
+class MangaResult:
+    """
+    Data class representing the outcome of fetching one manga in a batch.
+
+    Attributes
+    ----------
+    slug : str
+        The slug that was requested.
+    manga : Optional[Manga]
+        The fetched manga (its decoded body when fetched in raw mode), or
+        None if the request failed.
+    error : Optional[Exception]
+        The exception raised while fetching the manga, if any.
+    """
+
+    slug: str
+    manga: Optional[Manga] = None
+    error: Optional[Exception] = None
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, List, Optional
 
 
-@dataclass()
+@dataclass(slots=True)
 class Genre:
     """Represents a genre associated with a manga.
 
@@ -26,7 +26,7 @@ class Genre:
     title_original: Optional[str] = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class Tag:
     """Represents a tag associated with a manga.
 
@@ -48,7 +48,7 @@ class Tag:
     title_original: Optional[str] = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class User:
     """Represents a user who can be part of a team or a translator.
 
@@ -85,7 +85,7 @@ class User:
     image_url: str
 
 
-@dataclass()
+@dataclass(slots=True)
 class Member:
     """Represents a member of a team.
 
@@ -104,7 +104,7 @@ class Member:
     statuses: List[str]
 
 
-@dataclass()
+@dataclass(slots=True)
 class Team:
     """Represents a team of translators.
 
@@ -126,7 +126,7 @@ class Team:
     members: List[Member]
 
 
-@dataclass()
+@dataclass(slots=True)
 class Translator:
     """Represents a translator.
 
@@ -154,7 +154,7 @@ class Translator:
     is_verified: bool
 
 
-@dataclass()
+@dataclass(slots=True)
 class Branch:
     """Represents a branch of a manga, including translator details.
 
@@ -182,7 +182,7 @@ class Branch:
     subscription: Any
 
 
-@dataclass()
+@dataclass(slots=True)
 class Author:
     """Represents an author of a manga.
 
@@ -204,7 +204,7 @@ class Author:
     image_url: str
 
 
-@dataclass()
+@dataclass(slots=True)
 class Artist:
     """Represents an artist of a manga.
 
@@ -226,7 +226,7 @@ class Artist:
     image_url: str
 
 
-@dataclass()
+@dataclass(slots=True)
 class Comment:
     """
     Data class representing a comment on a manga.
@@ -273,7 +273,7 @@ class Comment:
     rating: int
 
 
-@dataclass()
+@dataclass(slots=True)
 class Chapter:
     """
     Data class representing a chapter of a manga.